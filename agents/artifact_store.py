@@ -0,0 +1,167 @@
+import os
+import json
+import hashlib
+import threading
+
+# 프로젝트 루트 기준 보고서 파일 저장소 (파일명이 입력 해시라 내용이 바뀌면 새 파일, 오래된 것부터 용량 정리)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ARTIFACT_DIR = os.path.join(ROOT, ".artifacts")
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+def artifact_key(kind, version, inputs):
+    """(보고서 종류, 양식 버전, 입력값) 해시 - 팩트/AI 문구/양식 중 하나라도 바뀌면 다른 키"""
+    payload = json.dumps([kind, version, inputs], sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+class ArtifactStore:
+    """
+    생성된 보고서 파일(PDF/MD 등)을 입력 해시로 디스크에 보관하는 저장소.
+    Streamlit 재실행(채팅 입력, 위젯 클릭)마다 파일을 다시 만들지 않고, 입력이 바뀐 경우에만 build() 를 호출합니다.
+    총 용량이 max_bytes 를 넘으면 가장 오래 쓰이지 않은 파일부터 삭제합니다 (조회 시 수정시각 갱신 = LRU).
+    여러 프로세스가 같은 폴더를 써도 파일은 임시 파일 -> os.replace 로 기록되어 반쯤 쓰인 파일은 읽히지 않습니다.
+    """
+
+    def __init__(self, root=ARTIFACT_DIR, max_bytes=DEFAULT_MAX_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.stats = {"hits": 0, "misses": 0, "evicted": 0}
+        self._total = None  # 폴더 총 용량 (처음 저장할 때 1회 스캔)
+        self._lock = threading.Lock()
+
+    def path(self, kind, version, inputs, ext="bin"):
+        return os.path.join(self.root, f"{kind}-{artifact_key(kind, version, inputs)}.{ext}")
+
+    def get(self, kind, version, inputs, ext="bin"):
+        """저장된 파일 내용(bytes), 없으면 None (생성하지 않음)"""
+        path = self.path(kind, version, inputs, ext)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        try:
+            os.utime(path)  # 최근 사용 표시 (용량 정리 시 뒤로)
+        except OSError:
+            pass  # 그 사이 다른 프로세스가 정리한 경우 - 읽은 내용은 그대로 제공
+        with self._lock:
+            self.stats["hits"] += 1
+        return data
+
+    def fetch(self, kind, version, inputs, build, ext="bin"):
+        """
+        저장된 파일 내용(bytes) 반환. 없으면 build() -> bytes 로 만들어 저장 후 반환
+        version: 양식(템플릿/생성 코드)을 바꾸면 올려서 기존 파일을 무효화
+        """
+        data = self.get(kind, version, inputs, ext)
+        if data is not None:
+            return data
+
+        path = self.path(kind, version, inputs, ext)
+        data = build()
+        with self._lock:
+            self.stats["misses"] += 1
+        try:
+            self._save(path, data)
+        except OSError as e:
+            print(f"⚠️ [Artifact] 보고서 저장 실패 -> 이번만 메모리에서 제공 ({e})")
+        return data
+
+    def find(self, kind, version, inputs, ext="bin"):
+        """저장된 파일 경로, 없으면 None (큰 묶음 파일을 메모리에 올리지 않고 열어서 제공할 때)"""
+        path = self.path(kind, version, inputs, ext)
+        try:
+            os.utime(path)
+        except OSError:
+            return None
+        with self._lock:
+            self.stats["hits"] += 1
+        return path
+
+    def fetch_path(self, kind, version, inputs, write, ext="bin"):
+        """
+        저장된 파일 경로 반환. 없으면 write(임시 경로) 로 파일에 직접 기록한 뒤 저장 (ZIP/통합 PDF 처럼
+        스트리밍으로 만드는 파일용 - 다른 보고서와 같은 용량 한도로 정리됨)
+        """
+        path = self.find(kind, version, inputs, ext)
+        if path is not None:
+            return path
+
+        path = self.path(kind, version, inputs, ext)
+        os.makedirs(self.root, exist_ok=True)
+        tmp = self._tmp_path(path)
+        try:
+            write(tmp)
+            size = os.path.getsize(tmp)
+            os.replace(tmp, path)
+        except BaseException:
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            raise
+        with self._lock:
+            self.stats["misses"] += 1
+        self._added(path, size)
+        return path
+
+    @staticmethod
+    def _tmp_path(path):
+        return f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+
+    def _save(self, path, data):
+        os.makedirs(self.root, exist_ok=True)
+        tmp = self._tmp_path(path)
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+        self._added(path, len(data))
+
+    def _added(self, path, size):
+        with self._lock:
+            if self._total is None:
+                self._total = self._scan_total()
+            else:
+                self._total += size
+            if self._total > self.max_bytes:
+                self._evict(keep=path)
+
+    def _entries(self):
+        entries = []
+        if not os.path.isdir(self.root):
+            return entries
+        with os.scandir(self.root) as it:
+            for entry in it:
+                if entry.is_file() and not entry.name.endswith(".tmp"):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+        return entries
+
+    def _scan_total(self):
+        return sum(size for _, size, _ in self._entries())
+
+    def _evict(self, keep=None):
+        # 다른 프로세스가 쓴 파일까지 포함해 실제 폴더 기준으로 정리 (오래된 것부터, 한도의 90% 까지)
+        # 방금 저장한 파일(keep)은 호출자가 곧 열어야 하므로 남김
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * 0.9
+        for _, size, path in entries:
+            if total <= target:
+                break
+            if path == keep:
+                continue
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            self.stats["evicted"] += 1
+        self._total = total
+
+    def report(self):
+        with self._lock:
+            return dict(self.stats, bytes=self._total if self._total is not None else self._scan_total())
+
+
+# 프로세스 공용 저장소 (Streamlit 재실행 시에도 재사용)
+ARTIFACTS = ArtifactStore()
@@ -1,24 +1,31 @@
 import os
 import sys
+import asyncio
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain.prompts import PromptTemplate
 from dotenv import load_dotenv
+from agents.model_router import ROUTER
+from agents.llm_call import acall_with_retry, LLMCallError
 
 # 환경변수 로드
 load_dotenv()
 
 class JisangBrain:
     def __init__(self):
-        api_key = os.getenv("GOOGLE_API_KEY")
-        if not api_key:
+        self.api_key = os.getenv("GOOGLE_API_KEY")
+        self.router = ROUTER
+        self.llms = {}  # 모델별 클라이언트 (라우팅된 모델만 생성)
+        if not self.api_key:
             print("⚠️ [경고] API Key가 없습니다. .env 파일을 확인하세요.")
-            self.llm = None
-        else:
-            self.llm = ChatGoogleGenerativeAI(model="gemini-1.5-pro", temperature=0.2, google_api_key=api_key)
 
-    def analyze(self, address, doc_data, market_data):
-        if not self.llm:
-            return "❌ API Key 오류로 분석 불가"
+    def get_llm(self, model):
+        if model not in self.llms:
+            self.llms[model] = ChatGoogleGenerativeAI(model=model, temperature=0.2, google_api_key=self.api_key)
+        return self.llms[model]
+
+    def _prepare(self, address, doc_data, market_data):
+        # 등기 난이도에 따라 Flash / Pro 선택
+        model = self.router.route(self.router.score_text(doc_data))
         
         prompt = PromptTemplate(
             input_variables=["address", "doc_data", "market_data"],
@@ -38,5 +45,40 @@ class JisangBrain:
             4. 📝 최종 결론: (매수 추천/보류/위험)
             """
         )
-        chain = prompt | self.llm
-        return chain.invoke({"address": address, "doc_data": doc_data, "market_data": market_data}).content
+        inputs = {"address": address, "doc_data": doc_data, "market_data": market_data}
+        return model, prompt | self.get_llm(model), prompt.format(**inputs), inputs
+
+    def analyze(self, address, doc_data, market_data):
+        if not self.api_key:
+            return "❌ API Key 오류로 분석 불가"
+
+        model, chain, prompt_text, inputs = self._prepare(address, doc_data, market_data)
+        return self.router.track(model, prompt_text, lambda: chain.invoke(inputs).content)
+
+    async def aanalyze(self, address, doc_data, market_data):
+        """비동기 분석 (ainvoke) - 이벤트 루프를 막지 않아 여러 건을 동시에 처리 가능"""
+        if not self.api_key:
+            return "❌ API Key 오류로 분석 불가"
+
+        model, chain, prompt_text, inputs = self._prepare(address, doc_data, market_data)
+
+        async def invoke():
+            return (await chain.ainvoke(inputs)).content
+
+        return await self.router.atrack(model, prompt_text, lambda: acall_with_retry(invoke, deadline=60.0))
+
+    async def analyze_many(self, targets, concurrency=32):
+        """
+        targets: [(address, doc_data, market_data), ...]
+        동시 처리 개수를 concurrency 로 제한하여 한 프로세스에서 수십 건을 병렬 분석
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run_one(target):
+            async with semaphore:
+                try:
+                    return await self.aanalyze(*target)
+                except LLMCallError as e:
+                    return f"❌ 분석 실패: {e}"
+
+        return await asyncio.gather(*(run_one(t) for t in targets))
@@ -0,0 +1,129 @@
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+# 요약은 응답 경로 밖(백그라운드 스레드)에서 수행 -> 사용자 대기시간에 영향 없음
+_SUMMARY_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="jisang-summary")
+
+SUMMARY_PROMPT = """
+아래는 부동산 상담 대화의 기존 요약과 새로 밀려난 대화입니다.
+두 내용을 합쳐 핵심 사실(질문 주제, 고객 의도, 안내한 수치)만 {limit}자 이내 한국어로 요약하세요.
+
+[기존 요약]
+{summary}
+
+[추가 대화]
+{turns}
+"""
+
+
+def format_turns(turns, max_chars=None):
+    lines = []
+    for t in turns:
+        content = t['content'] if max_chars is None else t['content'][:max_chars]
+        lines.append(f"{t['role']}: {content}")
+    return "\n".join(lines)
+
+
+def extractive_summary(summary, turns, limit=800):
+    """LLM 없이 동작하는 기본 요약기 (턴별 앞부분만 발췌)"""
+    lines = []
+    for t in turns:
+        if t['role'] == 'digest':
+            lines.append(t['content'])
+        elif t['role'] == 'user':
+            lines.append(f"user: {t['content'][:60]}")
+    merged = "\n".join([summary] + lines).strip()
+    # 오래된 내용부터 잘라내어 길이 상한 유지
+    return merged[-limit:]
+
+
+def gemini_summarizer(model_name='gemini-1.5-flash'):
+    """Gemini 기반 롤링 요약기 (실패 시 발췌 요약으로 회귀)"""
+    import google.generativeai as genai
+
+    def summarize(summary, turns, limit=800):
+        model = genai.GenerativeModel(model_name)
+        prompt = SUMMARY_PROMPT.format(limit=limit, summary=summary or "(없음)", turns=format_turns(turns))
+        response = model.generate_content(prompt)
+        return response.text.strip()[:limit]
+
+    return summarize
+
+
+class ChatMemory:
+    """
+    최근 K턴은 원문 그대로, 그 이전 대화는 롤링 요약으로 접어서 보관.
+    세션 길이와 무관하게 프롬프트 크기가 상한을 넘지 않습니다.
+    """
+
+    def __init__(self, max_turns=6, max_turn_chars=1200, max_summary_chars=800, summarizer=None):
+        self.max_turns = max_turns
+        self.max_turn_chars = max_turn_chars
+        self.max_summary_chars = max_summary_chars
+        self.summarizer = summarizer or extractive_summary
+
+        self.recent = deque()
+        self.summary = ""
+        self._pending = []  # 요약 대기 중인 (최근 구간에서 밀려난) 대화
+        self._future = None
+        self._lock = threading.Lock()
+
+    def add(self, role, content):
+        with self._lock:
+            self.recent.append({"role": role, "content": content[:self.max_turn_chars]})
+            while len(self.recent) > self.max_turns:
+                self._pending.append(self.recent.popleft())
+            # 요약기가 밀려 있으면 대기열 앞부분을 발췌 요약 1건으로 접어 상한 유지
+            if len(self._pending) > self.max_turns + 1:
+                overflow = self._pending[:-self.max_turns]
+                digest = extractive_summary("", overflow, self.max_summary_chars)
+                self._pending = [{"role": "digest", "content": digest}] + self._pending[-self.max_turns:]
+        self._schedule_fold()
+
+    def extend(self, messages):
+        for m in messages:
+            self.add(m['role'], m['content'])
+
+    def _schedule_fold(self):
+        with self._lock:
+            if self._future is not None or not self._pending:
+                return
+            batch, self._pending = self._pending, []
+            base = self.summary
+            self._future = _SUMMARY_POOL.submit(self._fold, base, batch)
+
+    def _fold(self, base, batch):
+        try:
+            folded = self.summarizer(base, batch, self.max_summary_chars)
+        except Exception:
+            folded = extractive_summary(base, batch, self.max_summary_chars)
+        with self._lock:
+            self.summary = folded[:self.max_summary_chars]
+            self._future = None
+        # 요약 중에 새로 밀려난 대화가 있으면 이어서 처리
+        self._schedule_fold()
+
+    def render(self):
+        """프롬프트에 넣을 대화 기록 (요약 + 최근 K턴)"""
+        with self._lock:
+            summary = self.summary
+            pending = list(self._pending)
+            recent = list(self.recent)
+
+        parts = []
+        if summary:
+            parts.append(f"[이전 대화 요약]\n{summary}")
+        if pending:
+            # 아직 요약에 반영되지 않은 턴은 짧게 발췌해서 포함
+            parts.append(f"[요약 대기 중]\n{format_turns(pending, max_chars=80)}")
+        parts.append(f"[최근 대화]\n{format_turns(recent)}")
+        return "\n\n".join(parts)
+
+    def wait(self, timeout=None):
+        """백그라운드 요약이 끝날 때까지 대기 (배치/테스트용)"""
+        while self._future is not None:
+            future = self._future
+            future.result(timeout=timeout)
+            if future is self._future:
+                break
@@ -0,0 +1,83 @@
+# --------------------------------------------------------------------------------
+# [Hybrid Chat Engine] 규칙 기반 우선 -> AI Fallback
+# Streamlit 화면(jisang_sales_bot_final)과 HTTP 채팅 서비스(jisang_chat_service)가 공용으로 사용
+# --------------------------------------------------------------------------------
+from agents.intent_registry import REGISTRY
+from agents.llm_call import call_with_retry, acall_with_retry, LLMCallError
+from agents.model_router import FAST_MODEL
+
+FALLBACK_PROMPT = """
+부동산 비서로서 답변. 데이터: {context_data}. 질문: {user_input}.
+{history}
+친절하고 전문적인 어조로 답변하고, 끝에 전문가 상담을 권유할 것.
+"""
+
+FALLBACK_MESSAGE = "죄송합니다. 상세 상담을 위해 우측 '전문가 호출' 버튼을 눌러주시면 담당자가 바로 연락드리겠습니다."
+
+
+def rule_response(user_input, context_data, portfolio=None):
+    """
+    0단계: 포트폴리오 전체 조건 검색이면 역색인으로 즉시 답변 (예: "신탁등기 있고 LTV 70% 넘는 필지")
+    1단계: 핵심 키워드가 있으면 Python 데이터로 즉시 답변 (정확도 100%, 속도 최상)
+    규칙으로 답할 수 없으면 None
+    """
+    user_input = user_input.lower()
+    if portfolio is not None:
+        answer = portfolio.answer(user_input)
+        if answer is not None:
+            return answer
+
+    # [Rule] 공동담보 / 대환·금리 / 신탁·압류 답변 템플릿은 data/intents.json 에서 관리
+    intent, answer = REGISTRY.bot("hybrid").respond(user_input, context_data)
+    return answer
+
+
+def missing_context_fields(context_data):
+    """규칙 답변 템플릿이 참조하지만 물건 팩트에 없는 키 목록 (없으면 빈 리스트)"""
+    return sorted(REGISTRY.bot("hybrid").required_fields - context_data.keys())
+
+
+def _fallback_prompt(user_input, context_data, history):
+    history = f"[대화 기록]\n{history}" if history else ""
+    return FALLBACK_PROMPT.format(context_data=context_data, user_input=user_input.lower(), history=history)
+
+
+def ai_response(user_input, context_data, history="", model_name=FAST_MODEL):
+    """2단계: 규칙으로 답할 수 없는 질문은 Gemini AI에게 질의 (자유도 높음)"""
+    import google.generativeai as genai
+    prompt = _fallback_prompt(user_input, context_data, history)
+    try:
+        model = genai.GenerativeModel(model_name)
+        return call_with_retry(lambda: model.generate_content(prompt).text, deadline=15.0)
+    except LLMCallError:
+        return FALLBACK_MESSAGE
+
+
+async def aai_response(user_input, context_data, history="", model_name=FAST_MODEL):
+    """ai_response 의 비동기 버전 (AI 호출 대기 중에도 이벤트 루프를 막지 않음)"""
+    import google.generativeai as genai
+    prompt = _fallback_prompt(user_input, context_data, history)
+    model = genai.GenerativeModel(model_name)
+
+    async def generate():
+        response = await model.generate_content_async(prompt)
+        return response.text
+
+    try:
+        return await acall_with_retry(generate, deadline=15.0)
+    except LLMCallError:
+        return FALLBACK_MESSAGE
+
+
+def get_hybrid_response(user_input, context_data, portfolio=None, history="", model_name=FAST_MODEL):
+    answer = rule_response(user_input, context_data, portfolio)
+    if answer is not None:
+        return answer
+    return ai_response(user_input, context_data, history, model_name)
+
+
+async def aget_hybrid_response(user_input, context_data, portfolio=None, history="", model_name=FAST_MODEL):
+    answer = rule_response(user_input, context_data, portfolio)
+    if answer is not None:
+        return answer
+    return await aai_response(user_input, context_data, history, model_name)
@@ -0,0 +1,116 @@
+import re
+from collections import deque
+
+
+class IntentMatcher:
+    """
+    Aho-Corasick 기반 다중 키워드 의도 분류기.
+    의도 테이블을 시작 시 1회 오토마톤으로 컴파일하고, 메시지는 한 번만 훑어서
+    모든 키워드를 동시에 찾습니다. (규칙/키워드 수가 늘어도 탐색 비용은 메시지 길이에 비례)
+
+    intents: [{"name": "finance", "keywords": ["이자", ...], "priority": 1}, ...]
+    우선순위: priority 가 작을수록 우선, 같으면 테이블에 먼저 선언된 의도가 우선
+    """
+
+    NO_MATCH = 1 << 30
+
+    def __init__(self, intents):
+        self.intents = list(intents)
+        ranked = sorted(range(len(self.intents)), key=lambda i: (self.intents[i].get('priority', 0), i))
+        self.names = [self.intents[i]['name'] for i in ranked]  # rank -> 의도 이름
+
+        self._goto = [{}]
+        self._fail = [0]
+        self._best = [self.NO_MATCH]  # 상태별 (실패 링크 포함) 가장 높은 우선순위
+        self._out = [[]]  # 상태에서 끝나는 키워드의 의도 rank
+        for rank, i in enumerate(ranked):
+            for keyword in self.intents[i]['keywords']:
+                self._insert(keyword, rank)
+        self._build_failure_links()
+        self._build_dfa()
+
+    def _insert(self, keyword, rank):
+        state = 0
+        for ch in keyword:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._best.append(self.NO_MATCH)
+                self._out.append([])
+            state = nxt
+        self._best[state] = min(self._best[state], rank)
+        self._out[state].append(rank)
+
+    def _build_failure_links(self):
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                f = self._fail[state]
+                while f and ch not in self._goto[f]:
+                    f = self._fail[f]
+                target = self._goto[f].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                # 접미사로 끝나는 키워드의 우선순위까지 미리 합쳐 둠
+                self._best[nxt] = min(self._best[nxt], self._best[self._fail[nxt]])
+
+    def _build_dfa(self):
+        # 실패 링크를 미리 펼쳐 상태 전이를 dict 조회 1회로 만듦 (키워드 문자 집합 기준)
+        alphabet = set(self._goto[0])
+        for edges in self._goto:
+            alphabet.update(edges)
+        self._delta = [None] * len(self._goto)
+        queue = deque([0])
+        while queue:
+            state = queue.popleft()
+            row = {}
+            for ch in alphabet:
+                nxt = self._goto[state].get(ch)
+                if nxt is None:
+                    nxt = self._delta[self._fail[state]].get(ch, 0) if state else 0
+                if nxt:
+                    row[ch] = nxt
+            self._delta[state] = row
+            queue.extend(self._goto[state].values())
+        # 키워드에 없는 문자에서는 항상 루트로 돌아가므로, 키워드 문자로 된 구간만 정규식(C 레벨)으로 추출
+        min_len = min((len(k) for it in self.intents for k in it['keywords']), default=1)
+        charset = "".join(re.escape(ch) for ch in sorted(alphabet))
+        self._runs = re.compile(f"[{charset}]{{{min_len},}}").findall if charset else (lambda text: [])
+
+    def best_rank(self, text):
+        delta, best, no_match = self._delta, self._best, self.NO_MATCH
+        found = no_match
+        for run in self._runs(text):
+            state = 0
+            for ch in run:
+                state = delta[state].get(ch, 0)
+                rank = best[state]
+                if rank < found:
+                    found = rank
+                    if found == 0:
+                        return found  # 최우선 의도 확정 -> 조기 종료
+        return found
+
+    def match(self, text):
+        """가장 우선순위가 높은 의도 이름 (없으면 None)"""
+        rank = self.best_rank(text)
+        return None if rank == self.NO_MATCH else self.names[rank]
+
+    def match_all(self, text):
+        """메시지에 등장한 모든 의도 이름 (우선순위 순)"""
+        goto, fail = self._goto, self._fail
+        hits = set()
+        state = 0
+        for ch in text:
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            s = state
+            while s:
+                hits.update(self._out[s])
+                s = fail[s]
+        return [self.names[r] for r in sorted(hits)]
@@ -0,0 +1,174 @@
+import os
+import copy
+import json
+import time
+import threading
+from collections import OrderedDict, deque
+
+from agents.intent_matcher import IntentMatcher
+from agents.korean_text import normalize, FuzzyKeywordIndex
+from agents.templating import CompiledTemplate, context_fingerprint, FIELD_BUILDERS
+
+DEFAULT_INTENTS_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data", "intents.json")
+
+
+class IntentTable:
+    """
+    챗봇 1종의 컴파일된 의도 테이블 (매처 + 의도별 템플릿 + 기본 답변).
+    의도 판별은 원문 일치 -> 정규화(띄어쓰기 제거 + 자모 분해) 일치 -> 자모 오타 허용 순으로 시도하고,
+    단계별 처리 건수와 fallback 비율을 routes 에 집계합니다.
+    렌더링된 답변은 (팩트 해시, 의도) 단위로 캐시되어 같은 물건의 반복 질문은 dict 조회 1회로 끝납니다.
+    """
+
+    ROUTES = ("exact", "normalized", "fuzzy", "fallback")
+
+    def __init__(self, name, spec, dictionary=(), max_answers=1024):
+        self.name = name
+        self.intents = spec['intents']
+        self.matcher = IntentMatcher(self.intents)
+        self.normalized_matcher = IntentMatcher(
+            [dict(it, keywords=[normalize(k) for k in it['keywords']]) for it in self.intents])
+        self.fuzzy = FuzzyKeywordIndex((k for it in self.intents for k in it['keywords']), dictionary)
+        self._keyword_rank = {}  # 키워드 -> 의도 rank (오타 매칭 결과를 의도로 환원)
+        for rank, intent_name in enumerate(self.matcher.names):
+            for keyword in next(it for it in self.intents if it['name'] == intent_name)['keywords']:
+                self._keyword_rank.setdefault(keyword, rank)
+        self.routes = dict.fromkeys(self.ROUTES, 0)
+        self.templates = {it['name']: CompiledTemplate(it['template']) for it in self.intents}
+        fallback = spec.get('fallback')
+        self.fallback = CompiledTemplate(fallback) if fallback is not None else None
+        # 답변 렌더링에 필요한 팩트 키 (파생 필드 제외) - 세션 생성 시 팩트 검증용
+        templates = [*self.templates.values(), *([self.fallback] if self.fallback else [])]
+        self.required_fields = frozenset(f for t in templates for f in t.fields if f not in FIELD_BUILDERS)
+
+        self.max_answers = max_answers
+        self.stats = {"hits": 0, "misses": 0}
+        self._answers = OrderedDict()  # (context_key, intent) -> 답변 (LRU)
+        self._recent_contexts = deque(maxlen=16)  # (팩트 스냅샷, 해시) - 해시 재계산 방지
+        self._lock = threading.Lock()
+
+    def match(self, text):
+        intent = self.matcher.match(text)
+        route = "exact"
+        if intent is None:
+            normalized = normalize(text)
+            intent = self.normalized_matcher.match(normalized)
+            route = "normalized"
+            if intent is None:
+                hits = self.fuzzy.search(normalized)
+                if hits:
+                    # 우선순위가 높은 의도, 같으면 오타가 적은 키워드
+                    rank = min((self._keyword_rank[k], d) for k, d in hits)[0]
+                    intent = self.matcher.names[rank]
+                route = "fuzzy" if intent is not None else "fallback"
+        with self._lock:
+            self.routes[route] += 1
+        return intent
+
+    def report(self):
+        with self._lock:
+            routes = dict(self.routes)
+            answers = dict(self.stats)
+        total = sum(routes.values())
+        return dict(routes, total=total, fallback_rate=round(routes["fallback"] / total, 4) if total else 0.0,
+                    answer_cache=answers)
+
+    def _context_key(self, context):
+        # 같은 팩트면 dict 비교(C 레벨)만으로 기존 해시 재사용, 달라졌을 때만 해시 계산
+        with self._lock:
+            for snapshot, key in self._recent_contexts:
+                if snapshot == context:
+                    return key
+        key = context_fingerprint(context)
+        with self._lock:
+            self._recent_contexts.appendleft((copy.deepcopy(context), key))
+        return key
+
+    def render(self, intent, context, context_key=None):
+        template = self.templates[intent] if intent is not None else self.fallback
+        if template is None:
+            return None
+        key = (context_key or self._context_key(context), intent)
+        with self._lock:
+            answer = self._answers.get(key)
+            if answer is not None:
+                self._answers.move_to_end(key)
+                self.stats["hits"] += 1
+                return answer
+        answer = template.render(context)
+        with self._lock:
+            self.stats["misses"] += 1
+            self._answers[key] = answer
+            if len(self._answers) > self.max_answers:
+                self._answers.popitem(last=False)
+        return answer
+
+    def respond(self, text, context, context_key=None):
+        """
+        (의도 이름, 답변) 반환. 매칭 의도가 없고 fallback 이 null 이면 답변은 None (AI 위임)
+        context_key: 물건 팩트의 버전/해시를 이미 알고 있으면 전달 (없으면 context 내용으로 계산)
+        """
+        intent = self.match(text)
+        return intent, self.render(intent, context, context_key)
+
+
+class IntentRegistry:
+    """
+    data/intents.json 을 시작 시 1회 컴파일하고, 파일이 바뀌면 다음 요청 때 다시 컴파일합니다.
+    (Streamlit 서버 재시작 없이 의도/키워드/답변 수정 반영, 잘못된 파일이면 기존 테이블 유지)
+    재컴파일 시 테이블이 새로 만들어지므로 이전 템플릿으로 렌더링된 답변 캐시도 함께 버려집니다.
+    """
+
+    def __init__(self, path=DEFAULT_INTENTS_PATH, check_interval=1.0):
+        self.path = path
+        self.check_interval = check_interval
+        self.version = 0
+        self.tables = {}
+        self.dictionary = []
+        self._mtime = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        self.load()
+
+    def load(self):
+        mtime = os.path.getmtime(self.path)
+        with open(self.path, encoding='utf-8') as f:
+            data = json.load(f)
+        dictionary = data.get('dictionary', [])
+        tables = {name: IntentTable(name, spec, dictionary) for name, spec in data['bots'].items()}
+        with self._lock:
+            self.tables = tables
+            self.dictionary = dictionary
+            self._mtime = mtime
+            self.version += 1
+        return self.version
+
+    def refresh(self):
+        now = time.monotonic()
+        if now - self._checked_at < self.check_interval:
+            return False
+        self._checked_at = now
+        try:
+            mtime = os.path.getmtime(self.path)
+            if mtime == self._mtime:
+                return False
+            self.load()
+            print(f"🔄 [Intent] 의도 테이블 재컴파일 완료 (v{self.version})")
+            return True
+        except (OSError, ValueError, KeyError) as e:
+            print(f"⚠️ [Intent] 의도 테이블 갱신 실패 -> 기존 테이블 유지 ({e})")
+            if 'mtime' in locals():
+                self._mtime = mtime  # 같은 (잘못된) 파일로 반복 시도하지 않음
+            return False
+
+    def bot(self, name):
+        self.refresh()
+        return self.tables[name]
+
+    def report(self):
+        """챗봇별 의도 판별 경로 / fallback 비율 (현재 테이블 버전 기준)"""
+        return {name: table.report() for name, table in self.tables.items()}
+
+
+# 프로세스 공용 레지스트리 (모듈 로딩 시 1회 컴파일, Streamlit 재실행 시에도 재사용)
+REGISTRY = IntentRegistry()
@@ -0,0 +1,72 @@
+from datetime import datetime
+
+from agents.pdf_fonts import FONTS, FPDF  # fpdf 1.7 은 글자 서브셋 캐시 사용
+
+
+# --------------------------------------------------------------------------------
+# 유니버설 한글 PDF (fpdf + NanumGothic)
+# 한글 폰트는 실행 스크립트에서 FONTS.register 로 프로세스당 1회 등록하고, 문서마다 참조로 연결 (header 는 set_font 만)
+# 미등록이면 Arial 로 출력
+# --------------------------------------------------------------------------------
+class PDF(FPDF):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # 폰트 연결 시도 (실패 시 기본 폰트로 안전하게 회귀)
+        self.font_name = FONTS.attach(self, 'NanumGothic', fallback='Arial')
+
+    def header(self):
+        self.set_font(self.font_name, '', 10)
+        
+        # [Fix] new_x, new_y 대신 ln=0 (줄바꿈 없음), align='R' 사용
+        self.cell(0, 10, 'Jisang AI Universe Report', ln=1, align='R')
+        self.ln(5)
+
+
+def generate_korean_pdf(address, context):
+    pdf = PDF()
+    pdf.add_page()
+    font_name = pdf.font_name
+
+    # 1. 타이틀
+    pdf.set_font(font_name, '', 20)
+    # [Fix] ln=1 (다음 줄로 이동), align='C' (가운데 정렬)
+    pdf.cell(0, 15, "부동산 5대 영역 종합 분석 보고서", ln=1, align='C')
+    pdf.ln(10)
+    
+    # 2. 개요
+    pdf.set_font(font_name, '', 12)
+    pdf.cell(0, 10, f"분석 대상: {address}", ln=1)
+    pdf.cell(0, 10, f"발행 일자: {datetime.now().strftime('%Y-%m-%d')}", ln=1)
+    pdf.ln(5)
+    
+    # 3. 상세 분석
+    pdf.set_fill_color(240, 240, 240)
+    pdf.set_font(font_name, '', 14)
+    # [Fix] fill=True는 구버전에서도 지원
+    pdf.cell(0, 10, "1. 핵심 분석 요약", ln=1, align='L', fill=True)
+    pdf.ln(5)
+    
+    pdf.set_font(font_name, '', 11)
+    lines = [
+        f"💰 [금융] 연간 이자 절감액: {context['finance_saving']:,} 원",
+        f"⚖️ [세무] 예상 취득세: {context['tax_est']:,} 원 ({context['tax_rate']}%)",
+        f"🏗️ [개발] 예상 분양 수익: {context['dev_profit']:,} 원 (ROI {context['dev_roi']}%)",
+        f"🚨 [리스크] 발견된 권리하자: {context['restrictions']}"
+    ]
+    for line in lines:
+        try:
+            pdf.cell(0, 8, line, ln=1)
+        except:
+            # 인코딩 에러 발생 시 대체 텍스트 출력
+            pdf.cell(0, 8, "Text Encoding Error", ln=1)
+        
+    pdf.ln(10)
+    pdf.set_font(font_name, '', 14)
+    pdf.cell(0, 10, "2. AI 솔루션 제언", ln=1, align='L', fill=True)
+    pdf.ln(5)
+    pdf.set_font(font_name, '', 11)
+    
+    advice = f"현재 해당 물건은 {context['restrictions']} 등의 권리 리스크가 존재하여 일반적인 매매나 대출 실행이 어렵습니다. 지상 AI 파트너스를 통해 '신탁 말소'와 '대환'을 동시에 진행하는 통합 솔루션을 권장합니다."
+    pdf.multi_cell(0, 7, advice)
+    
+    return pdf.output(dest='S').encode('latin-1')
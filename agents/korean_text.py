@@ -0,0 +1,150 @@
+import re
+
+# 한글 음절 -> 자모 분해 테이블 (겹모음/겹받침도 낱자로 풀어서 오타 1개 = 편집거리 1 이 되도록)
+_CHO = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+_JUNG = ["ㅏ", "ㅐ", "ㅑ", "ㅒ", "ㅓ", "ㅔ", "ㅕ", "ㅖ", "ㅗ", "ㅗㅏ", "ㅗㅐ", "ㅗㅣ", "ㅛ", "ㅜ",
+         "ㅜㅓ", "ㅜㅔ", "ㅜㅣ", "ㅠ", "ㅡ", "ㅡㅣ", "ㅣ"]
+_JONG = ["", "ㄱ", "ㄲ", "ㄱㅅ", "ㄴ", "ㄴㅈ", "ㄴㅎ", "ㄷ", "ㄹ", "ㄹㄱ", "ㄹㅁ", "ㄹㅂ", "ㄹㅅ", "ㄹㅌ",
+         "ㄹㅍ", "ㄹㅎ", "ㅁ", "ㅂ", "ㅂㅅ", "ㅅ", "ㅆ", "ㅇ", "ㅈ", "ㅊ", "ㅋ", "ㅌ", "ㅍ", "ㅎ"]
+# 낱자로 입력된 겹자모 (예: '대화ㄴ', 'ㅘ')
+_COMPAT_SPLIT = {"ㄳ": "ㄱㅅ", "ㄵ": "ㄴㅈ", "ㄶ": "ㄴㅎ", "ㄺ": "ㄹㄱ", "ㄻ": "ㄹㅁ", "ㄼ": "ㄹㅂ", "ㄽ": "ㄹㅅ",
+                 "ㄾ": "ㄹㅌ", "ㄿ": "ㄹㅍ", "ㅀ": "ㄹㅎ", "ㅄ": "ㅂㅅ", "ㅘ": "ㅗㅏ", "ㅙ": "ㅗㅐ", "ㅚ": "ㅗㅣ",
+                 "ㅝ": "ㅜㅓ", "ㅞ": "ㅜㅔ", "ㅟ": "ㅜㅣ", "ㅢ": "ㅡㅣ"}
+
+
+def _build_table():
+    table = {ord(k): v for k, v in _COMPAT_SPLIT.items()}
+    for code in range(0xAC00, 0xD7A4):
+        offset = code - 0xAC00
+        cho, rest = divmod(offset, 21 * 28)
+        jung, jong = divmod(rest, 28)
+        table[code] = _CHO[cho] + _JUNG[jung] + _JONG[jong]
+    return table
+
+
+_JAMO_TABLE = _build_table()
+# 정규화 문자열의 음절 경계 표시 - 음절마다 앞뒤로 붙여 '대화 내용'의 'ㄷㅐㅎㅗㅏ|ㄴㅐ' 처럼
+# 음절을 걸쳐 키워드('대환')가 만들어지는 오매칭을 막음
+BOUNDARY = "·"
+_SYLLABLE_TABLE = {code: BOUNDARY + jamo + BOUNDARY if code >= 0xAC00 else jamo for code, jamo in _JAMO_TABLE.items()}
+_NOISE = re.compile(r"[\W_]+")  # 공백 / 문장부호 (한글, 영문, 숫자만 남김)
+# 받침을 따로 친 경우 ('대화ㄴ'): 받침 없는 음절 + 받침으로 쓸 수 있는 낱자 (뒤에 모음이 오면 다음 음절의 초성)
+_FINAL_INDEX = {ch: i for i, ch in enumerate(_JONG) if len(ch) == 1}
+_FINAL_INDEX.update({k: _JONG.index(v) for k, v in _COMPAT_SPLIT.items() if v in _JONG})
+_SPLIT_FINAL = re.compile(f"([가-힣])([{''.join(_FINAL_INDEX)}])(?![ㅏ-ㅣ])")
+
+
+def _join_final(m):
+    code = ord(m.group(1)) - 0xAC00
+    if code % 28:
+        return m.group(0)
+    return chr(0xAC00 + code + _FINAL_INDEX[m.group(2)])
+
+
+def decompose(text):
+    """한글 음절을 자모 낱자로 분해 ('대환' -> 'ㄷㅐㅎㅗㅏㄴ')"""
+    return text.translate(_JAMO_TABLE)
+
+
+def normalize(text):
+    """
+    띄어쓰기/문장부호 제거 + 소문자 + 따로 친 받침 합치기 + 음절 경계를 표시한 자모 분해
+    ('대 환!' == '대환' == '대화ㄴ' -> '·ㄷㅐ··ㅎㅗㅏㄴ·')
+    """
+    text = _SPLIT_FINAL.sub(_join_final, _NOISE.sub("", text.lower()))
+    return text.translate(_SYLLABLE_TABLE)
+
+
+def jamo_length(normalized):
+    """음절 경계 표시를 뺀 자모 수"""
+    return len(normalized) - normalized.count(BOUNDARY)
+
+
+def max_typos(keyword_jamo):
+    """
+    키워드 길이별 허용 오타 수 (짧은 키워드는 오탐 방지를 위해 엄격히).
+    2음절 키워드(6자모)와 한 자모 차이인 일상어('대한'/'대화' -> '대환', '분야' -> '분양')는
+    음절 경계 표시와 사전 단어 확인(FuzzyKeywordIndex)으로 걸러냄
+    """
+    n = jamo_length(keyword_jamo)
+    if n >= 12:
+        return 2
+    if n >= 6:
+        return 1
+    return 0
+
+
+def substring_distance(pattern, text, limit):
+    """
+    text 의 임의 부분 문자열과 pattern 사이의 최소 편집거리 (Sellers 알고리즘).
+    반환: (편집거리, 시작, 끝) - text[시작:끝] 이 가장 가까운 부분 문자열.
+    limit 을 넘으면 (limit + 1, None, None) 반환
+    """
+    m = len(pattern)
+    prev = list(range(m + 1))
+    prev_start = [0] * (m + 1)
+    best, span = prev[m], (0, 0)
+    for i, ch in enumerate(text, 1):
+        cur, cur_start = [0], [i]
+        for j in range(1, m + 1):
+            cost = 0 if pattern[j - 1] == ch else 1
+            value, start = prev[j - 1] + cost, prev_start[j - 1]
+            if prev[j] + 1 < value:
+                value, start = prev[j] + 1, prev_start[j]
+            if cur[j - 1] + 1 < value:
+                value, start = cur[j - 1] + 1, cur_start[j - 1]
+            cur.append(value)
+            cur_start.append(start)
+        if cur[m] < best:
+            best, span = cur[m], (cur_start[m], i)
+            if best == 0:
+                break
+        prev, prev_start = cur, cur_start
+    return (best, *span) if best <= limit else (limit + 1, None, None)
+
+
+class FuzzyKeywordIndex:
+    """
+    자모 bigram 역색인 + 편집거리 검증으로 오타 섞인 키워드를 찾는 색인.
+    오타 k개는 bigram 을 최대 2k개만 깨뜨리므로(q-gram 보조정리) 공유 bigram 수로 후보를 먼저 거르고,
+    남은 후보만 편집거리로 확인합니다.
+    메시지에서 찾은 부분이 그 자체로 사전 단어(키워드 포함)이면 오타가 아니라 다른 단어로 보고 버립니다.
+    """
+
+    def __init__(self, keywords, dictionary=()):
+        keywords = list(dict.fromkeys(keywords))
+        self.entries = []  # (자모 키워드, 원래 키워드, 허용 오타, 필요 bigram 수)
+        self.postings = {}
+        self.dictionary = {normalize(word).replace(BOUNDARY, "") for word in (*keywords, *dictionary)}
+        for keyword in keywords:
+            jamo = normalize(keyword)
+            k = max_typos(jamo)
+            if k == 0:
+                continue
+            grams = self._bigrams(jamo)
+            needed = max(1, len(grams) - 2 * k)
+            idx = len(self.entries)
+            self.entries.append((jamo, keyword, k, needed))
+            for g in grams:
+                self.postings.setdefault(g, []).append(idx)
+
+    @staticmethod
+    def _bigrams(text):
+        return {text[i:i + 2] for i in range(len(text) - 1)}
+
+    def search(self, normalized_text):
+        """정규화된 메시지 안에서 허용 오타 이내로 등장하는 키워드 목록 [(키워드, 편집거리)]"""
+        shared = {}
+        for g in self._bigrams(normalized_text):
+            for idx in self.postings.get(g, ()):
+                shared[idx] = shared.get(idx, 0) + 1
+
+        hits = []
+        for idx, count in shared.items():
+            jamo, keyword, k, needed = self.entries[idx]
+            if count < needed:
+                continue
+            distance, start, end = substring_distance(jamo, normalized_text, k)
+            if distance <= k and normalized_text[start:end].replace(BOUNDARY, "") not in self.dictionary:
+                hits.append((keyword, distance))
+        return hits
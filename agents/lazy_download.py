@@ -0,0 +1,30 @@
+import os
+
+import streamlit as st
+
+from agents.artifact_store import ARTIFACTS, artifact_key
+
+# st.button 도 받는 옵션 (준비 버튼에 그대로 전달)
+_BUTTON_OPTIONS = ("type", "use_container_width", "help", "disabled")
+
+
+def lazy_download_button(label, kind, version, inputs, build, file_name, mime=None, key=None,
+                         prepare_label=None, store=ARTIFACTS, **kwargs):
+    """
+    요청할 때만 파일을 만드는 다운로드 버튼.
+    화면을 그릴 때는 '준비' 버튼만 표시하고, 누르면 build() 로 생성해 저장소(agents/artifact_store)에 보관한 뒤
+    같은 자리에 다운로드 버튼을 표시합니다. 같은 입력으로 이미 만든 파일은 바로 다운로드 버튼으로 표시됩니다.
+    - kind/version/inputs: 저장소 키 (입력이 바뀌면 다시 '준비' 상태)
+    - kwargs: st.download_button 옵션 (type, use_container_width 등)
+    반환: 다운로드 버튼 클릭 여부
+    """
+    ext = os.path.splitext(file_name)[1].lstrip(".") or "bin"
+    key = key or f"dl_{kind}_{artifact_key(kind, version, inputs)[:12]}"
+    data = store.get(kind, version, inputs, ext)
+    if data is None:
+        options = {k: v for k, v in kwargs.items() if k in _BUTTON_OPTIONS}
+        if not st.button(prepare_label or f"⚙️ {label} 준비", key=f"prepare_{key}", **options):
+            return False
+        with st.spinner("파일 생성 중..."):
+            data = store.fetch(kind, version, inputs, build, ext)
+    return st.download_button(label, data, file_name, mime, key=key, **kwargs)
@@ -0,0 +1,168 @@
+import re
+import time
+import asyncio
+import random
+import threading
+
+# 오류 분류 (Error Class)
+QUOTA = "quota"          # 429 / ResourceExhausted - 대기 후 재시도
+TIMEOUT = "timeout"      # 응답 지연 / DeadlineExceeded - 재시도
+SERVER = "server_5xx"    # 일시적 서버 오류 - 재시도
+CLIENT = "client_4xx"    # 잘못된 요청 / 모델 없음 / 권한 - 재시도 무의미
+OTHER = "other"          # 빈 응답, 안전 필터 차단 등 - 재시도 무의미
+
+RETRYABLE = {QUOTA, TIMEOUT, SERVER}
+
+_QUOTA_NAMES = {"ResourceExhausted", "TooManyRequests"}
+_TIMEOUT_NAMES = {"DeadlineExceeded", "Timeout", "ReadTimeout", "ConnectTimeout", "TimeoutError"}
+_SERVER_NAMES = {"InternalServerError", "ServiceUnavailable", "BadGateway", "GatewayTimeout", "ServerError"}
+_CLIENT_NAMES = {"InvalidArgument", "NotFound", "PermissionDenied", "Unauthenticated", "BadRequest", "FailedPrecondition"}
+
+_RETRY_HINT_PATTERNS = [
+    re.compile(r"retry in ([\d.]+)\s*s", re.IGNORECASE),
+    re.compile(r"retry_delay\s*\{\s*seconds:\s*(\d+)", re.IGNORECASE),
+    re.compile(r"retry-after:?\s*([\d.]+)", re.IGNORECASE),
+]
+
+# 오류 분류별 카운터 (외부 모니터링용으로 get_error_counters() 로 노출)
+_COUNTERS = {"success": 0, "retries": 0, "deadline_exceeded": 0,
+             QUOTA: 0, TIMEOUT: 0, SERVER: 0, CLIENT: 0, OTHER: 0}
+_COUNTER_LOCK = threading.Lock()
+
+
+class LLMCallError(Exception):
+    def __init__(self, error_class, cause, attempts):
+        super().__init__(f"[{error_class}] {attempts}회 시도 후 실패: {cause}")
+        self.error_class = error_class
+        self.cause = cause
+        self.attempts = attempts
+
+
+def _count(key):
+    with _COUNTER_LOCK:
+        _COUNTERS[key] += 1
+
+
+def get_error_counters():
+    with _COUNTER_LOCK:
+        return dict(_COUNTERS)
+
+
+def classify_error(exc):
+    name = type(exc).__name__
+    code = getattr(exc, "code", None)
+    code = code if isinstance(code, int) else None
+    message = str(exc).lower()
+
+    if name in _QUOTA_NAMES or code == 429 or "quota" in message or re.search(r"\b429\b", message):
+        return QUOTA
+    if name in _TIMEOUT_NAMES or isinstance(exc, TimeoutError) or code in (408, 504):
+        return TIMEOUT
+    if name in _SERVER_NAMES or (code is not None and 500 <= code < 600) or isinstance(exc, ConnectionError):
+        return SERVER
+    if name in _CLIENT_NAMES or (code is not None and 400 <= code < 500):
+        return CLIENT
+    return OTHER
+
+
+def retry_after_seconds(exc):
+    """서버가 알려준 재시도 대기 시간 (Retry-After / RetryInfo). 없으면 None"""
+    hint = getattr(exc, "retry_after", None)
+    if isinstance(hint, (int, float)):
+        return float(hint)
+
+    response = getattr(exc, "response", None)
+    headers = getattr(response, "headers", None) or {}
+    try:
+        value = headers.get("Retry-After") or headers.get("retry-after")
+        if value is not None:
+            return float(value)
+    except (TypeError, ValueError):
+        pass
+
+    for detail in getattr(exc, "details", None) or []:
+        delay = getattr(detail, "retry_delay", None)
+        if delay is not None:
+            return getattr(delay, "seconds", 0) + getattr(delay, "nanos", 0) / 1e9
+
+    for pattern in _RETRY_HINT_PATTERNS:
+        match = pattern.search(str(exc))
+        if match:
+            return float(match.group(1))
+    return None
+
+
+def _next_delay(exc, attempt, base_delay, max_delay):
+    hint = retry_after_seconds(exc)
+    if hint is not None:
+        return hint
+    # Exponential Backoff + Full Jitter
+    return random.uniform(0, min(max_delay, base_delay * (2 ** (attempt - 1))))
+
+
+def _plan_retry(exc, attempt, max_attempts, started, deadline, base_delay, max_delay, clock):
+    """재시도 여부 판단 후 대기 시간 반환 (재시도 불가 시 LLMCallError)"""
+    error_class = classify_error(exc)
+    _count(error_class)
+    if error_class not in RETRYABLE or attempt >= max_attempts:
+        raise LLMCallError(error_class, exc, attempt) from exc
+
+    delay = _next_delay(exc, attempt, base_delay, max_delay)
+    if clock() - started + delay >= deadline:
+        _count("deadline_exceeded")
+        raise LLMCallError(error_class, exc, attempt) from exc
+    _count("retries")
+    return delay
+
+
+def call_with_retry(fn, deadline=20.0, max_attempts=4, base_delay=0.5, max_delay=8.0,
+                    sleep=time.sleep, clock=time.monotonic):
+    """
+    LLM 호출 공용 래퍼.
+    오류를 분류(quota/timeout/4xx/5xx)하여 재시도 가능한 경우만 지수 백오프 + 지터로 재시도하고,
+    서버의 Retry-After 힌트를 우선 적용하며, 전체 시도는 deadline(초) 안으로 제한합니다.
+    """
+    started = clock()
+    for attempt in range(1, max_attempts + 1):
+        try:
+            result = fn()
+            _count("success")
+            return result
+        except Exception as e:
+            delay = _plan_retry(e, attempt, max_attempts, started, deadline, base_delay, max_delay, clock)
+            sleep(delay)
+
+
+async def acall_with_retry(coro_fn, deadline=20.0, max_attempts=4, base_delay=0.5, max_delay=8.0,
+                           clock=time.monotonic):
+    """call_with_retry 의 비동기 버전 (대기 중에도 이벤트 루프를 막지 않음)"""
+    started = clock()
+    for attempt in range(1, max_attempts + 1):
+        try:
+            result = await coro_fn()
+            _count("success")
+            return result
+        except Exception as e:
+            delay = _plan_retry(e, attempt, max_attempts, started, deadline, base_delay, max_delay, clock)
+            await asyncio.sleep(delay)
+
+
+def call_models(models, call, deadline=20.0, **retry_options):
+    """
+    모델 목록을 순서대로 시도 (Fail-over). 각 모델은 call_with_retry 로 호출되며
+    전체 모델이 하나의 deadline 을 공유합니다. 반환값: (결과, 사용 모델)
+    """
+    started = time.monotonic()
+    last_error = None
+    for model in models:
+        remaining = deadline - (time.monotonic() - started)
+        if remaining <= 0:
+            break
+        try:
+            return call_with_retry(lambda: call(model), deadline=remaining, **retry_options), model
+        except LLMCallError as e:
+            last_error = e
+    if last_error is None:
+        _count("deadline_exceeded")
+        raise LLMCallError(TIMEOUT, "deadline exhausted", 0)
+    raise last_error
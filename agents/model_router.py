@@ -0,0 +1,129 @@
+import re
+import time
+import threading
+
+# 버전 고정 id (Context Caching 은 버전이 명시된 모델에만 생성 가능)
+FAST_MODEL = "gemini-1.5-flash-002"
+STRONG_MODEL = "gemini-1.5-pro-002"
+
+# 100만 토큰당 USD (입력, 출력) - 경로별 비용 리포트용 추정 단가
+MODEL_PRICING = {
+    "gemini-1.5-flash": (0.075, 0.30),
+    "gemini-1.5-pro": (1.25, 5.00),
+    "gemini-2.0-flash": (0.10, 0.40),
+}
+
+# 권리하자별 난이도 가중치 (목록에 없는 하자는 1점)
+RESTRICTION_WEIGHTS = {
+    "경매": 3, "공매": 3,
+    "신탁": 2, "가압류": 2, "임차권": 2, "가등기": 2,
+    "압류": 1,
+}
+
+
+_LENDER_PATTERN = re.compile(r"대부(?!분)")
+
+
+def estimate_tokens(text):
+    # 한글 위주 텍스트 기준 대략 2자당 1토큰 (청구 토큰 정보가 없을 때의 추정치)
+    return max(1, len(text) // 2)
+
+
+def model_pricing(model):
+    """모델 id 의 단가 ('models/' 접두어, '-002' 같은 버전 접미어는 무시)"""
+    base = re.sub(r"-\d{3}$", "", model.removeprefix("models/"))
+    return MODEL_PRICING.get(base, (0.0, 0.0))
+
+
+def restriction_weight(name):
+    for keyword, weight in RESTRICTION_WEIGHTS.items():
+        if keyword in name:
+            return weight
+    return 1
+
+
+def ltv_band_score(ltv):
+    if ltv is None:
+        return 0
+    if ltv >= 80: return 3
+    if ltv >= 70: return 2
+    if ltv >= 60: return 1
+    return 0
+
+
+class ModelRouter:
+    """
+    물건의 난이도 점수에 따라 빠른 모델(Flash) / 강한 모델(Pro)을 선택.
+    깨끗한 등기 + 1금융 대출 1건 같은 단순 건은 Flash 로 처리합니다.
+    """
+
+    def __init__(self, threshold=4, fast_model=FAST_MODEL, strong_model=STRONG_MODEL):
+        self.threshold = threshold
+        self.fast_model = fast_model
+        self.strong_model = strong_model
+        self.stats = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def score_facts(restrictions=(), bonds=(), ltv=None):
+        """구조화된 팩트 (권리하자 목록, 채권 목록, LTV) 기반 난이도 점수"""
+        score = sum(restriction_weight(r) for r in restrictions)
+        score += 2 * sum(1 for b in bonds if b.get('type') == "대부업")
+        score += ltv_band_score(ltv)
+        return score
+
+    @staticmethod
+    def score_text(text, ltv=None):
+        """등기부 원문 텍스트 기반 난이도 점수 (구조화 전 단계용)"""
+        score = 0
+        for keyword, weight in RESTRICTION_WEIGHTS.items():
+            if keyword == "압류":
+                # '가압류' 안의 '압류' 중복 집계 방지
+                score += weight * (text.count("압류") - text.count("가압류"))
+            else:
+                score += weight * text.count(keyword)
+        # '대부분' 같은 일상어 제외 ('러시앤캐시대부', '대부업체' 는 집계)
+        score += 2 * len(_LENDER_PATTERN.findall(text))
+        score += ltv_band_score(ltv)
+        return score
+
+    def route(self, score):
+        return self.strong_model if score >= self.threshold else self.fast_model
+
+    def track(self, model, prompt, fn):
+        """fn() 을 실행하고 경로별 지연시간 / 추정 비용을 기록"""
+        start = time.perf_counter()
+        output = fn()
+        self.record(model, time.perf_counter() - start, prompt, output or "")
+        return output
+
+    async def atrack(self, model, prompt, coro_fn):
+        """track 의 비동기 버전 (coro_fn() 은 코루틴 반환)"""
+        start = time.perf_counter()
+        output = await coro_fn()
+        self.record(model, time.perf_counter() - start, prompt, output or "")
+        return output
+
+    def record(self, model, latency, prompt, output):
+        price_in, price_out = model_pricing(model)
+        cost = (estimate_tokens(prompt) * price_in + estimate_tokens(output) * price_out) / 1_000_000
+        with self._lock:
+            s = self.stats.setdefault(model, {"calls": 0, "latency_sum": 0.0, "cost_usd": 0.0})
+            s["calls"] += 1
+            s["latency_sum"] += latency
+            s["cost_usd"] += cost
+
+    def report(self):
+        with self._lock:
+            return {
+                model: {
+                    "calls": s["calls"],
+                    "avg_latency_sec": round(s["latency_sum"] / s["calls"], 3),
+                    "cost_usd": round(s["cost_usd"], 6),
+                }
+                for model, s in self.stats.items()
+            }
+
+
+# 프로세스 공용 라우터 (경로별 통계 누적)
+ROUTER = ModelRouter()
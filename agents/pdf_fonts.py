@@ -0,0 +1,434 @@
+import os
+import zlib
+import pickle
+import hashlib
+import threading
+from collections import OrderedDict
+
+try:
+    import fpdf
+except ImportError:  # ReportLab 만 쓰는 스크립트 (jisang_universe_ultimate)
+    fpdf = None
+
+# 프로젝트 루트 기준 폰트 캐시 폴더 (버전/해시가 파일명에 들어가므로 삭제할 필요 없음)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FONT_CACHE_DIR = os.path.join(ROOT, ".font_cache")
+CACHE_FORMAT = 1  # 캐시 내용 구조가 바뀌면 올려서 이전 캐시를 자연히 무시
+
+_FPDF_VERSION = (getattr(fpdf, "FPDF_VERSION", None) or getattr(fpdf, "__version__", "0")) if fpdf else "0"
+IS_FPDF2 = int(_FPDF_VERSION.split(".")[0]) >= 2  # fpdf 1.7.x 와 fpdf2 는 같은 'fpdf' 모듈명을 사용
+FPDF_LIB_VERSION = f"{'fpdf2' if IS_FPDF2 else 'fpdf'}-{_FPDF_VERSION}"
+
+_METRICS = {}  # (TTF 해시) -> 폰트 메트릭 (프로세스 공용)
+_DIGESTS = {}  # (경로, 수정시각, 크기) -> TTF 해시
+_LOCK = threading.Lock()
+
+
+def file_digest(path):
+    """TTF 내용 해시 (경로/수정시각/크기가 같으면 다시 읽지 않음)"""
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    digest = _DIGESTS.get(key)
+    if digest is None:
+        h = hashlib.sha1()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                h.update(chunk)
+        digest = _DIGESTS[key] = h.hexdigest()[:16]
+    return digest
+
+
+def cache_path(ttf_path, digest, suffix=".pkl"):
+    stem = os.path.splitext(os.path.basename(ttf_path))[0]
+    return os.path.join(FONT_CACHE_DIR, f"{stem}-{digest}-{FPDF_LIB_VERSION}-v{CACHE_FORMAT}{suffix}")
+
+
+def _parse_metrics(ttf_path):
+    from fpdf.ttfonts import TTFontFile
+    ttf = TTFontFile()
+    ttf.getMetrics(ttf_path)
+    desc = {
+        'Ascent': int(round(ttf.ascent, 0)),
+        'Descent': int(round(ttf.descent, 0)),
+        'CapHeight': int(round(ttf.capHeight, 0)),
+        'Flags': ttf.flags,
+        'FontBBox': "[%s %s %s %s]" % tuple(int(round(v, 0)) for v in ttf.bbox[:4]),
+        'ItalicAngle': int(ttf.italicAngle),
+        'StemV': int(round(ttf.stemV, 0)),
+        'MissingWidth': int(round(ttf.defaultWidth, 0)),
+    }
+    # 경로는 저장하지 않음 (다른 PC에서 만든 캐시의 경로가 박혀 한글이 깨지던 문제 방지)
+    return {
+        'name': ttf.fullName.replace(" ", "").replace("(", "").replace(")", ""),
+        'type': 'TTF', 'desc': desc,
+        'up': round(ttf.underlinePosition), 'ut': round(ttf.underlineThickness),
+        'originalsize': os.stat(ttf_path).st_size,
+        'cw': ttf.charWidths,
+    }
+
+
+def load_font_metrics(ttf_path):
+    """
+    TTF 메트릭 (fpdf 1.7.x 용). 메모리 -> 디스크 캐시 -> TTF 파싱 순으로 조회하며,
+    디스크 캐시는 'TTF 해시 + 라이브러리 버전' 으로 구분되어 폰트/라이브러리가 바뀌면 자동으로 새로 만듭니다.
+    """
+    digest = file_digest(ttf_path)
+    metrics = _METRICS.get(digest)
+    if metrics is not None:
+        return metrics
+    with _LOCK:
+        metrics = _METRICS.get(digest)
+        if metrics is not None:
+            return metrics
+        path = cache_path(ttf_path, digest)
+        try:
+            with open(path, "rb") as f:
+                metrics = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            metrics = _parse_metrics(ttf_path)
+            try:
+                os.makedirs(FONT_CACHE_DIR, exist_ok=True)
+                tmp = f"{path}.{os.getpid()}.tmp"
+                with open(tmp, "wb") as f:
+                    pickle.dump(metrics, f, protocol=pickle.HIGHEST_PROTOCOL)
+                os.replace(tmp, path)  # 동시 실행 시에도 반쯤 쓰인 캐시가 읽히지 않도록
+            except OSError as e:
+                print(f"⚠️ [Font] 메트릭 캐시 저장 실패 -> 메모리 캐시만 사용 ({e})")
+        _METRICS[digest] = metrics
+        return metrics
+
+
+class GlyphSubset(list):
+    """
+    문서에 쓰인 글자(코드포인트) 목록. fpdf 1.7 은 출력하는 글자마다 subset.append() 를 호출하므로
+    중복은 버리고, 포함 여부는 집합으로 확인합니다. (원래 list 는 본문 길이만큼 커지고 출력 시 O(글자수 x 65536))
+    """
+
+    def __init__(self, codes=()):
+        super().__init__()
+        self._seen = set()
+        for code in codes:
+            self.append(code)
+
+    def append(self, code):
+        if code not in self._seen:
+            self._seen.add(code)
+            super().append(code)
+
+    def __contains__(self, code):
+        return code in self._seen
+
+    def __delitem__(self, index):
+        removed = self[index]
+        super().__delitem__(index)
+        self._seen.difference_update(removed if isinstance(index, slice) else (removed,))
+
+    def key(self):
+        """글자 집합 해시 (서브셋 캐시 키)"""
+        return hashlib.sha1(",".join(map(str, sorted(self._seen))).encode()).hexdigest()
+
+
+def add_font(pdf, family, ttf_path, style=''):
+    """
+    pdf 문서에 한글 TTF 폰트 등록 (fpdf.add_font(uni=True) 대체).
+    fpdf 1.7.x 는 캐시된 메트릭으로 바로 등록하고, fpdf2 는 라이브러리 기본 등록을 사용합니다.
+    """
+    if IS_FPDF2:
+        pdf.add_font(family, style, ttf_path)
+        return
+
+    family = family.lower()
+    style = style.upper()
+    fontkey = family + ('BI' if style == 'IB' else style)
+    if fontkey in pdf.fonts:
+        return
+    ttf_path = os.path.abspath(ttf_path)
+    metrics = load_font_metrics(ttf_path)
+    # 이하 fpdf 1.7.2 add_font(uni=True) 와 동일한 문서 내 등록 구조
+    subset = GlyphSubset(range(0, 57) if hasattr(pdf, 'str_alias_nb_pages') else range(0, 32))
+    pdf.fonts[fontkey] = {
+        'i': len(pdf.fonts) + 1, 'type': metrics['type'],
+        'name': metrics['name'], 'desc': metrics['desc'],
+        'up': metrics['up'], 'ut': metrics['ut'],
+        'cw': metrics['cw'],
+        'ttffile': ttf_path, 'fontkey': fontkey,
+        'subset': subset, 'unifilename': cache_path(ttf_path, file_digest(ttf_path)),
+        'digest': file_digest(ttf_path),
+    }
+    pdf.font_files[fontkey] = {'length1': metrics['originalsize'], 'type': "TTF", 'ttffile': ttf_path}
+    pdf.font_files[ttf_path] = {'type': "TTF"}
+
+
+class FontRegistry:
+    """
+    프로세스 공용 폰트 목록.
+    폰트 파일은 register() 시 한 번만 읽고, 각 문서에는 attach() 로 이미 읽은 메트릭을 참조만 연결합니다.
+    (header() 처럼 페이지마다 불리는 곳에서는 set_font 만 호출)
+    """
+
+    def __init__(self):
+        self._faces = {}  # (family, style) -> TTF 절대경로
+        self._reportlab = set()
+        self._lock = threading.Lock()
+
+    def register(self, family, ttf_path, style=''):
+        """폰트 등록 (프로세스당 1회). 파일이 없거나 읽을 수 없으면 False"""
+        key = (family, style.upper())
+        if key in self._faces:
+            return True
+        if not os.path.exists(ttf_path):
+            return False
+        ttf_path = os.path.abspath(ttf_path)
+        try:
+            if fpdf is not None and not IS_FPDF2:
+                load_font_metrics(ttf_path)
+        except Exception as e:
+            print(f"⚠️ [Font] {family} 폰트 로드 실패 -> 기본 폰트 사용 ({e})")
+            return False
+        with self._lock:
+            self._faces[key] = ttf_path
+        return True
+
+    def is_registered(self, family, style=''):
+        return (family, style.upper()) in self._faces
+
+    def path(self, family, style=''):
+        """등록된 TTF 절대경로 (미등록이면 None)"""
+        return self._faces.get((family, style.upper()))
+
+    def attach(self, pdf, family, fallback='Arial', style=''):
+        """문서에 등록된 폰트 연결. 사용할 폰트 이름 반환 (미등록/실패 시 fallback)"""
+        ttf_path = self._faces.get((family, style.upper()))
+        if ttf_path is None:
+            return fallback
+        try:
+            add_font(pdf, family, ttf_path, style)
+        except Exception as e:
+            print(f"⚠️ [Font] {family} 폰트 연결 실패 -> {fallback} 사용 ({e})")
+            return fallback
+        return family
+
+    def reportlab_font(self, family, fallback='Helvetica'):
+        """ReportLab 은 폰트 등록이 전역이므로 프로세스당 1회만 TTF 를 파싱"""
+        if family in self._reportlab:
+            return family
+        ttf_path = self._faces.get((family, ''))
+        if ttf_path is None:
+            return fallback
+        from reportlab.pdfbase import pdfmetrics
+        from reportlab.pdfbase.ttfonts import TTFont
+        with self._lock:
+            if family not in self._reportlab:
+                pdfmetrics.registerFont(TTFont(family, ttf_path))
+                self._reportlab.add(family)
+        return family
+
+
+FONTS = FontRegistry()
+
+
+# --------------------------------------------------------------------------------
+# 글자 서브셋 캐시 (fpdf 1.7.x)
+# 같은 글자 집합이면 서브셋 폰트 / CIDToGIDMap / 글자폭 표를 다시 만들지 않음
+# (Streamlit 은 화면이 갱신될 때마다 같은 보고서를 다시 생성하므로 적중률이 높음)
+# --------------------------------------------------------------------------------
+SUBSET_CACHE_SIZE = 128
+_SUBSETS = OrderedDict()  # (TTF 해시, 글자 집합 해시) -> 서브셋 결과
+_SUBSET_STATS = {"hits": 0, "misses": 0}
+
+
+def _ttf_widths(cw, subset, max_uni):
+    """fpdf 1.7 _putTTfontwidths 와 같은 '/W [...]' 표. 65536자를 모두 훑지 않고 쓰인 글자만 확인"""
+    cwlen = min(max_uni + 1, len(cw))
+    cids = [cid for cid in range(1, min(256, cwlen)) if cw[cid]]
+    cids += sorted(cid for cid in subset if 255 < cid < cwlen and cw[cid])
+
+    rangeid, range_, range_interval = 0, {}, {}
+    prevcid, prevwidth, interval = -2, -1, False
+    for cid in cids:
+        width = cw[cid]
+        if width == 65535:
+            width = 0
+        if cid == prevcid + 1:
+            if width == prevwidth:
+                if width == range_[rangeid][0]:
+                    range_.setdefault(rangeid, []).append(width)
+                else:
+                    range_[rangeid].pop()
+                    rangeid = prevcid
+                    range_[rangeid] = [prevwidth, width]
+                interval = True
+                range_interval[rangeid] = True
+            else:
+                if interval:
+                    rangeid = cid
+                    range_[rangeid] = [width]
+                else:
+                    range_[rangeid].append(width)
+                interval = False
+        else:
+            rangeid = cid
+            range_[rangeid] = [width]
+            interval = False
+        prevcid, prevwidth = cid, width
+
+    prevk, nextk, prevint = -1, -1, False
+    for k, ws in sorted(range_.items()):
+        cws = len(ws)
+        if k == nextk and not prevint and (k not in range_interval or cws < 3):
+            range_interval.pop(k, None)
+            range_[prevk] = range_[prevk] + range_[k]
+            del range_[k]
+        else:
+            prevk = k
+        nextk = k + cws
+        if k in range_interval:
+            prevint = cws > 3
+            del range_interval[k]
+            nextk -= 1
+        else:
+            prevint = False
+
+    w = []
+    for k, ws in sorted(range_.items()):
+        if len(set(ws)) == 1:
+            w.append(' %s %s %s' % (k, k + len(ws) - 1, ws[0]))
+        else:
+            w.append(' %s [ %s ]\n' % (k, ' '.join(str(int(h)) for h in ws)))
+    return '/W [%s]' % ''.join(w)
+
+
+def build_subset(font):
+    """서브셋 폰트 스트림 + CIDToGIDMap + 글자폭 표 (글자 집합 해시로 캐시)"""
+    subset = font['subset']
+    key = (font.get('digest') or file_digest(font['ttffile']), subset.key() if isinstance(subset, GlyphSubset)
+           else GlyphSubset(subset).key())
+    with _LOCK:
+        cached = _SUBSETS.get(key)
+        if cached is not None:
+            _SUBSETS.move_to_end(key)
+            _SUBSET_STATS["hits"] += 1
+            return cached
+
+    from fpdf.ttfonts import TTFontFile
+    ttf = TTFontFile()
+    stream = ttf.makeSubset(font['ttffile'], list(subset))
+    cidtogidmap = bytearray(256 * 256 * 2)
+    for cc, glyph in ttf.codeToGlyph.items():
+        cidtogidmap[cc * 2] = glyph >> 8
+        cidtogidmap[cc * 2 + 1] = glyph & 0xFF
+    result = {
+        'size': len(stream), 'stream': zlib.compress(stream),
+        'cidtogidmap': zlib.compress(bytes(cidtogidmap)),
+        'widths': _ttf_widths(font['cw'], subset, ttf.maxUni),
+    }
+    with _LOCK:
+        _SUBSET_STATS["misses"] += 1
+        _SUBSETS[key] = result
+        while len(_SUBSETS) > SUBSET_CACHE_SIZE:
+            _SUBSETS.popitem(last=False)
+    return result
+
+
+def subset_cache_report():
+    with _LOCK:
+        return dict(_SUBSET_STATS, entries=len(_SUBSETS), max_entries=SUBSET_CACHE_SIZE)
+
+
+_TO_UNICODE = ("/CIDInit /ProcSet findresource begin\n12 dict begin\nbegincmap\n/CIDSystemInfo\n"
+               "<</Registry (Adobe)\n/Ordering (UCS)\n/Supplement 0\n>> def\n"
+               "/CMapName /Adobe-Identity-UCS def\n/CMapType 2 def\n"
+               "1 begincodespacerange\n<0000> <FFFF>\nendcodespacerange\n"
+               "1 beginbfrange\n<0000> <FFFF> <0000>\nendbfrange\n"
+               "endcmap\nCMapName currentdict /CMap defineresource pop\nend\nend")
+
+
+if fpdf is None or IS_FPDF2:
+    # fpdf2 / ReportLab 은 라이브러리가 이미 쓰인 글자만 서브셋으로 넣으므로 그대로 사용
+    FPDF = getattr(fpdf, "FPDF", None)
+else:
+    class FPDF(fpdf.FPDF):
+        """
+        fpdf 1.7.x 한글 보고서용 FPDF.
+        TTF 폰트 출력만 서브셋 캐시(build_subset)를 거치고, 나머지(core 폰트 등)는 원래 구현을 그대로 사용합니다.
+        """
+
+        def _putfonts(self):
+            fonts = self.fonts
+            ttf_fonts = sorted((f['i'], k) for k, f in fonts.items() if f['type'] == 'TTF')
+            self.fonts = {k: f for k, f in fonts.items() if f['type'] != 'TTF'}
+            try:
+                super()._putfonts()
+            finally:
+                self.fonts = fonts
+            for _, k in ttf_fonts:
+                self._put_ttf_font(fonts[k])
+
+        def _put_ttf_font(self, font):
+            # fpdf 1.7.2 _putfonts 의 TTF 분기와 같은 객체 구성 (서브셋 / CIDToGIDMap / 글자폭만 캐시 사용)
+            font['n'] = self.n + 1
+            del font['subset'][0]
+            sub = build_subset(font)
+            fontname = 'MPDFAA+' + font['name']
+
+            self._newobj()
+            self._out('<</Type /Font')
+            self._out('/Subtype /Type0')
+            self._out('/BaseFont /' + fontname)
+            self._out('/Encoding /Identity-H')
+            self._out('/DescendantFonts [' + str(self.n + 1) + ' 0 R]')
+            self._out('/ToUnicode ' + str(self.n + 2) + ' 0 R')
+            self._out('>>')
+            self._out('endobj')
+
+            self._newobj()
+            self._out('<</Type /Font')
+            self._out('/Subtype /CIDFontType2')
+            self._out('/BaseFont /' + fontname)
+            self._out('/CIDSystemInfo ' + str(self.n + 2) + ' 0 R')
+            self._out('/FontDescriptor ' + str(self.n + 3) + ' 0 R')
+            if font['desc'].get('MissingWidth'):
+                self._out('/DW %d' % font['desc']['MissingWidth'])
+            self._out(sub['widths'])
+            self._out('/CIDToGIDMap ' + str(self.n + 4) + ' 0 R')
+            self._out('>>')
+            self._out('endobj')
+
+            self._newobj()
+            self._out('<</Length ' + str(len(_TO_UNICODE)) + '>>')
+            self._putstream(_TO_UNICODE)
+            self._out('endobj')
+
+            self._newobj()
+            self._out('<</Registry (Adobe)')
+            self._out('/Ordering (UCS)')
+            self._out('/Supplement 0')
+            self._out('>>')
+            self._out('endobj')
+
+            self._newobj()
+            self._out('<</Type /FontDescriptor')
+            self._out('/FontName /' + fontname)
+            for kd in ('Ascent', 'Descent', 'CapHeight', 'Flags', 'FontBBox', 'ItalicAngle', 'StemV', 'MissingWidth'):
+                v = font['desc'][kd]
+                if kd == 'Flags':
+                    v = (v | 4) & ~32  # SYMBOLIC 플래그 해제
+                self._out(' /%s %s' % (kd, v))
+            self._out('/FontFile2 ' + str(self.n + 2) + ' 0 R')
+            self._out('>>')
+            self._out('endobj')
+
+            self._newobj()
+            self._out('<</Length ' + str(len(sub['cidtogidmap'])))
+            self._out('/Filter /FlateDecode')
+            self._out('>>')
+            self._putstream(sub['cidtogidmap'])
+            self._out('endobj')
+
+            self._newobj()
+            self._out('<</Length ' + str(len(sub['stream'])))
+            self._out('/Filter /FlateDecode')
+            self._out('/Length1 ' + str(sub['size']))
+            self._out('>>')
+            self._putstream(sub['stream'])
+            self._out('endobj')
@@ -0,0 +1,80 @@
+import os
+import time
+import zipfile
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, wait, as_completed, FIRST_COMPLETED
+
+from agents.report_engine import ReportEngine
+
+
+def _render_batch(render, batch):
+    """작업 프로세스: (파일명, 입력) 묶음을 파일 내용(bytes)으로 변환"""
+    return [(name, render(facts)) for name, facts in batch]
+
+
+def _batches(items, size):
+    batch = []
+    for item in items:
+        batch.append(item)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def render_in_pool(render, items, workers=None, batch_size=8, max_pending=None):
+    """
+    (파일명, 입력) 목록을 프로세스 풀에서 render(입력) -> bytes 로 변환하여, 끝나는 묶음부터 [(파일명, bytes)] 로 내보냄.
+    - render: 작업 프로세스에서 불러와야 하므로 모듈 수준 함수여야 함
+    - 메모리: 동시에 들고 있는 결과는 최대 max_pending 묶음 (기본 workers x 2) 이므로 건수와 무관
+    - workers <= 1 이면 현재 프로세스에서 차례로 변환
+    """
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or workers * 2
+    batches = _batches(items, batch_size)
+    if workers <= 1:
+        for batch in batches:
+            yield _render_batch(render, batch)
+        return
+    # spawn: Streamlit 처럼 스레드가 도는 프로세스에서 fork 하지 않도록 (Windows 기본값과 동일, 작업마다 난수 상태도 새로 시작)
+    ctx = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as pool:
+        pending = set()
+        for batch in batches:
+            if len(pending) >= max_pending:
+                finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    yield future.result()
+            pending.add(pool.submit(_render_batch, render, batch))
+        for future in as_completed(pending):
+            yield future.result()
+
+
+def export_pdf_zip(facts_list, out, render=ReportEngine.create_safe_pdf, names=None, workers=None,
+                   batch_size=8, max_pending=None, progress=None):
+    """
+    포트폴리오 전체 PDF 를 프로세스 풀에서 생성하여, 끝나는 순서대로 ZIP 에 바로 기록합니다.
+    - out: 파일 경로 또는 쓰기 가능한 바이너리 스트림 (응답 스트림처럼 seek 불가여도 됨)
+    - render: 팩트 1건 -> PDF bytes. 작업 프로세스에서 불러와야 하므로 모듈 수준 함수여야 함
+    - 메모리: 동시에 들고 있는 결과는 최대 max_pending 묶음 (기본 workers x 2) 이므로 물건 수와 무관
+    - progress(done, total): 묶음이 끝날 때마다 호출
+    반환: {"files", "bytes", "seconds", "workers"}
+    """
+    total = len(facts_list)
+    if names is None:
+        names = [f"Report_{i}.pdf" for i in range(total)]
+    workers = workers or os.cpu_count() or 1
+
+    start = time.perf_counter()
+    done = 0
+    with zipfile.ZipFile(out, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=1) as zf:
+        for results in render_in_pool(render, zip(names, facts_list), workers, batch_size, max_pending):
+            for name, pdf_bytes in results:
+                zf.writestr(name, pdf_bytes)
+            done += len(results)
+            if progress is not None:
+                progress(done, total)
+        written = sum(info.compress_size for info in zf.infolist())
+
+    return {"files": done, "bytes": written, "seconds": round(time.perf_counter() - start, 3), "workers": workers}
@@ -0,0 +1,265 @@
+import re
+import time
+
+# 인덱싱 필드 (질문에 표시할 이름)
+FIELD_LABELS = {
+    "restriction": "권리제한",
+    "lender": "채권자",
+    "bond_type": "채권유형",
+    "zoning": "용도지역",
+}
+
+# 등기/지역명 뒤의 관용 접미사 - 질문에서는 생략되는 경우가 많아 별칭으로도 등록
+_ALIAS_SUFFIXES = ("등기", "지역")
+
+# LTV 조건: 'ltv' 뒤에 이어지는 수치들 ("LTV 60% 이상 70% 이하", "LTV 60~70%", "LTV 60% 초과이고 80% 미만")
+_LTV_PATTERN = re.compile(r"ltv\s*(?:가|는|이)?\s*", re.IGNORECASE)
+_LTV_BOUND = re.compile(r"(\d+(?:\.\d+)?)\s*%?\s*(이상|초과|넘|over|이하|미만|under|까지|부터|에서|~|-)?"
+                        r"\s*(?:이고|그리고|이면서|and|및|,)?\s*", re.IGNORECASE)
+_MIN_OPS = {"이상": False, "초과": True, "넘": True, "over": True, "부터": False, "에서": False, "~": False, "-": False}
+_MAX_OPS = {"이하": False, "까지": False, "미만": True, "under": True}
+_RANGE_OPS = ("부터", "에서", "~", "-")
+_NEGATION_PATTERN = re.compile(r"\s*(?:이|가|은|는)?\s*(?:없는|없고|없이|제외|빼고)")
+_OR_WORDS = ("또는", "이거나", "혹은", " or ")
+# 포트폴리오 전체를 가리키는 명시적 표현만 ('어떤/전체' 등은 현재 물건 질문에도 흔히 쓰임)
+_PORTFOLIO_WORDS = ("포트폴리오", "내 물건", "물건 중", "목록 중")
+
+
+class PortfolioIndex:
+    """
+    포트폴리오 전체 물건에 대한 역색인 (권리제한 / 채권자 / 채권유형 / 용도지역).
+    값마다 물건 비트맵(int 의 비트 i = i번째 물건)을 두고 AND/OR/NOT 을 비트 연산으로 처리하며,
+    LTV 는 1%p 구간별 비트맵의 누적합으로 범위 조건을 처리합니다. (LLM 호출 없이 ms 단위 응답)
+    """
+
+    LTV_BUCKETS = 201  # 0% ~ 200%+ (마지막 구간은 200% 이상 전부)
+
+    def __init__(self):
+        self.docs = []  # 물건 id (주소)
+        self.ltv = []
+        self._positions = {}  # (field, value) -> 물건 번호 목록 (색인 중)
+        self._bitmaps = None  # (field, value) -> bitmap (첫 질의 시 일괄 생성)
+        self._ltv_buckets = None
+        self._ltv_at_least = None  # 버킷 k 이상인 물건 비트맵
+        self._surface_pattern = None
+        self._surfaces = {}
+
+    @classmethod
+    def from_facts(cls, facts_list):
+        index = cls()
+        for facts in facts_list:
+            index.add(facts)
+        index._freeze()
+        return index
+
+    @property
+    def all_mask(self):
+        return (1 << len(self.docs)) - 1
+
+    def add(self, facts):
+        """FactChecker 결과 1건 색인 (address, ltv, restrictions, raw_bonds, zoning)"""
+        pos = len(self.docs)
+        self.docs.append(facts['address'])
+        ltv = facts.get('ltv')
+        self.ltv.append(ltv)
+
+        terms = [("restriction", r) for r in facts.get('restrictions', [])]
+        for bond in facts.get('raw_bonds', []):
+            terms.append(("lender", bond['bank']))
+            if bond.get('type'):
+                terms.append(("bond_type", bond['type']))
+        if facts.get('zoning'):
+            terms.append(("zoning", facts['zoning']))
+        for term in terms:
+            positions = self._positions.setdefault(term, [])
+            if not positions or positions[-1] != pos:
+                positions.append(pos)
+        self._bitmaps = None
+        self._surface_pattern = None
+
+    # ---------------------------------------------------------------- 비트맵 질의
+    def _to_bitmap(self, positions):
+        # 큰 정수에 비트를 하나씩 OR 하면 O(N^2) -> 바이트 배열에 세운 뒤 1회 변환
+        buf = bytearray((len(self.docs) + 7) // 8)
+        for i in positions:
+            buf[i >> 3] |= 1 << (i & 7)
+        return int.from_bytes(buf, 'little')
+
+    def _freeze(self):
+        if self._bitmaps is not None:
+            return
+        self._bitmaps = {term: self._to_bitmap(positions) for term, positions in self._positions.items()}
+        buckets = [[] for _ in range(self.LTV_BUCKETS)]
+        for i, ltv in enumerate(self.ltv):
+            if ltv is not None:
+                buckets[max(0, min(int(ltv), self.LTV_BUCKETS - 1))].append(i)
+        self._ltv_buckets = [self._to_bitmap(b) for b in buckets]
+        at_least = [0] * (self.LTV_BUCKETS + 1)
+        for k in range(self.LTV_BUCKETS - 1, -1, -1):
+            at_least[k] = at_least[k + 1] | self._ltv_buckets[k]
+        self._ltv_at_least = at_least
+
+    @property
+    def postings(self):
+        self._freeze()
+        return self._bitmaps
+
+    def bitmap(self, field, value):
+        return self.postings.get((field, value), 0)
+
+    def _bucket(self, ltv):
+        return max(0, min(int(ltv), self.LTV_BUCKETS - 1))
+
+    def _ltv_mask(self, minimum=None, maximum=None, strict=False, strict_max=None):
+        self._freeze()
+        strict_max = strict if strict_max is None else strict_max
+        mask = self._ltv_at_least[0]
+        if minimum is not None:
+            mask &= self._ltv_at_least[self._bucket(minimum)]
+        if maximum is not None:
+            mask &= ~self._ltv_at_least[self._bucket(maximum) + 1]
+        # 경계 구간(소수점 / 초과·미만 / 200% 이상 구간)은 해당 물건만 실제 값으로 재확인
+        drop = []
+        for edge in {self._bucket(v) for v in (minimum, maximum) if v is not None}:
+            for i in self._iter_bits(mask & self._ltv_buckets[edge]):
+                v = self.ltv[i]
+                if (minimum is not None and (v <= minimum if strict else v < minimum)) or \
+                   (maximum is not None and (v >= maximum if strict_max else v > maximum)):
+                    drop.append(i)
+        return mask & ~self._to_bitmap(drop) if drop else mask
+
+    @staticmethod
+    def _iter_bits(mask):
+        bits = bin(mask)[:1:-1]  # 최하위 비트부터
+        i = bits.find('1')
+        while i >= 0:
+            yield i
+            i = bits.find('1', i + 1)
+
+    def query(self, all_of=(), any_of=(), none_of=(), ltv_min=None, ltv_max=None, strict=False, strict_max=None):
+        """
+        조건별 (field, value) 목록으로 비트맵 질의 -> 해당 물건 id 목록
+        strict: LTV 하한 초과 여부, strict_max: 상한 미만 여부 (없으면 strict 와 같음)
+        """
+        mask = self.all_mask
+        for term in all_of:
+            mask &= self.bitmap(*term)
+        if any_of:
+            either = 0
+            for term in any_of:
+                either |= self.bitmap(*term)
+            mask &= either
+        for term in none_of:
+            mask &= ~self.bitmap(*term)
+        if ltv_min is not None or ltv_max is not None:
+            mask &= self._ltv_mask(ltv_min, ltv_max, strict, strict_max)
+        return [self.docs[i] for i in self._iter_bits(mask)]
+
+    # ---------------------------------------------------------------- 자연어 질의
+    def _compile_surfaces(self):
+        surfaces = {}
+        for field, value in self._positions:
+            surfaces.setdefault(value.lower(), (field, value))
+            for suffix in _ALIAS_SUFFIXES:
+                if value.endswith(suffix) and len(value) > len(suffix) + 1:
+                    surfaces.setdefault(value[:-len(suffix)].lower(), (field, value))
+        self._surfaces = surfaces
+        ordered = sorted(surfaces, key=len, reverse=True)  # 긴 표현 우선 (신탁등기 > 신탁)
+        self._surface_pattern = re.compile("|".join(re.escape(s) for s in ordered)) if ordered else None
+
+    def parse(self, text):
+        """질문에서 색인 값 / 부정 / LTV 조건 추출 -> query() 인자 dict (조건이 없으면 None)"""
+        if self._surface_pattern is None:
+            self._compile_surfaces()
+        text = text.lower()
+        positive, negative = [], []
+        if self._surface_pattern is not None:
+            for m in self._surface_pattern.finditer(text):
+                term = self._surfaces[m.group(0)]
+                target = negative if _NEGATION_PATTERN.match(text, m.end()) else positive
+                if term not in target:
+                    target.append(term)
+
+        criteria = {}
+        if positive:
+            if any(w in text for w in _OR_WORDS):
+                criteria['any_of'] = positive
+            else:
+                criteria['all_of'] = positive
+        if negative:
+            criteria['none_of'] = negative
+        lower, upper = self._parse_ltv(text)
+        if lower is not None:
+            criteria['ltv_min'], criteria['strict'] = lower
+        if upper is not None:
+            criteria['ltv_max'], criteria['strict_max'] = upper
+        return criteria or None
+
+    @staticmethod
+    def _parse_ltv(text):
+        """
+        질문의 LTV 하한/상한 -> ((값, 초과 여부) 또는 None, (값, 미만 여부) 또는 None).
+        'ltv' 뒤에 이어지는 수치를 모두 읽고, 같은 쪽 조건이 여럿이면 모두 만족하도록 더 좁은 값을 사용
+        """
+        lower = upper = None
+        for m in _LTV_PATTERN.finditer(text):
+            pos, in_range = m.end(), False
+            while True:
+                b = _LTV_BOUND.match(text, pos)
+                if b is None or b.end() == pos:
+                    break
+                pos = b.end()
+                value, op = float(b.group(1)), b.group(2)
+                if op is None:
+                    op = "까지" if in_range else "이상"  # "60~70%" 의 70 은 상한
+                in_range = op in _RANGE_OPS
+                if op in _MAX_OPS:
+                    bound = (value, _MAX_OPS[op])
+                    if upper is None or bound[0] < upper[0] or (bound[0] == upper[0] and bound[1]):
+                        upper = bound
+                else:
+                    bound = (value, _MIN_OPS[op])
+                    if lower is None or bound[0] > lower[0] or (bound[0] == lower[0] and bound[1]):
+                        lower = bound
+        return lower, upper
+
+    @staticmethod
+    def looks_like_portfolio_question(text):
+        return any(w in text for w in _PORTFOLIO_WORDS)
+
+    def describe(self, criteria):
+        parts = []
+        joiner = " 또는 " if 'any_of' in criteria else " & "
+        terms = criteria.get('all_of') or criteria.get('any_of') or []
+        if terms:
+            parts.append(joiner.join(f"{FIELD_LABELS[f]}:{v}" for f, v in terms))
+        for f, v in criteria.get('none_of', []):
+            parts.append(f"{FIELD_LABELS[f]}:{v} 제외")
+        strict = criteria.get('strict')
+        strict_max = criteria.get('strict_max', strict)
+        if criteria.get('ltv_min') is not None:
+            parts.append(f"LTV {'>' if strict else '≥'} {criteria['ltv_min']:g}%")
+        if criteria.get('ltv_max') is not None:
+            parts.append(f"LTV {'<' if strict_max else '≤'} {criteria['ltv_max']:g}%")
+        return " & ".join(parts)
+
+    def answer(self, text, max_lines=20):
+        """포트폴리오 질문(명시적 표현 + 검색 조건)이면 비트맵 질의 결과로 답변, 아니면 None"""
+        if not self.docs or not self.looks_like_portfolio_question(text):
+            return None
+        criteria = self.parse(text)
+        if criteria is None:
+            return None
+        start = time.perf_counter()
+        hits = self.query(**criteria)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        header = f"🔎 **포트폴리오 검색** ({self.describe(criteria)}): 전체 {len(self.docs)}건 중 **{len(hits)}건** ({elapsed_ms:.2f}ms)"
+        if not hits:
+            return header + "\n\n조건에 해당하는 물건이 없습니다."
+        ltv_of = dict(zip(self.docs, self.ltv))
+        lines = [f"- **{addr}** (LTV {'미상' if ltv_of[addr] is None else f'{ltv_of[addr]}%'})"
+                 for addr in hits[:max_lines]]
+        if len(hits) > max_lines:
+            lines.append(f"- ... 외 {len(hits) - max_lines:,}건")
+        return header + "\n\n" + "\n".join(lines)
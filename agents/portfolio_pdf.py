@@ -0,0 +1,151 @@
+import time
+from datetime import datetime
+
+from reportlab.pdfgen import canvas
+from reportlab.pdfbase import pdfdoc
+
+from agents.report_template import UNIVERSE_REPORT
+
+
+class StreamingPDFDocument(pdfdoc.PDFDocument):
+    """
+    페이지가 끝날 때마다(addPage) 그 페이지와 딸린 객체(본문 스트림, 책갈피 등)를 바로 출력에 써 버리는 ReportLab 문서.
+    xref 는 (객체 번호 -> 파일 위치)만 있으면 되므로 객체를 번호 순서대로 쓸 필요가 없고,
+    끝까지 내용이 바뀌는 객체(폰트 사전, 페이지 트리)와 save 때 생기는 객체(폰트 서브셋, 카탈로그, 목차)만 마지막에 씁니다.
+    메모리에 남는 것은 객체 이름/번호/위치와 페이지 참조뿐 (페이지당 수백 바이트)
+    """
+
+    DEFERRED = (pdfdoc.BasicFonts,)
+
+    def start_stream(self, out):
+        if hasattr(out, "write"):
+            self._out, self._own_file = out, False
+        else:
+            self._out, self._own_file = open(out, "wb"), True
+        self._offset = 0
+        self._scanned = 0  # 여기까지의 객체 번호는 출력했거나 마지막으로 미룸
+        self._deferred = []
+        self._started = False
+
+    def _write(self, data):
+        self._out.write(data)
+        self._offset += len(data)
+
+    def _flush(self, final=False):
+        if not self._started:
+            self.encrypt.prepare(self)
+            self._write(pdfdoc.PDFFile(self._pdfVersion).format(self))
+            self._started = True
+        pending = self._deferred if final else []
+        if final:
+            self._deferred = []
+        numbertoid = self.numberToId
+        while True:
+            # 출력 도중에도 참조가 새로 생기므로 (본문 스트림 등) 번호가 끝날 때까지 반복
+            while self._scanned + 1 in numbertoid:
+                self._scanned += 1
+                oid = numbertoid[self._scanned]
+                obj = self.idToObject[oid]
+                if not final and (oid in self.DEFERRED or obj is self.Pages):
+                    self._deferred.append(oid)
+                else:
+                    pending.append(oid)
+            if not pending:
+                break
+            oid = pending.pop(0)
+            self.idToOffset[oid] = self._offset
+            self._write(pdfdoc.PDFIndirectObject(oid, self.idToObject[oid]).format(self))
+            self.idToObject[oid] = None  # 내용은 버리고 이름만 남김 (나중에 같은 객체를 다시 참조해도 번호로 연결, hasForm 조회용)
+
+    def addPage(self, page):
+        name = self.thisPageName()
+        super().addPage(page)
+        self.Pages.pages[-1] = pdfdoc.PDFObjectReference(name)  # 페이지 트리는 참조만 보관
+        self._flush()
+
+    def format(self):
+        # GetPDFData 마지막 단계: 남은 객체 + xref + trailer 를 출력 (반환값 대신 스트림에 기록)
+        self._flush(final=True)
+        count = len(self.numberToId)
+        if count != self._scanned:
+            raise ValueError(f"출력하지 않은 PDF 객체가 있습니다 ({self._scanned}/{count})")
+        xref = pdfdoc.PDFCrossReferenceTable()
+        xref.addsection(0, [self.numberToId[n] for n in range(1, count + 1)])
+        xref_offset = self._offset
+        self._write(xref.format(self))
+        trailer = pdfdoc.PDFTrailer(startxref=xref_offset, Size=count + 1, Root=self.Reference(self.Catalog),
+                                    Info=self.Reference(self.info), ID=self.ID())
+        self._write(trailer.format(self))
+        return b""
+
+    def SaveToFile(self, filename, canvas):
+        try:
+            self.GetPDFData(canvas)
+            self._out.flush()
+        finally:
+            if self._own_file:
+                self._out.close()
+
+
+class PortfolioPDFWriter:
+    """
+    포트폴리오 전체를 한 PDF 로 만드는 작성기. 물건마다 보고서 템플릿(agents/report_template) 1페이지 +
+    목차 책갈피를 붙이고, 페이지가 끝나는 즉시 out(파일 경로 또는 쓰기 가능한 바이너리 스트림, seek 불필요)으로 내보냅니다.
+    골격 Form 과 폰트는 문서 전체가 공유하므로 물건 수가 늘어도 파일은 물건별 값만큼만 커지고 메모리는 거의 일정합니다.
+
+        with PortfolioPDFWriter("portfolio.pdf") as writer:
+            for address, context in rows:
+                writer.add(address, context)
+    """
+
+    def __init__(self, out, template=UNIVERSE_REPORT, title="Jisang AI Portfolio Report", bookmarks=True):
+        self.template = template
+        self.bookmarks = bookmarks
+        self.issued = datetime.now().strftime('%Y년 %m월 %d일')
+        self.pages = 0
+        self._canvas = canvas.Canvas(out, pagesize=template.pagesize)
+        self._canvas._doc.__class__ = StreamingPDFDocument  # 캔버스 설정은 그대로 두고 출력 방식만 교체
+        self._canvas._doc.start_stream(out)
+        self._canvas.setTitle(title)
+        self._fonts = template.fonts()
+        if bookmarks:
+            self._canvas.showOutline()
+
+    def add(self, address, context):
+        """물건 1건 -> 1페이지 추가 후 바로 출력. 반환: 페이지 번호"""
+        self.pages += 1
+        if self.bookmarks:
+            key = f"p{self.pages}"
+            self._canvas.bookmarkPage(key)
+            self._canvas.addOutlineEntry(f"{self.pages}. {address}", key)
+        self.template.draw_page(self._canvas, dict(context, address=address, issued=self.issued), self._fonts)
+        return self.pages
+
+    def close(self):
+        """남은 객체(폰트 서브셋, 목차)와 xref 를 쓰고 마무리. 반환: 출력 바이트 수"""
+        if self._canvas is not None:
+            self._canvas.save()
+            self.bytes = self._canvas._doc._offset
+            self._canvas = None
+        return self.bytes
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def write_portfolio_pdf(rows, out, template=UNIVERSE_REPORT, progress=None, **options):
+    """
+    rows: (주소, 팩트 context) 의 iterable - 제너레이터로 넘기면 물건 데이터도 한 번에 들고 있지 않음
+    progress(done): 페이지가 끝날 때마다 호출
+    반환: {"pages", "bytes", "seconds"}
+    """
+    start = time.perf_counter()
+    with PortfolioPDFWriter(out, template=template, **options) as writer:
+        for address, context in rows:
+            done = writer.add(address, context)
+            if progress is not None:
+                progress(done)
+    return {"pages": writer.pages, "bytes": writer.bytes, "seconds": round(time.perf_counter() - start, 3)}
@@ -0,0 +1,138 @@
+import time
+import hashlib
+import datetime
+
+
+def cache_model_id(model):
+    """
+    설정된 모델명 -> Context Caching 용 모델 id ('gemini-1.5-flash-002' -> 'models/gemini-1.5-flash-002').
+    캐시는 버전이 고정된 모델에만 만들 수 있으므로 설정값 자체가 버전 포함 id 여야 합니다.
+    """
+    return model if model.startswith("models/") else f"models/{model}"
+
+
+class PrefixHandle:
+    """고정 프롬프트(프리픽스) 1건에 대한 핸들 - 등록 후 요청마다 재사용"""
+
+    def __init__(self, key, model, prefix, cached_content=None, expires_at=None):
+        self.key = key
+        self.model = model
+        self.prefix = prefix
+        self.digest = hashlib.sha1(f"{model}\n{prefix}".encode('utf-8')).hexdigest()
+        self.cached_content = cached_content  # 서버 측 캐시 (없으면 로컬 프리픽스)
+        self.expires_at = expires_at
+        self.hits = 0
+
+    @property
+    def is_server_cached(self):
+        return self.cached_content is not None
+
+    def is_expired(self, margin=60):
+        return self.expires_at is not None and time.time() > self.expires_at - margin
+
+
+class LocalPrefixCache:
+    """
+    서버 캐시 없이 동작하는 대체 구현 (테스트/오프라인용).
+    고정 프리픽스를 1회만 구성해 두고, 호출 시 가변 부분만 이어 붙입니다.
+    """
+
+    def __init__(self):
+        self.handles = {}
+        self.stats = {"calls": 0, "server_cached_calls": 0, "cached_tokens": 0, "prefix_chars_reused": 0}
+
+    def register(self, key, model, prefix):
+        handle = self.handles.get(key)
+        candidate = PrefixHandle(key, model, prefix)
+        if handle is not None and handle.digest == candidate.digest and not handle.is_expired():
+            return handle
+        handle = self._create(candidate)
+        self.handles[key] = handle
+        return handle
+
+    def _create(self, handle):
+        return handle
+
+    def generate(self, handle, dynamic_text, llm_fn, generation_config=None):
+        """
+        llm_fn(prompt) -> str : 서버 캐시가 없을 때 사용할 일반 호출 함수.
+        generation_config : 서버 캐시 호출에 쓸 생성 설정 (llm_fn 쪽 설정과 같게 넘길 것, 예: {"temperature": 0.0})
+        """
+        handle.hits += 1
+        self.stats["calls"] += 1
+        if handle.hits > 1:
+            self.stats["prefix_chars_reused"] += len(handle.prefix)
+        return llm_fn(handle.prefix + dynamic_text)
+
+    def report(self):
+        return dict(self.stats, handles=len(self.handles))
+
+
+class GeminiContextCache(LocalPrefixCache):
+    """
+    Gemini Context Caching 적용 버전.
+    프리픽스를 system_instruction 으로 서버에 1회 등록하고, 이후에는 가변 부분만 전송합니다.
+    (최소 토큰 수 미달 등으로 캐시 생성이 거절되면 로컬 프리픽스로 자동 회귀)
+    """
+
+    def __init__(self, api_key=None, ttl_minutes=60):
+        super().__init__()
+        import google.generativeai as genai
+        if api_key:
+            genai.configure(api_key=api_key)
+        self.genai = genai
+        self.ttl_minutes = ttl_minutes
+
+    def _create(self, handle):
+        from google.generativeai import caching
+        try:
+            cached = caching.CachedContent.create(
+                model=cache_model_id(handle.model),
+                display_name=f"jisang-{handle.key}",
+                system_instruction=handle.prefix,
+                ttl=datetime.timedelta(minutes=self.ttl_minutes),
+            )
+            handle.cached_content = cached
+            handle.expires_at = time.time() + self.ttl_minutes * 60
+            print(f"🧊 [Cache] 고정 프롬프트 캐시 등록 완료 ({handle.key})")
+        except Exception as e:
+            print(f"⚠️ [Cache] 서버 캐시 생성 실패 -> 로컬 프리픽스 사용 ({e})")
+        return handle
+
+    def generate(self, handle, dynamic_text, llm_fn, generation_config=None):
+        if handle.is_expired():
+            handle = self.register(handle.key, handle.model, handle.prefix)
+        if not handle.is_server_cached:
+            return super().generate(handle, dynamic_text, llm_fn, generation_config)
+
+        handle.hits += 1
+        self.stats["calls"] += 1
+        self.stats["server_cached_calls"] += 1
+        # from_cached_content 는 LangChain 쪽 설정(temperature 등)을 모르므로 생성 설정을 직접 전달
+        model = self.genai.GenerativeModel.from_cached_content(
+            cached_content=handle.cached_content, generation_config=generation_config
+        )
+        response = model.generate_content(dynamic_text)
+        usage = getattr(response, "usage_metadata", None)
+        if usage is not None:
+            self.stats["cached_tokens"] += getattr(usage, "cached_content_token_count", 0) or 0
+        return response.text
+
+
+_SHARED_CACHES = {}
+
+
+def get_prefix_cache(api_key=None, ttl_minutes=60):
+    """
+    API Key 와 SDK 가 있으면 Gemini 캐시, 아니면 로컬 대체 구현 반환.
+    프로세스 내에서 공유되므로 엔진을 여러 번 만들어도 프리픽스는 1회만 등록됩니다.
+    """
+    if api_key not in _SHARED_CACHES:
+        cache = None
+        if api_key:
+            try:
+                cache = GeminiContextCache(api_key=api_key, ttl_minutes=ttl_minutes)
+            except ImportError:
+                pass
+        _SHARED_CACHES[api_key] = cache or LocalPrefixCache()
+    return _SHARED_CACHES[api_key]
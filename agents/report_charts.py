@@ -0,0 +1,153 @@
+import io
+import os
+import html
+import threading
+from collections import OrderedDict
+
+from agents.artifact_store import ARTIFACTS
+from agents.templating import context_fingerprint
+from agents.pdf_fonts import FONTS, ROOT
+
+# --------------------------------------------------------------------------------
+# 보고서용 막대 그래프 (브라우저/plotly 없이 PNG 또는 SVG 로 그림)
+# 같은 수치의 그래프는 다시 그리지 않도록 데이터 해시로 캐시 - PDF(fpdf 는 파일 경로 필요)는 저장소 파일을 그대로 사용
+# --------------------------------------------------------------------------------
+CHART_VERSION = 1  # 그래프 모양을 바꾸면 올려서 저장소의 기존 PNG 를 무효화
+CHART_SIZE = (720, 360)  # PNG 픽셀 (PDF 에 90mm 폭으로 넣으면 약 200dpi)
+CHART_CACHE_SIZE = 256
+_CHARTS = OrderedDict()  # (형식, 크기, 데이터 해시) -> PNG bytes / SVG 문자열 (LRU)
+_STATS = {"hits": 0, "misses": 0}
+_LOCK = threading.Lock()
+_FONTS = {}  # 글자 크기 -> PIL 폰트
+
+
+def financing_cost_chart(facts):
+    """금융비용 비교 (현재 연 6% 가정 이자 vs 대환 후) - 영업봇 화면의 막대 그래프와 같은 수치"""
+    current = facts['total'] * 0.06
+    return {"title": "금융비용 최적화", "labels": ["Current", "Optimized"],
+            "values": [current, current - facts['saved']], "unit": "원", "colors": ["#ef4444", "#22c55e"]}
+
+
+def cash_flow_chart(facts):
+    """현금 흐름 개선 (만원) - 엔터프라이즈 화면의 막대 그래프와 같은 수치"""
+    return {"title": "현금 흐름 개선", "labels": ["Current", "Solution"],
+            "values": [4800, 4800 - facts['saved'] / 10000], "unit": "만원", "colors": ["#ef4444", "#10b981"]}
+
+
+def chart_frame(spec):
+    """st.plotly_chart 용 표 (State/Cost 열) - 화면과 보고서가 같은 수치를 쓰도록"""
+    import pandas as pd
+    return pd.DataFrame({"State": spec["labels"], "Cost": spec["values"]})
+
+
+def _value_text(value, unit):
+    return f"{value:,.0f}{unit}"
+
+
+def _font(size):
+    font = _FONTS.get(size)
+    if font is None:
+        from PIL import ImageFont
+        ttf_path = FONTS.path('NanumGothic') or os.path.join(ROOT, 'NanumGothic.ttf')
+        try:
+            font = ImageFont.truetype(ttf_path, size)
+        except OSError:
+            font = ImageFont.load_default(size)  # 한글 폰트가 없으면 제목의 한글은 표시되지 않음
+        _FONTS[size] = font
+    return font
+
+
+def _layout(spec, width, height):
+    """막대 위치 계산 (PNG/SVG 공용): [(x0, y0, x1, y1, 색, 이름, 값 문구)], 기준선 y"""
+    top, bottom = height * 0.22, height * 0.82
+    peak = max(max(spec["values"]), 1)
+    slot = width / len(spec["values"])
+    bars = []
+    for i, (label, value, color) in enumerate(zip(spec["labels"], spec["values"], spec["colors"])):
+        bar_h = (bottom - top) * max(value, 0) / peak
+        x0 = slot * i + slot * 0.25
+        bars.append((x0, bottom - bar_h, x0 + slot * 0.5, bottom, color, label, _value_text(value, spec["unit"])))
+    return bars, bottom
+
+
+def render_png(spec, size=CHART_SIZE):
+    from PIL import Image, ImageDraw
+    width, height = size
+    image = Image.new("RGB", size, "white")  # 알파 채널 없는 RGB - fpdf 1.7 이 PNG 를 다시 압축하지 않음
+    draw = ImageDraw.Draw(image)
+    draw.text((width / 2, height * 0.04), spec["title"], fill="#1e293b", font=_font(int(height * 0.08)), anchor="mt")
+    bars, baseline = _layout(spec, width, height)
+    label_font, value_font = _font(int(height * 0.06)), _font(int(height * 0.055))
+    for x0, y0, x1, y1, color, label, value in bars:
+        draw.rectangle((x0, y0, x1, y1), fill=color)
+        draw.text(((x0 + x1) / 2, y0 - 6), value, fill="#334155", font=value_font, anchor="mb")
+        draw.text(((x0 + x1) / 2, baseline + 10), label, fill="#334155", font=label_font, anchor="mt")
+    draw.line((width * 0.05, baseline, width * 0.95, baseline), fill="#94a3b8", width=2)
+    buffer = io.BytesIO()
+    image.save(buffer, "PNG", optimize=True)
+    return buffer.getvalue()
+
+
+def render_svg(spec, size=CHART_SIZE):
+    width, height = size
+    bars, baseline = _layout(spec, width, height)
+    parts = [f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {width} {height}" '
+             f'font-family="NanumGothic, sans-serif" role="img" aria-label="{html.escape(spec["title"])}">',
+             f'<text x="{width / 2:.1f}" y="{height * 0.12:.1f}" text-anchor="middle" font-size="{height * 0.08:.0f}" '
+             f'fill="#1e293b">{html.escape(spec["title"])}</text>']
+    for x0, y0, x1, y1, color, label, value in bars:
+        cx = (x0 + x1) / 2
+        parts.append(f'<rect x="{x0:.1f}" y="{y0:.1f}" width="{x1 - x0:.1f}" height="{y1 - y0:.1f}" fill="{color}"/>')
+        parts.append(f'<text x="{cx:.1f}" y="{y0 - 6:.1f}" text-anchor="middle" font-size="{height * 0.055:.0f}" '
+                     f'fill="#334155">{html.escape(value)}</text>')
+        parts.append(f'<text x="{cx:.1f}" y="{baseline + height * 0.08:.1f}" text-anchor="middle" '
+                     f'font-size="{height * 0.06:.0f}" fill="#334155">{html.escape(label)}</text>')
+    parts.append(f'<line x1="{width * 0.05:.1f}" y1="{baseline:.1f}" x2="{width * 0.95:.1f}" y2="{baseline:.1f}" '
+                 f'stroke="#94a3b8" stroke-width="2"/></svg>')
+    return "".join(parts)
+
+
+def _cached(fmt, spec, size, render):
+    key = (fmt, size, context_fingerprint(spec))
+    with _LOCK:
+        chart = _CHARTS.get(key)
+        if chart is not None:
+            _CHARTS.move_to_end(key)
+            _STATS["hits"] += 1
+            return chart
+    chart = render(spec, size)
+    with _LOCK:
+        _STATS["misses"] += 1
+        _CHARTS[key] = chart
+        while len(_CHARTS) > CHART_CACHE_SIZE:
+            _CHARTS.popitem(last=False)
+    return chart
+
+
+def chart_png(spec, size=CHART_SIZE):
+    """PNG bytes (같은 수치면 캐시된 결과)"""
+    return _cached("png", spec, size, render_png)
+
+
+def chart_svg(spec, size=CHART_SIZE):
+    """HTML 보고서에 그대로 넣는 SVG 문자열 (벡터, 같은 수치면 캐시된 결과)"""
+    return _cached("svg", spec, size, render_svg)
+
+
+def chart_path(spec, size=CHART_SIZE, store=ARTIFACTS):
+    """
+    fpdf image() 용 PNG 파일 경로 (보고서 저장소에 데이터 해시 파일명으로 보관 -> 프로세스/재실행 간 재사용).
+    저장할 수 없으면 None (호출부는 그래프 없이 보고서 생성)
+    """
+    inputs = {"spec": spec, "size": list(size)}
+    path = store.path("chart", CHART_VERSION, inputs, "png")
+    if not os.path.exists(path):
+        store.fetch("chart", CHART_VERSION, inputs, lambda: chart_png(spec, size), "png")
+        if not os.path.exists(path):
+            return None
+    return path
+
+
+def chart_cache_report():
+    with _LOCK:
+        return dict(_STATS, size=len(_CHARTS))
@@ -0,0 +1,53 @@
+import random
+from datetime import datetime
+
+from fpdf import FPDF
+
+from agents.report_charts import chart_path, financing_cost_chart
+from agents.table_export import export_bytes
+
+
+# --------------------------------------------------------------------------------
+# [Engine 2] 리포트 엔진 (영문/수치 요약 PDF + CSV)
+# 모듈 함수로 두어야 포트폴리오 일괄 생성 시 작업 프로세스에서도 불러올 수 있음 (agents/portfolio_export)
+# --------------------------------------------------------------------------------
+class ReportEngine:
+    VERSION = 2  # 양식을 바꾸면 올려서 보고서 저장소(agents/artifact_store)의 기존 파일을 무효화
+
+    @staticmethod
+    def create_safe_pdf(facts):
+        pdf = FPDF()
+        pdf.add_page()
+        pdf.set_font("Arial", "B", 16)
+        pdf.cell(0, 10, "Jisang AI | Analysis Report", 0, 1, 'C')
+        pdf.ln(10)
+        
+        asset_id = f"ASSET-{random.randint(10000, 99999)}"
+        pdf.set_font("Arial", "", 12)
+        pdf.cell(0, 10, f"Ref ID: {asset_id}", 0, 1)
+        pdf.cell(0, 10, f"Date: {datetime.now().strftime('%Y-%m-%d')}", 0, 1)
+        pdf.ln(5)
+        
+        pdf.set_font("Arial", "B", 14)
+        pdf.cell(0, 10, "Summary", 0, 1)
+        pdf.set_font("Arial", "", 12)
+        pdf.cell(0, 10, f"- LTV Ratio: {facts['ltv']}%", 0, 1)
+        pdf.cell(0, 10, f"- Total Debt: {facts['total']:,} KRW", 0, 1)
+        pdf.cell(0, 10, f"- Annual Saving: {facts['saved']:,} KRW", 0, 1)
+        chart = chart_path(financing_cost_chart(facts))  # 같은 수치면 저장된 PNG 재사용
+        if chart:
+            pdf.ln(5)
+            pdf.image(chart, w=90)
+        pdf.ln(10)
+        pdf.multi_cell(0, 7, "High risk detected. Immediate refinancing recommended.")
+        return pdf.output(dest='S').encode('latin-1', errors='replace')
+
+    @staticmethod
+    def create_excel_csv(data_list):
+        # DataFrame 을 거치지 않고 행 단위로 기록 (출력은 기존 pandas to_csv 와 동일)
+        return export_bytes(data_list, "csv")
+
+    @staticmethod
+    def create_table(data_list, fmt):
+        """CSV / XLSX / Parquet (ltv float, total/saved 정수 열). 대용량은 agents.table_export.export_rows 로 파일에 직접 기록"""
+        return export_bytes(data_list, fmt)
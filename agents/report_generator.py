@@ -0,0 +1,148 @@
+import random
+from datetime import datetime
+
+from fpdf import FPDF
+
+from agents.templating import CompiledTemplate
+from agents.pdf_fonts import FONTS
+from agents.report_charts import chart_path, cash_flow_chart
+from agents.report_sections import Section, SectionedReport
+
+
+# 한글 정밀 리포트 PDF 구역 (create_markdown 과 같은 구성) - 구역별로 캐시되어 바뀐 구역만 다시 그림
+def _header_section(pdf, font, f):
+    pdf.set_font(font, '', 18)
+    pdf.cell(0, 12, "부동산 종합 분석 리포트", ln=1, align='C')
+    pdf.set_font(font, '', 11)
+    pdf.cell(0, 8, f"대상: {f['address']}", ln=1)
+    pdf.cell(0, 8, f"작성일: {f['date']}  |  분석툴: Jisang AI Enterprise", ln=1)
+    pdf.ln(4)
+
+
+def _title(pdf, font, text):
+    pdf.set_font(font, '', 14)
+    pdf.set_fill_color(240, 240, 240)
+    pdf.cell(0, 10, text, ln=1, fill=True)
+    pdf.ln(3)
+    pdf.set_font(font, '', 11)
+
+
+def _facts_section(pdf, font, f):
+    _title(pdf, font, "1. 핵심 데이터 (Fact Check)")
+    rows = [("LTV (담보비율)", f"{f['ltv']}%"), ("총 채권액", f"{f['total']:,} 원"),
+            ("대환 타겟", f"{f['count']} 건"), ("연간 예상 절감액", f"{f['saved']:,} 원")]
+    for label, value in rows:
+        pdf.cell(60, 8, label, border=1)
+        pdf.cell(0, 8, value, border=1, ln=1)
+    pdf.ln(6)
+
+
+def _ai_section(pdf, font, f):
+    _title(pdf, font, "2. AI 심층 컨설팅")
+    pdf.multi_cell(0, 7, f['ai_text'].replace("*", "").replace("#", "").strip())  # 마크다운 기호 제거
+    pdf.ln(6)
+
+
+def _disclaimer_section(pdf, font, f):
+    _title(pdf, font, "3. 면책 조항")
+    pdf.multi_cell(0, 7, "본 리포트는 시뮬레이션 결과이며 법적 효력이 없습니다.")
+
+
+# 마크다운 리포트 (로딩 시 1회 파싱, 일괄 생성 시 건마다 값만 채움 - agents/markdown_bundle)
+MARKDOWN_TEMPLATE = CompiledTemplate("""
+# 부동산 종합 분석 리포트
+**대상**: {address}
+**작성일**: {date}
+**분석툴**: Jisang AI Enterprise
+
+---
+## 1. 핵심 데이터 (Fact Check)
+* **LTV (담보비율)**: {ltv}%
+* **총 채권액**: {total:,} 원
+* **대환 타겟**: {count} 건
+* **연간 예상 절감액**: {saved:,} 원
+
+---
+## 2. AI 심층 컨설팅
+{ai_text}
+
+---
+## 3. 면책 조항
+본 리포트는 시뮬레이션 결과이며 법적 효력이 없습니다.
+""")
+
+
+def render_markdown(item):
+    """(주소, 팩트, AI 문구, 작성일) -> 마크다운 bytes. 작업 프로세스에서도 불러올 수 있도록 모듈 함수"""
+    address, facts, ai_text, date = item
+    return MARKDOWN_TEMPLATE.render({"address": address, "date": date, "ai_text": ai_text, "ltv": facts['ltv'],
+                                     "total": facts['total'], "count": facts['count'],
+                                     "saved": facts['saved']}).encode('utf-8')
+
+
+ENTERPRISE_REPORT = SectionedReport("enterprise_korean", [
+    Section("header", ("address", "date"), _header_section),
+    Section("facts", ("ltv", "total", "count", "saved"), _facts_section),
+    Section("ai", ("ai_text",), _ai_section),
+    Section("disclaimer", (), _disclaimer_section),
+])
+
+
+# --------------------------------------------------------------------------------
+# [Engine 1] 리포트 생성 엔진 (Crash 방지)
+# 모듈로 두어 벤치마크(benchmarks/bench_pdf_engines)에서도 같은 코드로 생성
+# --------------------------------------------------------------------------------
+class ReportGenerator:
+    VERSION = 2  # 리포트 양식을 바꾸면 올려서 저장소의 기존 파일을 무효화
+
+    @staticmethod
+    def create_markdown(address, facts, ai_text):
+        """한글이 완벽하게 지원되는 마크다운 리포트"""
+        return render_markdown((address, facts, ai_text, datetime.now().strftime('%Y-%m-%d')))
+
+    @staticmethod
+    def korean_pdf_available():
+        """한글 폰트가 등록되어 있는지 (대체 폰트 Arial 로는 한글을 출력할 수 없음)"""
+        return FONTS.is_registered(ENTERPRISE_REPORT.font)
+
+    @staticmethod
+    def create_korean_pdf(address, facts, ai_text):
+        """한글 정밀 리포트 PDF (페르소나 전환 시 AI 본문 구역만 다시 그림). 한글 폰트는 실행 스크립트에서 FONTS.register"""
+        if not ReportGenerator.korean_pdf_available():
+            raise RuntimeError(f"한글 폰트({ENTERPRISE_REPORT.font})가 등록되지 않아 한글 PDF 를 만들 수 없습니다.")
+        context = {"address": address, "date": datetime.now().strftime('%Y-%m-%d'), "ai_text": ai_text,
+                   "ltv": facts['ltv'], "total": facts['total'], "count": facts['count'], "saved": facts['saved']}
+        return ENTERPRISE_REPORT.render(context)
+
+    @staticmethod
+    def create_english_pdf(address, facts):
+        """에러 없이 작동하는 영문 요약 PDF (Global Standard)"""
+        pdf = FPDF()
+        pdf.add_page()
+        pdf.set_font("Arial", "B", 16)
+        pdf.cell(0, 10, "Jisang AI | Real Estate Summary", 0, 1, 'C')
+        pdf.ln(10)
+        
+        pdf.set_font("Arial", "", 12)
+        pdf.cell(0, 10, f"Target: {address} (ID: {random.randint(1000,9999)})", 0, 1)
+        pdf.cell(0, 10, f"Date: {datetime.now().strftime('%Y-%m-%d')}", 0, 1)
+        pdf.ln(5)
+        
+        pdf.set_font("Arial", "B", 14)
+        pdf.cell(0, 10, "1. Financial Facts", 0, 1)
+        pdf.set_font("Arial", "", 12)
+        pdf.cell(0, 10, f"- LTV Ratio: {facts['ltv']}%", 0, 1)
+        pdf.cell(0, 10, f"- Total Bond: {facts['total']:,} KRW", 0, 1)
+        pdf.cell(0, 10, f"- Est. Saving: {facts['saved']:,} KRW/year", 0, 1)
+        chart = chart_path(cash_flow_chart(facts))  # 같은 수치면 저장된 PNG 재사용
+        if chart:
+            pdf.ln(3)
+            pdf.image(chart, w=90)
+        
+        pdf.ln(5)
+        pdf.set_font("Arial", "B", 14)
+        pdf.cell(0, 10, "2. AI Diagnosis (Summary)", 0, 1)
+        pdf.set_font("Arial", "", 12)
+        pdf.multi_cell(0, 7, "This property is classified as 'High Risk' due to high LTV. Refinancing is strongly recommended to improve cash flow.")
+        
+        return pdf.output(dest='S').encode('latin-1')
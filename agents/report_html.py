@@ -0,0 +1,96 @@
+import html
+import time
+import threading
+from collections import OrderedDict
+from datetime import datetime
+
+from agents.templating import CompiledTemplate, context_fingerprint
+
+FRAGMENT_CACHE_SIZE = 2048
+_FRAGMENTS = OrderedDict()  # 필드 내용 해시 -> 보고서 HTML 조각 (LRU)
+_STATS = {"hits": 0, "misses": 0}
+_LOCK = threading.Lock()
+
+# app.py '부동산 가치 분석 보고서' 1건 (CSS 클래스는 app.py 의 통합 CSS 사용)
+REPORT_TEMPLATE = CompiledTemplate("".join([
+    '<div class="report-wrapper">',
+    '<div class="r-header">',
+    '<div><div class="r-title">부동산 가치 분석 보고서</div><div>Target: {address}</div></div>',
+    '<div style="text-align:right; font-size:11px;">DATE: {date}<br>REF: {ref}</div>',
+    '</div>',
+    '<div style="background:#f1f5f9; padding:15px; border-radius:8px; margin-bottom:20px;">',
+    '<div style="font-size:36px; font-weight:900; color:#1e3a8a;">{score}점 <span style="font-size:16px;">(ROI {roi}%)</span></div>',
+    '<div style="margin-top:5px; font-size:13px;">💡 <b>AI 제안:</b> {advice}</div></div>',
+    '<table class="r-table">',
+    '<tr><th>면적/지목</th><td>{area} / {jimok}</td><th>공시지가</th><td>{land_price}</td></tr>',
+    '<tr><th>용도지역</th><td>{zoning}</td><th>규제사항</th><td>{regulations}</td></tr>',
+    "<tr><th>건물용도</th><td>{building_use}</td><th>위반여부</th><td><span class='bdg {badge_class}'>{badge}</span></td></tr>",
+    '<tr><th>소유자</th><td>{owner}</td><th>채권최고액</th><td>{bonds}</td></tr>',
+    '</table></div>',
+]))
+
+
+def render_html(template, fields):
+    """고정 마크업은 그대로, 값만 HTML 이스케이프 (주소/소유자 등에 <, & 가 있어도 레이아웃 유지)"""
+    return "".join(text if literal else html.escape(text) for text, literal in template.render_parts(fields))
+
+
+def report_fields(item):
+    """분석 결과 1건 (dict 또는 DataFrame 행) -> 템플릿 필드. 조회 실패 물건처럼 빠진 항목은 '-'"""
+    d = item['데이터']
+    land, building, rights = d['토지'], d['건축물'], d['권리']
+    analyzed_at = item.get('분석시각') or int(time.time())  # 보고서 번호/일자는 분석 시각 기준 (렌더링마다 바뀌지 않도록)
+    violated = building.get('위반여부', False)
+    return {
+        "address": item['주소'],
+        "date": datetime.fromtimestamp(analyzed_at).strftime("%Y-%m-%d"),
+        "ref": f"JA-BIZ-{analyzed_at}",
+        "score": item['점수'],
+        "roi": item['ROI'],
+        "advice": rights.get('리스크', '-'),
+        "area": land.get('면적', '-'),
+        "jimok": land.get('지목', '-'),
+        "land_price": land.get('공시지가', '-'),
+        "zoning": land.get('용도지역', '-'),
+        "regulations": ", ".join(land.get('규제', [])),
+        "building_use": building.get('주용도', '-'),
+        "badge_class": "bdg-no" if violated else "bdg-ok",
+        "badge": "위반건축물" if violated else "적법",
+        "owner": rights.get('소유자', '-'),
+        "bonds": rights.get('채권', '-'),
+    }
+
+
+def report_fragment(item):
+    """보고서 1건 HTML. 같은 내용이면 캐시된 조각을 그대로 반환 (체크박스/페이지 이동 등 재실행 시 재조립 없음)"""
+    fields = report_fields(item)
+    key = context_fingerprint(fields)
+    with _LOCK:
+        fragment = _FRAGMENTS.get(key)
+        if fragment is not None:
+            _FRAGMENTS.move_to_end(key)
+            _STATS["hits"] += 1
+            return fragment
+    fragment = render_html(REPORT_TEMPLATE, fields)
+    with _LOCK:
+        _STATS["misses"] += 1
+        _FRAGMENTS[key] = fragment
+        while len(_FRAGMENTS) > FRAGMENT_CACHE_SIZE:
+            _FRAGMENTS.popitem(last=False)
+    return fragment
+
+
+def iter_reports_html(items):
+    """보고서 조각을 하나씩 내보냄 (응답 스트림에 바로 쓰는 용도)"""
+    for item in items:
+        yield report_fragment(item)
+
+
+def reports_html(items):
+    """여러 건을 한 번에 이어 붙임 (join 1회 -> 건수에 비례하는 시간)"""
+    return "".join(iter_reports_html(items))
+
+
+def fragment_cache_report():
+    with _LOCK:
+        return dict(_STATS, size=len(_FRAGMENTS))
@@ -0,0 +1,154 @@
+import threading
+from collections import OrderedDict
+
+from agents.templating import context_fingerprint
+from agents.pdf_fonts import FONTS, FPDF, IS_FPDF2, file_digest
+
+# --------------------------------------------------------------------------------
+# 구역(머리글/팩트 표/AI 본문/면책 조항) 단위로 캐시해 다시 조립하는 PDF 보고서
+# 구역마다 의존하는 입력 키만 해시하므로, 페르소나 전환처럼 AI 본문만 바뀌면 그 구역만 다시 그림
+# fpdf 1.7 은 페이지 내용을 그리기 명령 문자열로 쌓으므로, 구역을 빈 문서에 그려 명령만 떼어 두고
+# 조립 시 세로 위치만 옮겨(cm) 이어 붙입니다. (fpdf2 는 구역을 한 문서에 차례로 그림)
+# --------------------------------------------------------------------------------
+SECTION_CACHE_SIZE = 1024
+_SECTIONS = OrderedDict()  # (보고서, 버전, 폰트, 구역, 시작 y, 입력 해시) -> SectionFragment (LRU)
+_STATS = {"hits": 0, "misses": 0}
+_LOCK = threading.Lock()
+
+
+class Section:
+    """보고서 구역: keys 에 적은 입력만 쓰는 render(pdf, font_name, fields) 함수"""
+
+    def __init__(self, name, keys, render):
+        self.name = name
+        self.keys = tuple(keys)
+        self.render = render
+
+    def fields(self, context):
+        return {k: context.get(k) for k in self.keys}
+
+
+class SectionFragment:
+    """구역 1개를 그린 결과: 페이지별 그리기 명령, 마지막 페이지의 끝 y(mm), 쓰인 글자(폰트 서브셋용)"""
+
+    __slots__ = ("pages", "end_y", "glyphs")
+
+    def __init__(self, pages, end_y, glyphs):
+        self.pages = pages
+        self.end_y = end_y
+        self.glyphs = glyphs
+
+
+class SectionedReport:
+    """
+    구역을 위에서부터 이어 붙이는 A4 세로 보고서 (한 문서에 차례로 그린 것과 같은 배치).
+    남은 공간에 들어가는 구역은 맨 위에서 그려 둔 명령을 옮겨 붙이고,
+    넘치는 구역(긴 AI 본문 등)은 시작 위치별로 따로 캐시합니다.
+    """
+
+    def __init__(self, name, sections, version=1, font='NanumGothic', fallback_font='Arial'):
+        self.name = name
+        self.sections = list(sections)
+        self.version = version  # 구역 모양을 바꾸면 올려서 캐시된 구역을 무효화
+        self.font = font
+        self.fallback_font = fallback_font
+
+    def _document(self):
+        # 폰트를 항상 같은 순서로 연결해야 구역 명령의 /F 번호가 조립 문서와 일치
+        pdf = FPDF()
+        font_name = FONTS.attach(pdf, self.font, fallback=self.fallback_font)
+        pdf.set_font(font_name, '', 10)
+        return pdf, font_name
+
+    @staticmethod
+    def _font_id(font_name):
+        # 대체 폰트로 그린 구역을 한글 폰트 등록 후에 재사용하지 않도록 (폰트 파일이 바뀌어도 구분)
+        path = FONTS.path(font_name)
+        return font_name, file_digest(path) if path else None
+
+    def _draw(self, section, fields, start_y):
+        pdf, font_name = self._document()
+        pdf.add_page()
+        if start_y is not None:
+            pdf.y = start_y
+        start = len(pdf.pages[1])
+        pdf.font_family = ''  # 구역 첫 set_font 가 반드시 기록되도록 (빈 문서의 현재 폰트에 기대지 않음)
+        section.render(pdf, font_name, fields)
+        pages = [pdf.pages[1][start:]] + [pdf.pages[n] for n in range(2, pdf.page + 1)]
+        glyphs = {key: list(f['subset']) for key, f in pdf.fonts.items() if f['type'] == 'TTF'}
+        return SectionFragment(pages, pdf.y, glyphs)
+
+    def fragment(self, section, context, start_y=None, font_name=None):
+        """
+        구역 그리기 결과 (캐시). start_y 없이 부르면 페이지 맨 위에서 그린 결과 - 조립 시 세로로 옮겨 재사용.
+        남은 공간에 다 들어가지 않는 구역은 실제 시작 위치(start_y)에서 그려 한 문서로 그린 것과 같은 곳에서 페이지를 넘김
+        font_name: 조립 문서에 연결된 폰트 (없으면 현재 등록 상태로 확인)
+        """
+        fields = section.fields(context)
+        start_y = round(start_y, 2) if start_y is not None else None
+        if font_name is None:
+            font_name = self.font if FONTS.is_registered(self.font) else self.fallback_font
+        key = (self.name, self.version, self._font_id(font_name), section.name, start_y, context_fingerprint(fields))
+        with _LOCK:
+            fragment = _SECTIONS.get(key)
+            if fragment is not None:
+                _SECTIONS.move_to_end(key)
+                _STATS["hits"] += 1
+                return fragment
+        fragment = self._draw(section, fields, start_y)
+        with _LOCK:
+            _STATS["misses"] += 1
+            _SECTIONS[key] = fragment
+            while len(_SECTIONS) > SECTION_CACHE_SIZE:
+                _SECTIONS.popitem(last=False)
+        return fragment
+
+    def render(self, context):
+        """context -> PDF bytes. 입력이 그대로인 구역은 캐시된 명령을 재사용"""
+        if IS_FPDF2:
+            return self._render_whole(context)
+        pdf, font_name = self._document()
+        pdf.add_page()
+        top = pdf.t_margin
+        y = top
+        for section in self.sections:
+            fragment = self.fragment(section, context, font_name=font_name)
+            height = fragment.end_y - top
+            if len(fragment.pages) == 1 and y + height <= pdf.page_break_trigger:
+                self._merge_glyphs(pdf, fragment)
+                self._place(pdf, fragment.pages[0], y - top)
+                y += height
+                continue
+            # 페이지를 넘기는 구역: 현재 위치에서 그린 결과를 그대로 붙이고 이어지는 페이지 추가
+            fragment = self.fragment(section, context, y, font_name)
+            self._merge_glyphs(pdf, fragment)
+            for i, ops in enumerate(fragment.pages):
+                if i:
+                    pdf.add_page()
+                self._place(pdf, ops, 0)
+            y = fragment.end_y
+        return pdf.output(dest='S').encode('latin-1')
+
+    @staticmethod
+    def _merge_glyphs(pdf, fragment):
+        for key, codes in fragment.glyphs.items():
+            subset = pdf.fonts[key]['subset']
+            for code in codes:
+                subset.append(code)
+
+    @staticmethod
+    def _place(pdf, ops, dy):
+        # 구역 상태(색/폰트)가 다음 구역으로 새지 않도록 q..Q 로 감싸고, dy(mm) 만큼 아래로 이동
+        pdf.pages[pdf.page] += f"q 1 0 0 1 0 {-dy * pdf.k:.2f} cm\n{ops}Q\n"
+
+    def _render_whole(self, context):
+        pdf, font_name = self._document()
+        pdf.add_page()
+        for section in self.sections:
+            section.render(pdf, font_name, section.fields(context))
+        return bytes(pdf.output())
+
+
+def section_cache_report():
+    with _LOCK:
+        return dict(_STATS, size=len(_SECTIONS))
@@ -0,0 +1,235 @@
+import io
+import zlib
+import threading
+from collections import OrderedDict
+
+from reportlab.pdfgen import canvas
+from reportlab.pdfbase import pdfdoc, pdfmetrics
+from reportlab.pdfbase.ttfonts import TTFont, TTFontFace, FF_SYMBOLIC, FF_NONSYMBOLIC
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.units import mm
+
+from agents.templating import CompiledTemplate
+from agents.pdf_fonts import FONTS
+
+SUBSET_CACHE_SIZE = 64
+_SUBSETS = OrderedDict()  # (폰트 파일 식별자, 글자 배열) -> (원본 길이, 압축된 서브셋 폰트)
+_LOCK = threading.Lock()
+
+
+class SubsetCachingFace(TTFontFace):
+    """
+    같은 글자 배열의 서브셋 폰트 스트림(압축까지 끝난 것)을 문서 간에 재사용하는 TTF face.
+    템플릿 골격 전용 폰트에만 사용 -> 골격 글자는 보고서마다 같으므로 항상 캐시 적중
+    """
+
+    def font_id(self):
+        """폰트 파일 식별자 (경로 + 테이블별 체크섬) - 다른 TTF 가 같은 글자 배열을 써도 서브셋을 섞지 않음"""
+        font_id = getattr(self, "_font_id", None)
+        if font_id is None:
+            checksums = tuple(sorted((tag, t['checksum']) for tag, t in self.table.items()))
+            font_id = self._font_id = (self.filename, checksums)
+        return font_id
+
+    def addSubsetObjects(self, doc, fontname, subset):
+        key = (self.font_id(), tuple(subset))
+        with _LOCK:
+            cached = _SUBSETS.get(key)
+            if cached is not None:
+                _SUBSETS.move_to_end(key)
+        if cached is None:
+            raw = self.makeSubset(subset)
+            cached = (len(raw), zlib.compress(raw))
+            with _LOCK:
+                _SUBSETS[key] = cached
+                while len(_SUBSETS) > SUBSET_CACHE_SIZE:
+                    _SUBSETS.popitem(last=False)
+
+        # 이하 ReportLab TTFontFace.addSubsetObjects 와 같은 구성 (폰트 스트림만 미리 압축된 것 사용)
+        fontFile = pdfdoc.PDFStream()
+        fontFile.content = cached[1]
+        fontFile.dictionary['Length1'] = cached[0]
+        fontFile.dictionary['Filter'] = pdfdoc.PDFName('FlateDecode')
+        fontFileRef = doc.Reference(fontFile, 'fontFile:%s(%s)' % (self.filename, fontname))
+
+        flags = (self.flags & ~FF_NONSYMBOLIC) | FF_SYMBOLIC
+        fontDescriptor = pdfdoc.PDFDictionary({
+            'Type': '/FontDescriptor',
+            'Ascent': self.ascent,
+            'CapHeight': self.capHeight,
+            'Descent': self.descent,
+            'Flags': flags,
+            'FontBBox': pdfdoc.PDFArray(self.bbox),
+            'FontName': pdfdoc.PDFName(fontname),
+            'ItalicAngle': self.italicAngle,
+            'StemV': self.stemV,
+            'FontFile2': fontFileRef,
+            'MissingWidth': self.defaultWidth,
+        })
+        return doc.Reference(fontDescriptor, 'fontDescriptor:' + fontname)
+
+
+def _template_font(family, suffix, fallback, cache_subsets, ascii_readable):
+    name = f"{family}-{suffix}"
+    if name in pdfmetrics.getRegisteredFontNames():
+        return name
+    ttf_path = FONTS.path(family)
+    if ttf_path is None:
+        return fallback
+    with _LOCK:
+        if name not in pdfmetrics.getRegisteredFontNames():
+            font = TTFont(name, ttf_path, asciiReadable=ascii_readable)
+            # ReportLab 은 같은 face 이름의 폰트를 하나로 합쳐 등록하므로 face 이름을 구분
+            font.face.name = font.face.name + b"-" + suffix.encode()
+            if cache_subsets:
+                font.face.__class__ = SubsetCachingFace  # 파싱된 face 는 그대로 두고 서브셋 출력만 교체
+            pdfmetrics.registerFont(font)
+    return name
+
+
+def static_font(family, fallback='Helvetica'):
+    """골격/고정 문구용 폰트: 같은 TTF 를 별도 이름으로 등록해 서브셋 글자가 보고서마다 같도록 (-> 캐시 적중)
+    기본 ASCII 128자는 미리 넣지 않음 (실제 쓰인 글자만 -> 기존 보고서와 같은 크기)"""
+    return _template_font(family, "Static", fallback, cache_subsets=True, ascii_readable=False)
+
+
+def field_font(family, fallback='Helvetica'):
+    """물건별 값 전용 폰트: 서브셋이 실제 쓰인 글자(수십 자)뿐이라 보고서마다 새로 만들어도 가벼움"""
+    return _template_font(family, "Fields", fallback, cache_subsets=False, ascii_readable=False)
+
+
+class ReportTemplate:
+    """
+    ReportLab 보고서 템플릿.
+    물건마다 같은 정적 골격(헤더, 타이틀, 회색 박스, 섹션 제목, 제언 문단, 면책 문구)은 문서당 1번만 그려
+    Form XObject 로 저장하고, 페이지마다 doForm 으로 재사용한 뒤 물건별 값(필드)만 덧그립니다.
+    레이아웃과 필드 템플릿은 생성 시 1회만 계산/파싱하고, 골격 글자의 서브셋 폰트는 문서 간에도 재사용합니다.
+
+    static: [("text", x, y, 크기, 문자열, 정렬) | ("line", x1, y1, x2, y2) | ("rect", x, y, w, h, (r, g, b))
+             | ("color", (r, g, b))]
+    fields: [(x, y, 크기, "str.format 템플릿", 정렬)]  정렬: "left" | "right" | "center"
+            템플릿의 고정 문구는 골격 폰트로, 값만 필드 폰트로 그립니다.
+    """
+
+    def __init__(self, name, static, fields, pagesize=A4, font='NanumGothic', fallback_font='Helvetica'):
+        self.name = name
+        self.form_name = f"tpl_{name}"
+        self.static = list(static)
+        self.fields = [(x, y, size, CompiledTemplate(source), align) for x, y, size, source, align in fields]
+        self.pagesize = pagesize
+        self.font = font
+        self.fallback_font = fallback_font
+
+    @staticmethod
+    def _text(c, x, y, text, align):
+        if align == "right":
+            c.drawRightString(x, y, text)
+        elif align == "center":
+            c.drawCentredString(x, y, text)
+        else:
+            c.drawString(x, y, text)
+
+    def _draw_static(self, c, font_name):
+        size = None
+        for op in self.static:
+            kind = op[0]
+            if kind == "text":
+                _, x, y, font_size, text, align = op
+                if font_size != size:
+                    c.setFont(font_name, font_size)
+                    size = font_size
+                self._text(c, x, y, text, align)
+            elif kind == "line":
+                c.line(*op[1:])
+            elif kind == "rect":
+                _, x, y, w, h, rgb = op
+                c.setFillColorRGB(*rgb)
+                c.rect(x, y, w, h, fill=1, stroke=0)
+                c.setFillColorRGB(0, 0, 0)
+            elif kind == "color":
+                c.setFillColorRGB(*op[1])
+
+    def fonts(self):
+        """(골격용 폰트, 필드용 폰트)"""
+        FONTS.reportlab_font(self.font, fallback=self.fallback_font)  # TTF 경로 확인 (프로세스당 1회)
+        return static_font(self.font, self.fallback_font), field_font(self.font, self.fallback_font)
+
+    def draw_page(self, c, context, fonts=None):
+        """골격(문서당 1회 정의) + 물건별 필드로 1페이지 그리기"""
+        static_name, field_name = fonts or self.fonts()
+        if not c.hasForm(self.form_name):
+            c.beginForm(self.form_name)
+            self._draw_static(c, static_name)
+            c.endForm()
+        c.doForm(self.form_name)
+        for x, y, font_size, template, align in self.fields:
+            segments = [(text, static_name if literal else field_name)
+                        for text, literal in template.render_parts(context) if text]
+            if align != "left":
+                width = sum(pdfmetrics.stringWidth(text, font, font_size) for text, font in segments)
+                x -= width if align == "right" else width / 2
+            t = c.beginText(x, y)
+            for text, font in segments:
+                t.setFont(font, font_size)
+                t.textOut(text)
+            c.drawText(t)
+        c.showPage()
+
+    def render(self, context):
+        """보고서 1건 -> PDF 버퍼 (BytesIO)"""
+        buffer = io.BytesIO()
+        c = canvas.Canvas(buffer, pagesize=self.pagesize)
+        self.draw_page(c, context)
+        c.save()
+        buffer.seek(0)
+        return buffer
+
+
+def _universe_template():
+    """jisang_universe_ultimate 의 '부동산 5대 영역 종합 분석 보고서' 레이아웃"""
+    width, height = A4
+    line_height = 8 * mm
+    static = [
+        # 1. 헤더 (우측 상단)
+        ("text", width - 20 * mm, height - 20 * mm, 10, "Jisang AI Universe Report", "right"),
+        ("line", 20 * mm, height - 22 * mm, width - 20 * mm, height - 22 * mm),
+        # 2. 타이틀 (중앙)
+        ("text", width / 2, height - 50 * mm, 22, "부동산 5대 영역 종합 분석 보고서", "center"),
+        # 3. 기본 정보 박스 (연회색 배경)
+        ("rect", 20 * mm, height - 90 * mm, width - 40 * mm, 30 * mm, (0.95, 0.95, 0.95)),
+        ("text", 120 * mm, height - 80 * mm, 12, "분석 기관: 지상 AI 파트너스", "left"),
+    ]
+    fields = [
+        (25 * mm, height - 70 * mm, 12, "분석 대상: {address}", "left"),
+        (25 * mm, height - 80 * mm, 12, "발행 일자: {issued}", "left"),
+    ]
+
+    # 4. 핵심 분석 결과 (Body)
+    y_pos = height - 110 * mm
+    static.append(("text", 20 * mm, y_pos, 16, "1. 핵심 금융 및 세무 분석 (Fact Check)", "left"))
+    y_pos -= 10 * mm
+    for source in ("• [금융] 연간 이자 절감 예상액: {finance_saving:,} 원",
+                   "• [세무] 예상 취득세 (공장): {tax_est:,} 원 ({tax_rate}%)",
+                   "• [개발] 신축 분양 예상 수익: {dev_profit:,} 원 (ROI {dev_roi}%)",
+                   "• [위험] 발견된 권리 리스크: {restrictions}"):
+        fields.append((25 * mm, y_pos, 11, source, "left"))
+        y_pos -= line_height
+    y_pos -= 10 * mm
+
+    # 5. AI 솔루션
+    static.append(("text", 20 * mm, y_pos, 16, "2. AI 심층 솔루션 제언", "left"))
+    y_pos -= 8 * mm
+    for line in ("현재 해당 물건은 '신탁등기' 및 '압류' 리스크로 인해 일반적인 담보대출이 불가능합니다.",
+                 "지상 AI의 알고리즘은 [대부업 상환]과 [신탁 말소]를 동시에 진행하는",
+                 "'통합 대환 솔루션'을 최적의 해결책으로 제시합니다.",
+                 "이를 통해 연간 수천만 원의 금융 비용을 절감하고 자산 가치를 회복할 수 있습니다."):
+        static.append(("text", 25 * mm, y_pos, 11, line, "left"))
+        y_pos -= line_height
+
+    # 6. 푸터 (Disclaimer)
+    static.append(("color", (0.5, 0.5, 0.5)))
+    static.append(("text", width / 2, 20 * mm, 9, "[면책 조항] 본 보고서는 시뮬레이션 결과이며 법적 효력이 없습니다.", "center"))
+    return ReportTemplate("universe", static, fields)
+
+
+UNIVERSE_REPORT = _universe_template()
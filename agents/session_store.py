@@ -0,0 +1,99 @@
+import time
+import uuid
+import asyncio
+import threading
+from collections import OrderedDict
+
+from agents.chat_memory import ChatMemory
+
+
+class ChatSession:
+    """채팅 세션 1건 (물건 팩트 + 상한이 있는 대화 메모리)"""
+
+    def __init__(self, session_id, context, memory, now):
+        self.session_id = session_id
+        self.context = context
+        self.memory = memory
+        self.portfolio = None
+        self.created_at = now
+        self.last_seen = now
+        self.turns = 0
+        self.lock = asyncio.Lock()  # 같은 세션의 메시지는 순서대로 처리
+
+    def history(self):
+        return list(self.memory.recent)
+
+
+class SessionStore:
+    """
+    인메모리 세션 저장소 (LRU + TTL).
+    - 세션 수가 max_sessions 를 넘으면 가장 오래 사용하지 않은 세션부터 제거
+    - ttl_seconds 동안 요청이 없으면 만료 (조회 시 / sweep() 시 제거)
+    - 세션별 대화는 ChatMemory 로 최근 K턴 + 요약만 보관하여 메모리 상한 유지
+    """
+
+    def __init__(self, max_sessions=10000, ttl_seconds=1800, max_turns=6, max_turn_chars=1200,
+                 max_summary_chars=800, clock=time.monotonic):
+        self.max_sessions = max_sessions
+        self.ttl_seconds = ttl_seconds
+        self.memory_options = {"max_turns": max_turns, "max_turn_chars": max_turn_chars,
+                               "max_summary_chars": max_summary_chars}
+        self.clock = clock
+        self._sessions = OrderedDict()  # 마지막 사용 순서 (앞쪽이 가장 오래됨)
+        self._lock = threading.Lock()
+        self.stats = {"created": 0, "evicted_lru": 0, "expired": 0, "deleted": 0}
+
+    def __len__(self):
+        return len(self._sessions)
+
+    def create(self, context):
+        now = self.clock()
+        session = ChatSession(uuid.uuid4().hex, context, ChatMemory(**self.memory_options), now)
+        with self._lock:
+            self._sessions[session.session_id] = session
+            self.stats["created"] += 1
+            while len(self._sessions) > self.max_sessions:
+                self._sessions.popitem(last=False)
+                self.stats["evicted_lru"] += 1
+        return session
+
+    def get(self, session_id):
+        """세션 조회 (+ 사용 시각 갱신). 없거나 만료되었으면 None"""
+        now = self.clock()
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None:
+                return None
+            if now - session.last_seen > self.ttl_seconds:
+                del self._sessions[session_id]
+                self.stats["expired"] += 1
+                return None
+            session.last_seen = now
+            self._sessions.move_to_end(session_id)
+            return session
+
+    def delete(self, session_id):
+        with self._lock:
+            if self._sessions.pop(session_id, None) is None:
+                return False
+            self.stats["deleted"] += 1
+            return True
+
+    def sweep(self):
+        """만료 세션 정리. LRU 순서 = 마지막 사용 순서이므로 앞에서부터 만료된 것만 확인"""
+        cutoff = self.clock() - self.ttl_seconds
+        removed = 0
+        with self._lock:
+            while self._sessions:
+                session_id, session = next(iter(self._sessions.items()))
+                if session.last_seen >= cutoff:
+                    break
+                del self._sessions[session_id]
+                removed += 1
+            self.stats["expired"] += removed
+        return removed
+
+    def report(self):
+        with self._lock:
+            return dict(self.stats, active=len(self._sessions), max_sessions=self.max_sessions,
+                        ttl_seconds=self.ttl_seconds)
@@ -0,0 +1,161 @@
+import io
+import os
+import csv
+import time
+from itertools import chain, islice
+
+# 분석 결과(FactChecker.process) 열 타입 - 나머지 열(주소, 권리제한 목록 등)은 문자열로 기록
+COLUMN_TYPES = {"ltv": float, "total": int, "saved": int, "count": int, "score": int}
+XLSX_MAX_ROWS = 1_048_576  # 엑셀 시트당 최대 행 (머리글 포함) - 넘으면 다음 시트로
+FORMATS = {"csv": "text/csv", "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+           "parquet": "application/vnd.apache.parquet"}
+
+
+def _cell(column, value):
+    if value is None:
+        return None
+    kind = COLUMN_TYPES.get(column)
+    if kind is not None:
+        return kind(value)
+    return value if isinstance(value, str) else str(value)  # 목록/사전은 pandas to_csv 와 같은 표기
+
+
+def _peek_columns(rows, columns):
+    """열 목록이 없으면 첫 행의 키 사용 (첫 행은 다시 앞에 붙여서 반환)"""
+    rows = iter(rows)
+    if columns is not None:
+        return list(columns), rows
+    first = next(rows, None)
+    if first is None:
+        return [], rows
+    return list(first), chain([first], rows)
+
+
+def _chunks(rows, size):
+    while True:
+        chunk = list(islice(rows, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def iter_csv(rows, columns=None, chunk_rows=1_000):
+    """
+    행(dict) 제너레이터 -> CSV bytes 조각 (UTF-8 BOM 포함, 엑셀에서 한글이 깨지지 않도록).
+    chunk_rows 행씩 인코딩하므로 메모리는 행 수와 무관합니다. (응답 스트림에 바로 쓰는 용도)
+    """
+    columns, rows = _peek_columns(rows, columns)
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator=os.linesep)
+    writer.writerow(columns)
+    yield buffer.getvalue().encode("utf-8-sig")
+    for chunk in _chunks(rows, chunk_rows):
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows([["" if (v := _cell(c, row.get(c))) is None else v for c in columns] for row in chunk])
+        yield buffer.getvalue().encode("utf-8")
+
+
+def write_xlsx(rows, out, columns=None, sheet_name="Portfolio"):
+    """openpyxl write-only 모드: 행을 바로 임시 파일로 내보내 메모리 일정. 시트 최대 행을 넘으면 Portfolio_2.. 로 이어 씀"""
+    # openpyxl/pyarrow 는 쓸 때만 import (ReportEngine 을 불러오는 모든 화면이 수십 MB 를 더 쓰지 않도록)
+    try:
+        import openpyxl
+    except ImportError:
+        raise ImportError("XLSX 내보내기에는 openpyxl 이 필요합니다 (pip install openpyxl)") from None
+    columns, rows = _peek_columns(rows, columns)
+    wb = openpyxl.Workbook(write_only=True)
+    sheets = 0
+    ws = None
+    written = XLSX_MAX_ROWS
+    for row in rows:
+        if written >= XLSX_MAX_ROWS:
+            sheets += 1
+            ws = wb.create_sheet(sheet_name if sheets == 1 else f"{sheet_name}_{sheets}")
+            ws.append(columns)
+            written = 1
+        ws.append([_cell(c, row.get(c)) for c in columns])
+        written += 1
+    if ws is None:
+        wb.create_sheet(sheet_name).append(columns)
+    wb.save(out)
+
+
+def _arrow_schema(pa, columns):
+    types = {float: pa.float64(), int: pa.int64()}
+    return pa.schema([(c, types.get(COLUMN_TYPES.get(c), pa.string())) for c in columns])
+
+
+def write_parquet(rows, out, columns=None, row_group_rows=20_000):
+    """
+    row_group_rows 행씩 Parquet row group 으로 기록 (열 타입 고정: ltv float64, total/saved int64).
+    행(dict)을 모아 두지 않고 열별 값 목록만 쌓았다가 row group 단위로 내보냅니다.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Parquet 내보내기에는 pyarrow 가 필요합니다 (pip install pyarrow)") from None
+    columns, rows = _peek_columns(rows, columns)
+    schema = _arrow_schema(pa, columns)
+    buffers = [[] for _ in columns]
+
+    def flush():
+        arrays = [pa.array(values, type=field.type) for values, field in zip(buffers, schema)]
+        writer.write_table(pa.Table.from_arrays(arrays, schema=schema))
+        for values in buffers:
+            values.clear()
+
+    with pq.ParquetWriter(out, schema, compression="snappy") as writer:
+        pending = 0
+        for row in rows:
+            for values, c in zip(buffers, columns):
+                values.append(_cell(c, row.get(c)))
+            pending += 1
+            if pending >= row_group_rows:
+                flush()
+                pending = 0
+        if pending:
+            flush()
+
+
+def _counting(rows, done):
+    count = 0
+    for row in rows:
+        count += 1
+        yield row
+    done(count)
+
+
+def export_rows(rows, out, fmt="csv", columns=None):
+    """
+    분석 결과 행(dict)의 iterable/제너레이터를 CSV/XLSX/Parquet 로 기록.
+    - out: 파일 경로 또는 쓰기 가능한 바이너리 스트림
+    - 행은 한 번만 순회하며 묶음 단위로 기록하므로 최대 메모리는 행 수와 무관
+    반환: {"rows", "format", "seconds"}
+    """
+    start = time.perf_counter()
+    result = {"rows": 0}
+    rows = _counting(rows, lambda n: result.update(rows=n))
+    if fmt == "csv":
+        if hasattr(out, "write"):
+            for data in iter_csv(rows, columns):
+                out.write(data)
+        else:
+            with open(out, "wb") as f:
+                for data in iter_csv(rows, columns):
+                    f.write(data)
+    elif fmt == "xlsx":
+        write_xlsx(rows, out, columns)
+    elif fmt == "parquet":
+        write_parquet(rows, out, columns)
+    else:
+        raise ValueError(f"지원하지 않는 형식: {fmt} (csv / xlsx / parquet)")
+    return dict(result, format=fmt, seconds=round(time.perf_counter() - start, 3))
+
+
+def export_bytes(rows, fmt="csv", columns=None):
+    """소량(대시보드 다운로드 버튼 등)용: 결과를 bytes 로 반환"""
+    buffer = io.BytesIO()
+    export_rows(rows, buffer, fmt, columns)
+    return buffer.getvalue()
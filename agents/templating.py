@@ -0,0 +1,64 @@
+import json
+import hashlib
+from string import Formatter
+
+# --------------------------------------------------------------------------------
+# 답변/보고서 공용 템플릿 도구 (챗봇 의도 테이블과 PDF/HTML 보고서 모듈이 함께 사용)
+# 의도 테이블(data/intents.json) 컴파일 없이 가져올 수 있도록 agents/intent_registry 와 분리
+# --------------------------------------------------------------------------------
+
+
+def context_fingerprint(context):
+    """물건 팩트(context)의 내용 해시 - 팩트가 바뀌면 값이 달라져 캐시가 자연히 무효화됨"""
+    payload = json.dumps(context, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha1(payload.encode('utf-8')).hexdigest()
+
+
+def build_bonds_list(context):
+    return "\n".join(f"- **{b['bank']}**: {b['amount']:,}원 ({b['date']} 설정)" for b in context.get('raw_bonds', []))
+
+
+# 컨텍스트에 없는 파생 필드 (템플릿이 참조할 때만 계산)
+FIELD_BUILDERS = {
+    "bonds_list": build_bonds_list,
+}
+
+
+class CompiledTemplate:
+    """
+    str.format 문법 템플릿을 로딩 시 1회 파싱해 두고, 요청마다 값만 채워 넣습니다.
+    필드는 단순 키만 지원 ({saved:,} 등 포맷 지정은 가능)
+    """
+
+    def __init__(self, source):
+        self.source = source
+        self.parts = []
+        for literal, field, spec, conversion in Formatter().parse(source):
+            if literal:
+                self.parts.append((literal, None, None))
+            if field is not None:
+                if not field or conversion:
+                    raise ValueError(f"지원하지 않는 템플릿 필드: {{{field}}}")
+                self.parts.append((None, field, spec or ""))
+        self.fields = {field for _, field, _ in self.parts if field is not None}
+
+    def render(self, context):
+        out = []
+        for literal, field, spec in self.parts:
+            if field is None:
+                out.append(literal)
+                continue
+            value = context[field] if field in context else FIELD_BUILDERS[field](context)
+            out.append(format(value, spec))
+        return "".join(out)
+
+    def render_parts(self, context):
+        """[(문자열, 고정 문구 여부)] - 고정 문구와 값을 다른 폰트로 그리는 PDF 템플릿용 (agents/report_template)"""
+        out = []
+        for literal, field, spec in self.parts:
+            if field is None:
+                out.append((literal, True))
+                continue
+            value = context[field] if field in context else FIELD_BUILDERS[field](context)
+            out.append((format(value, spec), False))
+        return out
@@ -3,7 +3,8 @@ import pandas as pd
 import time
 import textwrap
 import urllib.parse
-from datetime import datetime
+
+from agents.report_html import reports_html
 
 # 1. 페이지 설정
 st.set_page_config(page_title="지상 AI Pro v17.0", layout="wide", page_icon="🏗️")
@@ -85,28 +86,8 @@ def analyze_batch_item(row):
     roi = 15.2 if balance >= 0 else 3.5
     score = 80 - (30 if data['건축물']['위반여부'] else 0) + (10 if balance >= 0 else -10)
     
-    return {"주소": row['주소'], "용도": row['용도'], "점수": score, "ROI": roi, "비용": round(total_cost, 2), "데이터": data}
-
-def create_report_html(item):
-    d = item['데이터']
-    b_stat = "<span class='bdg bdg-ok'>적법</span>" if not d['건축물']['위반여부'] else "<span class='bdg bdg-no'>위반건축물</span>"
-    parts = [
-        '<div class="report-wrapper">',
-        '<div class="r-header">',
-        f'<div><div class="r-title">부동산 가치 분석 보고서</div><div>Target: {item["주소"]}</div></div>',
-        f'<div style="text-align:right; font-size:11px;">DATE: {datetime.now().strftime("%Y-%m-%d")}<br>REF: JA-BIZ-{int(time.time())}</div>',
-        '</div>',
-        f'<div style="background:#f1f5f9; padding:15px; border-radius:8px; margin-bottom:20px;">',
-        f'<div style="font-size:36px; font-weight:900; color:#1e3a8a;">{item["점수"]}점 <span style="font-size:16px;">(ROI {item["ROI"]}%)</span></div>',
-        f'<div style="margin-top:5px; font-size:13px;">💡 <b>AI 제안:</b> {d["권리"]["리스크"]}</div></div>',
-        '<table class="r-table">',
-        f'<tr><th>면적/지목</th><td>{d["토지"]["면적"]} / {d["토지"]["지목"]}</td><th>공시지가</th><td>{d["토지"]["공시지가"]}</td></tr>',
-        f'<tr><th>용도지역</th><td>{d["토지"]["용도지역"]}</td><th>규제사항</th><td>{", ".join(d["토지"]["규제"])}</td></tr>',
-        f'<tr><th>건물용도</th><td>{d["건축물"]["주용도"]}</td><th>위반여부</th><td>{b_stat}</td></tr>',
-        f'<tr><th>소유자</th><td>{d["권리"]["소유자"]}</td><th>채권최고액</th><td>{d["권리"]["채권"]}</td></tr>',
-        '</table></div>'
-    ]
-    return "".join(parts)
+    return {"주소": row['주소'], "용도": row['용도'], "점수": score, "ROI": roi, "비용": round(total_cost, 2), "데이터": data,
+            "분석시각": int(time.time())}
 
 # [카카오톡 공유 링크 생성]
 def get_kakao_link(item):
@@ -199,10 +180,14 @@ if st.session_state['final_results'] is not None:
         st.warning("아래 버튼을 누르면 인쇄용 뷰가 펼쳐집니다. [Ctrl + P]로 PDF 저장하세요.")
         
         if st.checkbox("📄 전체 리포트 뷰어 열기"):
-            full_html = ""
-            for i, row in df.iterrows():
-                full_html += create_report_html(row)
-            st.markdown(full_html, unsafe_allow_html=True)
+            # 보고서 조각은 내용 기준으로 캐시 -> 체크박스/페이지 이동으로 재실행돼도 현재 페이지만 join 1회
+            v1, v2 = st.columns(2)
+            per_page = v1.selectbox("페이지당 보고서 수", [10, 20, 50, 100], key="report_per_page")
+            total_pages = max(1, -(-len(df) // per_page))
+            page = v2.number_input(f"페이지 (1~{total_pages})", 1, total_pages, 1, key="report_page")
+            rows = df.iloc[(page - 1) * per_page:page * per_page].to_dict('records')
+            st.caption(f"{len(df)}건 중 {(page - 1) * per_page + 1}~{(page - 1) * per_page + len(rows)}번째 보고서")
+            st.markdown(reports_html(rows), unsafe_allow_html=True)
 
 else:
     st.info("👈 사이드바에서 [엑셀 로드] 후 분석을 시작하세요.")
\ No newline at end of file
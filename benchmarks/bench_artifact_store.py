@@ -0,0 +1,67 @@
+import os
+import sys
+import time
+import shutil
+import tempfile
+import warnings
+
+# [경로 설정] 프로젝트 루트의 agents 모듈 로딩
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+
+from agents.artifact_store import ArtifactStore
+from agents.pdf_fonts import FONTS, FPDF
+
+FACTS = {"finance_saving": 60_000_000, "tax_est": 39_100_000, "tax_rate": 4.6, "dev_profit": 1_965_000_000,
+         "dev_roi": 72.5, "restrictions": "신탁등기, 압류"}
+RERUNS = 200  # Streamlit 재실행 횟수 (채팅 입력/위젯 클릭)
+
+warnings.filterwarnings("ignore")  # fpdf 1.7 의 cmap 경고 (벤치마크 출력 정리용)
+
+
+def korean_pdf(address, context):
+    """jisang_universe_universal.generate_korean_pdf 와 같은 구성의 한글 PDF"""
+    pdf = FPDF()
+    font_name = FONTS.attach(pdf, 'NanumGothic', fallback='Arial')
+    pdf.add_page()
+    pdf.set_font(font_name, '', 20)
+    pdf.cell(0, 15, "부동산 5대 영역 종합 분석 보고서", ln=1, align='C')
+    pdf.set_font(font_name, '', 12)
+    pdf.cell(0, 10, f"분석 대상: {address}", ln=1)
+    pdf.set_font(font_name, '', 11)
+    for line in (f"[금융] 연간 이자 절감액: {context['finance_saving']:,} 원",
+                 f"[세무] 예상 취득세: {context['tax_est']:,} 원 ({context['tax_rate']}%)",
+                 f"[개발] 예상 분양 수익: {context['dev_profit']:,} 원 (ROI {context['dev_roi']}%)",
+                 f"[리스크] 발견된 권리하자: {context['restrictions']}"):
+        pdf.cell(0, 8, line, ln=1)
+    pdf.multi_cell(0, 7, f"현재 해당 물건은 {context['restrictions']} 등의 권리 리스크가 존재하여 일반적인 매매나 대출 실행이 어렵습니다.")
+    return pdf.output(dest='S').encode('latin-1')
+
+
+def timed(fn):
+    start = time.perf_counter()
+    for _ in range(RERUNS):
+        fn()
+    return (time.perf_counter() - start) * 1000 / RERUNS
+
+
+if __name__ == "__main__":
+    os.chdir(ROOT)
+    FONTS.register('NanumGothic', 'NanumGothic.ttf')
+    workdir = tempfile.mkdtemp(prefix="jisang_artifacts_")
+    try:
+        store = ArtifactStore(workdir, max_bytes=4 * 1024 * 1024)
+        address = "김포시 통진읍 도사리 163-1"
+        inputs = {"address": address, "context": FACTS, "date": "2026-10-19"}
+        korean_pdf(address, FACTS)  # 워밍업 (폰트/서브셋 캐시)
+        rebuild_ms = timed(lambda: korean_pdf(address, FACTS))
+        stored_ms = timed(lambda: store.fetch("universe_pdf", 1, inputs, lambda: korean_pdf(address, FACTS), "pdf"))
+        print(f"🔁 재실행 {RERUNS}회 | 매번 생성 {rebuild_ms:.2f}ms/회 | 저장소 {stored_ms:.3f}ms/회 {store.report()}")
+
+        # 용량 한도: 서로 다른 입력 1,000건을 넣어도 폴더는 한도 이하로 유지
+        for i in range(1000):
+            store.fetch("universe_pdf", 1, dict(inputs, address=f"필지-{i}"), lambda: korean_pdf(f"필지-{i}", FACTS), "pdf")
+        print(f"🧹 1,000건 저장 후 {store.report()} (한도 {store.max_bytes / 1024:,.0f}KB)")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
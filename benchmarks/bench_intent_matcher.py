@@ -0,0 +1,77 @@
+import os
+import sys
+import time
+import random
+
+# [경로 설정] 프로젝트 루트의 agents 모듈 로딩
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+
+from agents.intent_matcher import IntentMatcher
+from agents.intent_registry import REGISTRY
+
+# 실제 상담 로그와 비슷한 길이/분포의 메시지 생성용 문구
+PHRASES = [
+    "안녕하세요", "이 물건", "공장용지", "김포시 통진읍", "얼마나", "계산해줘", "궁금합니다",
+    "이자", "대환", "취득세", "양도", "개발하면", "분양", "신탁등기", "압류", "메뉴", "도와줘",
+    "언제쯤", "가능한가요", "법인 명의로", "매수하려고", "근저당", "설정일",
+]
+
+
+def make_messages(n, seed=2026):
+    rng = random.Random(seed)
+    return [" ".join(rng.choice(PHRASES) for _ in range(rng.randint(2, 8))) for _ in range(n)]
+
+
+def make_intents(extra, seed=7):
+    """기본 의도 테이블 + 가상의 추가 의도 (의도 수 증가에 따른 비용 비교용)"""
+    rng = random.Random(seed)
+    syllables = [chr(c) for c in range(0xAC00, 0xD7A4, 97)]
+    intents = [dict(it) for it in REGISTRY.bot("universe").intents]
+    for i in range(extra):
+        keywords = ["".join(rng.choice(syllables) for _ in range(rng.randint(2, 3))) for _ in range(8)]
+        intents.append({"name": f"extra_{i}", "priority": len(intents), "keywords": keywords})
+    return intents
+
+
+def make_legacy_route(intents):
+    ordered = sorted(intents, key=lambda it: it['priority'])
+
+    def legacy_route(text):
+        # 기존 방식: 규칙마다 any(k in text ...) 로 메시지를 반복 스캔
+        for intent in ordered:
+            if any(k in text for k in intent['keywords']):
+                return intent['name']
+        return None
+
+    return legacy_route
+
+
+def bench(name, fn, messages):
+    start = time.perf_counter()
+    for m in messages:
+        fn(m)
+    elapsed = time.perf_counter() - start
+    print(f"{name:<22} {elapsed:7.2f}s  {len(messages) / elapsed:>12,.0f} msg/s")
+    return elapsed
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    messages = make_messages(n)
+    print(f"📨 메시지 {n:,}건 라우팅 벤치마크")
+
+    for extra in (0, 20, 100):
+        intents = make_intents(extra)
+        legacy_route = make_legacy_route(intents)
+        matcher = IntentMatcher(intents)
+        keyword_count = sum(len(it['keywords']) for it in intents)
+
+        # 두 방식의 결과가 같은지 먼저 확인
+        mismatch = sum(1 for m in messages[:10000] if legacy_route(m) != matcher.match(m))
+        print("-" * 60)
+        print(f"의도 {len(intents)}개 / 키워드 {keyword_count}개 (검증 불일치: {mismatch}건)")
+        legacy = bench("legacy any() chain", legacy_route, messages)
+        fast = bench("Aho-Corasick matcher", matcher.match, messages)
+        print(f"⚡ 속도 비율: x{legacy / fast:.2f}")
@@ -0,0 +1,85 @@
+import os
+import sys
+import time
+import random
+
+# [경로 설정] 프로젝트 루트의 agents 모듈 로딩
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+
+from agents.intent_registry import IntentTable, REGISTRY
+from agents.korean_text import decompose
+
+# 실제 상담 로그에서 자주 보이는 입력 변형 (띄어쓰기 / 자모 분리 / 자모 오타)
+FILLERS = ["이 물건", "혹시", "가능한가요", "알려줘", "궁금해요", "문의드립니다"]
+# 키워드와 한 자모 차이이거나 음절을 걸쳐 키워드가 만들어지는 일상 문장 -> 어떤 의도로도 가면 안 됨
+NEGATIVES = ["이 땅에 대한 설명 부탁해", "대화 내용 정리해줘", "어떤 분야 전문이야", "대한민국 어디든 가능해?",
+             "대화가 끊겼어요", "분야별로 정리해줘", "지난번에 도와준 분 연결해줘"]
+
+
+def split_spacing(keyword, rng):
+    i = rng.randint(1, len(keyword) - 1)
+    return keyword[:i] + " " + keyword[i:]
+
+
+def split_final(keyword, rng):
+    # '대환' -> '대화ㄴ' (받침을 따로 친 경우)
+    jamo = decompose(keyword[-1])
+    return keyword if len(jamo) < 3 else keyword[:-1] + chr(ord(keyword[-1]) - _final_index(keyword[-1])) + jamo[-1]
+
+
+def _final_index(syllable):
+    return (ord(syllable) - 0xAC00) % 28
+
+
+def vowel_typo(keyword, rng):
+    i = rng.randrange(len(keyword))
+    code = ord(keyword[i]) - 0xAC00
+    cho, rest = divmod(code, 21 * 28)
+    jung, jong = divmod(rest, 28)
+    jung = (jung + rng.choice([-1, 1])) % 21
+    return keyword[:i] + chr(0xAC00 + (cho * 21 + jung) * 28 + jong) + keyword[i + 1:]
+
+
+VARIANTS = {"띄어쓰기": split_spacing, "받침 분리": split_final, "모음 오타": vowel_typo}
+
+
+def make_cases(table, n, seed=2026):
+    rng = random.Random(seed)
+    cases = []
+    keywords = [(it['name'], k) for it in table.intents for k in it['keywords'] if len(k) >= 2]
+    for _ in range(n):
+        name, keyword = rng.choice(keywords)
+        kind = rng.choice(list(VARIANTS))
+        text = f"{rng.choice(FILLERS)} {VARIANTS[kind](keyword, rng)} {rng.choice(FILLERS)}"
+        cases.append((kind, name, text))
+    return cases
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+    for bot in ("universe", "hybrid"):
+        spec = {"intents": REGISTRY.bot(bot).intents, "fallback": None}
+        table = IntentTable(bot, spec, REGISTRY.dictionary)
+        cases = make_cases(table, n)
+
+        legacy_hits = {kind: 0 for kind in VARIANTS}
+        totals = {kind: 0 for kind in VARIANTS}
+        correct = {kind: 0 for kind in VARIANTS}
+        start = time.perf_counter()
+        for kind, name, text in cases:
+            totals[kind] += 1
+            legacy_hits[kind] += table.matcher.match(text) is not None
+            correct[kind] += table.match(text) == name
+        elapsed = time.perf_counter() - start
+
+        report = table.report()
+        print("-" * 60)
+        print(f"🤖 {bot}: 변형 메시지 {n:,}건 ({elapsed:.2f}s, {n / elapsed:,.0f} msg/s)")
+        for kind in VARIANTS:
+            print(f"  {kind:<6} 원문 매칭 {legacy_hits[kind] / totals[kind]:6.1%} -> 정규화 후 정답 {correct[kind] / totals[kind]:6.1%}")
+        print(f"  경로별 처리: {{exact: {report['exact']}, normalized: {report['normalized']}, fuzzy: {report['fuzzy']}}}")
+        print(f"  fallback 비율: {report['fallback_rate']:.1%} (원문 매칭만 사용 시 {1 - sum(legacy_hits.values()) / n:.1%})")
+        misrouted = [(text, intent) for text in NEGATIVES if (intent := table.match(text)) is not None]
+        print(f"  일상 문장 오분류: {len(misrouted)}/{len(NEGATIVES)} {misrouted if misrouted else ''}")
@@ -0,0 +1,73 @@
+import os
+import sys
+import time
+import random
+import zipfile
+from datetime import datetime
+
+# [경로 설정] 프로젝트 루트의 agents 모듈 로딩
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+
+from agents.markdown_bundle import export_markdown_bundle, report_name
+from bench_portfolio_export import CountingSink
+
+AI_TEXT = ("### 🚨 시스템 분석 요약\n* **진단**: 현재 **신탁등기** 및 **압류**가 확인되어 일반적인 매매나 대출이 제한될 수 있습니다.\n"
+           "* **솔루션**: 전문가를 통한 **신탁 말소** 및 **통합 대환** 솔루션이 필요합니다.\n")
+
+
+def make_reports(n, seed=2026):
+    rng = random.Random(seed)
+    return [{"address": f"경기도 김포시 통진읍 도사리 {i}-1",
+             "facts": {"ltv": round(rng.uniform(10, 95), 2), "total": rng.randint(1, 300) * 10_000_000,
+                       "count": rng.randint(1, 5), "saved": rng.randint(1, 30) * 1_000_000},
+             "ai_text": AI_TEXT} for i in range(n)]
+
+
+def legacy_markdown(address, facts, ai_text):
+    """기존 ReportGenerator.create_markdown (f-string, 건마다 datetime.now)"""
+    content = f"""
+# 부동산 종합 분석 리포트
+**대상**: {address}
+**작성일**: {datetime.now().strftime('%Y-%m-%d')}
+**분석툴**: Jisang AI Enterprise
+
+---
+## 1. 핵심 데이터 (Fact Check)
+* **LTV (담보비율)**: {facts['ltv']}%
+* **총 채권액**: {facts['total']:,} 원
+* **대환 타겟**: {facts['count']} 건
+* **연간 예상 절감액**: {facts['saved']:,} 원
+
+---
+## 2. AI 심층 컨설팅
+{ai_text}
+
+---
+## 3. 면책 조항
+본 리포트는 시뮬레이션 결과이며 법적 효력이 없습니다.
+"""
+    return content.encode('utf-8')
+
+
+def legacy_bundle(reports, out):
+    """Streamlit 스레드에서 한 건씩 만들어 ZIP 에 넣는 방식"""
+    with zipfile.ZipFile(out, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=6) as zf:
+        for i, r in enumerate(reports):
+            zf.writestr(report_name(i, r['address']), legacy_markdown(r['address'], r['facts'], r['ai_text']))
+
+
+if __name__ == "__main__":
+    workers = os.cpu_count() or 1
+    for n in (500, 5000):
+        reports = make_reports(n)
+        start = time.perf_counter()
+        legacy_bundle(reports, CountingSink())
+        legacy_rate = n / (time.perf_counter() - start)
+        line = [f"{n:>6,}건 | 기존 {legacy_rate:8,.0f}건/초"]
+        for fmt in ("zip", "tar.gz"):
+            for w in sorted({1, workers, 2}):
+                result = export_markdown_bundle(reports, CountingSink(), fmt, workers=w)
+                line.append(f"{fmt} x{w} {result['reports_per_sec']:8,.0f}건/초")
+        print(" | ".join(line))
@@ -0,0 +1,162 @@
+import os
+import re
+import sys
+import json
+import time
+import random
+import platform
+import argparse
+import resource
+import warnings
+import subprocess
+
+# [경로 설정] 프로젝트 루트의 agents 모듈 로딩
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+
+BASELINE_PATH = os.path.join(ROOT, "benchmarks", "baselines", "pdf_engines.json")
+REPORTS = 200  # 엔진별 생성 보고서 수 (워밍업 제외)
+# 기준값 대비 허용 증가율 - 넘으면 회귀로 보고 종료 코드 1
+TOLERANCE = {"ms_per_report": 0.30, "peak_rss_mb": 0.20, "bytes": 0.05}
+
+# 고정 입력 (같은 입력 -> 같은 크기의 출력. 보고서 번호 난수는 시드 고정)
+ADDRESS = "경기도 김포시 통진읍 도사리 163-1"
+ADDRESS_EN = "Dosa-ri 163-1, Tongjin-eup, Gimpo-si"  # 영문 엔진은 Arial(latin-1) 이라 한글 주소를 쓸 수 없음
+ISSUED = "2026년 10월 19일"
+FACTS = {"address": ADDRESS, "ltv": 82.35, "count": 3, "total": 1_400_000_000, "saved": 21_000_000, "score": 45,
+         "restrictions": ["신탁등기", "압류"], "zoning": "계획관리지역"}
+CONTEXT = {"finance_saving": 140_000_000, "tax_est": 64_400_000, "tax_rate": 4.6, "dev_profit": 1_965_000_000,
+           "dev_roi": 72.5, "restrictions": "신탁등기, 압류"}
+
+_PAGE = re.compile(rb"/Type\s*/Page(?![A-Za-z])")
+
+
+def _safe_pdf():
+    from agents.report_engine import ReportEngine
+    return lambda: ReportEngine.create_safe_pdf(FACTS)
+
+
+def _english_pdf():
+    from agents.report_generator import ReportGenerator
+    return lambda: ReportGenerator.create_english_pdf(ADDRESS_EN, FACTS)
+
+
+def _korean_fpdf():
+    from agents.pdf_fonts import FONTS
+    from agents.korean_pdf import generate_korean_pdf
+    FONTS.register('NanumGothic', os.path.join(ROOT, 'NanumGothic.ttf'))
+    return lambda: generate_korean_pdf(ADDRESS, CONTEXT)
+
+
+def _reportlab_template():
+    from agents.pdf_fonts import FONTS
+    from agents.report_template import UNIVERSE_REPORT
+    FONTS.register('NanumGothic', os.path.join(ROOT, 'NanumGothic.ttf'))
+    # jisang_universe_ultimate.generate_perfect_pdf 와 같은 호출 (발행 일자만 고정)
+    return lambda: UNIVERSE_REPORT.render(dict(CONTEXT, address=ADDRESS, issued=ISSUED))
+
+
+# 이름 -> (설명, 생성 함수를 돌려주는 준비 함수). 준비 함수 안에서만 import 해서 엔진별 메모리를 따로 잼
+ENGINES = {
+    "safe_pdf": ("fpdf ReportEngine.create_safe_pdf (영문)", _safe_pdf),
+    "english_pdf": ("fpdf ReportGenerator.create_english_pdf (영문)", _english_pdf),
+    "korean_fpdf": ("fpdf PDF + NanumGothic (generate_korean_pdf)", _korean_fpdf),
+    "reportlab_template": ("reportlab generate_perfect_pdf (템플릿)", _reportlab_template),
+}
+
+
+def run_engine(name, reports):
+    """현재 프로세스에서 한 엔진만 측정 (부모가 엔진마다 새 프로세스로 실행 -> 최대 RSS 가 섞이지 않음)"""
+    warnings.filterwarnings("ignore")  # fpdf 1.7 의 cmap 경고 (벤치마크 출력 정리용)
+    render = ENGINES[name][1]()
+    random.seed(2026)
+    data = render()  # 워밍업 (폰트 파싱/서브셋/템플릿 캐시)
+    start = time.perf_counter()
+    for _ in range(reports):
+        data = render()
+    seconds = time.perf_counter() - start
+    data = data.getvalue() if hasattr(data, "getvalue") else data  # reportlab 템플릿은 BytesIO 반환
+    pages = len(_PAGE.findall(data)) * reports
+    return {
+        "ms_per_report": round(seconds * 1000 / reports, 3),
+        "pages_per_sec": round(pages / seconds, 1),
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),  # Linux: KB 단위
+        "bytes": len(data),
+    }
+
+
+def measure(names, reports):
+    results = {}
+    for name in names:
+        out = subprocess.run([sys.executable, os.path.abspath(__file__), "--child", name, "--reports", str(reports)],
+                             capture_output=True, text=True)
+        if out.returncode != 0:
+            sys.exit(f"❌ {name} 엔진 실행 실패\n{out.stderr.strip()}")
+        results[name] = json.loads(out.stdout.strip().splitlines()[-1])
+    return results
+
+
+def compare(results, baseline):
+    """기준값보다 허용 범위 이상 나빠진 항목 목록"""
+    failures = []
+    for name, result in results.items():
+        base = baseline.get("engines", {}).get(name)
+        if base is None:
+            continue
+        for metric, tolerance in TOLERANCE.items():
+            limit = base[metric] * (1 + tolerance)
+            if result[metric] > limit:
+                failures.append(f"{name}.{metric}: {result[metric]:,} > 기준 {base[metric]:,} (+{tolerance:.0%} 허용)")
+    return failures
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="PDF 엔진별 보고서 생성 비용 (기준값 대비 회귀 검사)")
+    parser.add_argument("engines", nargs="*", choices=[[], *ENGINES], help="측정할 엔진 (기본: 전체)")
+    parser.add_argument("--reports", type=int, default=REPORTS)
+    parser.add_argument("--update-baseline", action="store_true", help="측정한 엔진의 결과를 기준값으로 저장")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_engine(args.child, args.reports)))
+        sys.exit(0)
+
+    results = measure(args.engines or list(ENGINES), args.reports)
+    for name, r in results.items():
+        print(f"{name:<20} {r['ms_per_report']:8.2f}ms/건 | {r['pages_per_sec']:8.1f} pages/s | "
+              f"최대 RSS {r['peak_rss_mb']:6.1f}MB | {r['bytes']:>7,} bytes  - {ENGINES[name][0]}")
+
+    if args.update_baseline:
+        # 측정한 엔진만 갱신 (나머지 엔진의 기준값은 그대로 - 바꾸지 않은 엔진의 회귀 기준이 느슨해지지 않도록)
+        engines = {}
+        if os.path.exists(BASELINE_PATH):
+            with open(BASELINE_PATH, encoding="utf-8") as f:
+                previous = json.load(f)
+            if previous.get("reports") == args.reports:
+                engines = previous.get("engines", {})
+            else:
+                print(f"⚠️ 기존 기준값의 보고서 수({previous.get('reports')})가 달라 측정한 엔진만 저장합니다")
+        engines.update(results)
+        baseline = {"machine": f"{platform.machine()} / Python {platform.python_version()} / CPU {os.cpu_count()}",
+                    "reports": args.reports, "engines": {name: engines[name] for name in ENGINES if name in engines}}
+        os.makedirs(os.path.dirname(BASELINE_PATH), exist_ok=True)
+        with open(BASELINE_PATH, "w", encoding="utf-8") as f:
+            json.dump(baseline, f, ensure_ascii=False, indent=2)
+            f.write("\n")
+        print(f"💾 기준값 저장: {os.path.relpath(BASELINE_PATH, ROOT)}")
+        sys.exit(0)
+
+    if not os.path.exists(BASELINE_PATH):
+        print("ℹ️ 기준값 없음 -> --update-baseline 으로 먼저 저장하세요")
+        sys.exit(0)
+    with open(BASELINE_PATH, encoding="utf-8") as f:
+        baseline = json.load(f)
+    failures = compare(results, baseline)
+    if failures:
+        print(f"❌ 성능 회귀 {len(failures)}건 (기준: {baseline['machine']})")
+        for line in failures:
+            print(f"   - {line}")
+        sys.exit(1)
+    print(f"✅ 기준값 대비 회귀 없음 (기준: {baseline['machine']})")
@@ -0,0 +1,109 @@
+import os
+import sys
+import glob
+import time
+import shutil
+import tempfile
+import warnings
+
+# [경로 설정] 프로젝트 루트의 agents 모듈 로딩
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+
+import fpdf
+from agents.pdf_fonts import FontRegistry, FPDF, IS_FPDF2, subset_cache_report
+
+FONT_PATH = os.path.join(ROOT, "NanumGothic.ttf")
+PAGE_COUNTS = (1, 10, 100)
+ROUNDS = 3
+
+warnings.filterwarnings("ignore")  # fpdf 1.7 의 cmap 경고 (벤치마크 출력 정리용)
+
+
+def _add_font(pdf, path):
+    if IS_FPDF2:
+        pdf.add_font('NanumGothic', '', path)
+    else:
+        pdf.add_font('NanumGothic', '', path, uni=True)
+
+
+def _fill(pdf, pages):
+    pdf.set_font('NanumGothic', '', 12)
+    for p in range(pages):
+        if p:
+            pdf.add_page()
+        for i in range(25):
+            pdf.cell(0, 9, f"{p + 1}쪽 {i + 1}행 - 공동담보 채권 / 대환 절감액 / 신탁등기 확인", 0, 1)
+
+
+def legacy_report(pages, font_path):
+    """기존 방식: 생성할 때마다 *.pkl 삭제 + header() 에서 매 페이지 add_font"""
+    for pkl in glob.glob(os.path.join(os.path.dirname(font_path), "*.pkl")):
+        os.remove(pkl)
+
+    class PDF(fpdf.FPDF):
+        def header(self):
+            _add_font(self, font_path)
+            self.set_font('NanumGothic', '', 10)
+            self.cell(0, 10, 'Jisang AI Universe Report', 0, 1, 'R')
+
+    pdf = PDF()
+    pdf.add_page()
+    _add_font(pdf, font_path)
+    _fill(pdf, pages)
+    return pdf
+
+
+def registry_report(pages, fonts):
+    """개선 방식: 프로세스당 1회 등록, 문서 생성 시 참조 연결, header() 는 set_font 만 (+ 글자 서브셋 캐시)"""
+    class PDF(FPDF):
+        def header(self):
+            self.set_font('NanumGothic', '', 10)
+            self.cell(0, 10, 'Jisang AI Universe Report', 0, 1, 'R')
+
+    pdf = PDF()
+    fonts.attach(pdf, 'NanumGothic')
+    pdf.add_page()
+    _fill(pdf, pages)
+    return pdf
+
+
+def measure(build, pages):
+    """(문서 구성 ms, 출력 포함 전체 ms) 평균 + PDF 크기"""
+    size = len(build(pages).output(dest='S'))  # 워밍업
+    layout = total = 0.0
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        pdf = build(pages)
+        mid = time.perf_counter()
+        pdf.output(dest='S')
+        end = time.perf_counter()
+        layout += mid - start
+        total += end - start
+    return layout / ROUNDS * 1000, total / ROUNDS * 1000, size
+
+
+if __name__ == "__main__":
+    if not os.path.exists(FONT_PATH):
+        sys.exit("NanumGothic.ttf 가 없습니다. 스크립트를 한 번 실행하여 폰트를 내려받으세요.")
+
+    workdir = tempfile.mkdtemp(prefix="jisang_font_bench_")
+    try:
+        legacy_font = shutil.copy(FONT_PATH, workdir)  # 기존 방식의 *.pkl 삭제가 저장소 파일에 닿지 않도록
+
+        fonts = FontRegistry()
+        start = time.perf_counter()
+        fonts.register('NanumGothic', FONT_PATH)
+        print(f"🔤 폰트 등록 (프로세스당 1회) {(time.perf_counter() - start) * 1000:.1f}ms")
+        print(f"TTF 원본 {os.path.getsize(FONT_PATH) / 1024:,.0f}KB")
+        print(f"{'페이지':>6} | {'기존 구성':>10} {'기존 전체':>10} | {'개선 구성':>10} {'개선 전체':>10} | {'PDF 크기':>8}")
+
+        for pages in PAGE_COUNTS:
+            old_layout, old_total, _ = measure(lambda n: legacy_report(n, legacy_font), pages)
+            new_layout, new_total, size = measure(lambda n: registry_report(n, fonts), pages)
+            print(f"{pages:>6} | {old_layout:8.1f}ms {old_total:8.1f}ms | {new_layout:8.1f}ms {new_total:8.1f}ms"
+                  f" | {size / 1024:6.0f}KB")
+        print(f"🧩 서브셋 캐시 {subset_cache_report()}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
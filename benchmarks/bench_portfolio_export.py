@@ -0,0 +1,61 @@
+import os
+import sys
+import time
+import random
+import tracemalloc
+
+# [경로 설정] 프로젝트 루트의 agents 모듈 로딩
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+
+from agents.report_engine import ReportEngine
+from agents.portfolio_export import export_pdf_zip
+
+
+class CountingSink:
+    """seek 불가능한 응답 스트림 흉내 (받은 바이트 수만 셈)"""
+    closed = False  # pyarrow 등 파일 객체 상태를 확인하는 writer 용
+
+    def __init__(self):
+        self.size = 0
+
+    def write(self, data):
+        self.size += len(data)
+        return len(data)
+
+    def flush(self):
+        pass
+
+
+def make_facts(n, seed=2026):
+    rng = random.Random(seed)
+    facts = []
+    for i in range(n):
+        total = rng.randint(1, 60) * 10_000_000
+        facts.append({"address": f"경기도 김포시 필지-{i}", "ltv": round(rng.uniform(20, 120), 2),
+                      "total": total, "saved": int(total * 0.03), "score": rng.randint(20, 100)})
+    return facts
+
+
+if __name__ == "__main__":
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    facts = make_facts(n)
+    cores = os.cpu_count() or 1
+
+    # 기존 방식: Streamlit 스레드에서 한 건씩 생성
+    start = time.perf_counter()
+    for f in facts:
+        ReportEngine.create_safe_pdf(f)
+    print(f"📄 순차 생성 {n:,}건: {time.perf_counter() - start:.2f}s")
+
+    for workers in sorted({1, 2, cores}):
+        sink = CountingSink()
+        result = export_pdf_zip(facts, sink, workers=workers)
+        tracemalloc.start()  # 메모리는 별도 실행으로 측정 (tracemalloc 이 시간 측정을 왜곡하지 않도록)
+        export_pdf_zip(facts, CountingSink(), workers=workers)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"📦 ZIP 스트리밍 workers={workers}: {result['seconds']:.2f}s "
+              f"({n / result['seconds']:,.0f} PDF/s) | ZIP {sink.size / 1024:,.0f}KB | 메인 프로세스 최대 할당 {peak / 1024:,.0f}KB")
+    print(f"(CPU 코어 {cores}개)")
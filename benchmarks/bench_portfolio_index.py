@@ -0,0 +1,102 @@
+import os
+import sys
+import time
+import random
+
+# [경로 설정] 프로젝트 루트의 agents 모듈 로딩
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+
+from agents.portfolio_index import PortfolioIndex
+
+RESTRICTIONS = ["신탁등기", "압류", "가압류", "가등기", "임차권", "경매개시결정"]
+LENDERS = [("국민은행", "1금융"), ("우리은행", "1금융"), ("신한은행", "1금융"), ("새마을금고", "2금융"),
+           ("농협", "2금융"), ("러시앤캐시", "대부업"), ("산와머니", "대부업")]
+ZONINGS = ["계획관리지역", "자연녹지지역", "보전관리지역", "제2종일반주거지역", "일반공업지역"]
+
+QUESTIONS = [
+    "내 물건 중 신탁등기 있고 LTV 70% 넘는 필지는?",
+    "내 물건 중 압류 없고 LTV 60% 이하인 필지는?",
+    "포트폴리오에서 대부업 또는 새마을금고 채권 있는 물건",
+    "계획관리지역 물건 중 가압류 있는 것",
+    "포트폴리오에서 LTV 250 이상",
+    "포트폴리오에서 LTV 250% 이하이고 압류 있는 물건",
+    "내 물건 중 LTV 60% 이상 70% 이하",
+    "내 물건 중 LTV 60% 초과이고 80% 미만인 가압류 필지",
+    "포트폴리오에서 LTV 50~90%",
+]
+# 현재 물건에 대한 질문 -> 포트폴리오 검색으로 가로채면 안 됨
+PROPERTY_QUESTIONS = [
+    "이 물건 대부업 대출 전체 얼마야?",
+    "어떤 위험이 있어? 신탁 때문에?",
+    "모든 채권 목록 보여줘",
+]
+
+
+def make_portfolio(n, seed=2026):
+    rng = random.Random(seed)
+    portfolio = []
+    for i in range(n):
+        bonds = [{"bank": bank, "type": kind} for bank, kind in rng.sample(LENDERS, rng.randint(1, 3))]
+        portfolio.append({
+            # 2% 는 LTV 200% 이상 (200%+ 구간 검증용)
+            "address": f"경기도 김포시 필지-{i}",
+            "ltv": round(rng.uniform(200, 400) if rng.random() < 0.02 else rng.uniform(20, 120), 2),
+            "restrictions": rng.sample(RESTRICTIONS, rng.randint(0, 2)),
+            "raw_bonds": bonds, "zoning": rng.choice(ZONINGS),
+        })
+    return portfolio
+
+
+def linear_scan(portfolio, criteria):
+    """검증용: 색인 없이 물건을 하나씩 확인하는 기존 방식"""
+    def has(f, term):
+        field, value = term
+        if field == "restriction":
+            return value in f['restrictions']
+        if field == "zoning":
+            return f['zoning'] == value
+        key = "bank" if field == "lender" else "type"
+        return any(b[key] == value for b in f['raw_bonds'])
+
+    hits = []
+    for f in portfolio:
+        if not all(has(f, t) for t in criteria.get('all_of', [])):
+            continue
+        if criteria.get('any_of') and not any(has(f, t) for t in criteria['any_of']):
+            continue
+        if any(has(f, t) for t in criteria.get('none_of', [])):
+            continue
+        strict = criteria.get('strict')
+        strict_max = criteria.get('strict_max', strict)
+        lo, hi = criteria.get('ltv_min'), criteria.get('ltv_max')
+        if lo is not None and (f['ltv'] <= lo if strict else f['ltv'] < lo):
+            continue
+        if hi is not None and (f['ltv'] >= hi if strict_max else f['ltv'] > hi):
+            continue
+        hits.append(f['address'])
+    return hits
+
+
+if __name__ == "__main__":
+    for n in (1_000, 10_000, 100_000):
+        portfolio = make_portfolio(n)
+        start = time.perf_counter()
+        index = PortfolioIndex.from_facts(portfolio)
+        build = time.perf_counter() - start
+        print("-" * 60)
+        print(f"📂 물건 {n:,}건 (색인 생성 {build * 1000:.1f}ms)")
+
+        for q in QUESTIONS:
+            criteria = index.parse(q)
+            start = time.perf_counter()
+            hits = index.query(**criteria)
+            fast = time.perf_counter() - start
+            start = time.perf_counter()
+            expected = linear_scan(portfolio, criteria)
+            slow = time.perf_counter() - start
+            status = "OK" if hits == expected else "MISMATCH"
+            print(f"[{status}] {len(hits):>6,}건  bitmap {fast * 1000:7.2f}ms  scan {slow * 1000:8.2f}ms  | {q}")
+        for q in PROPERTY_QUESTIONS:
+            print(f"[{'OK' if index.answer(q) is None else 'HIJACKED'}] 현재 물건 질문 | {q}")
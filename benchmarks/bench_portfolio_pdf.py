@@ -0,0 +1,57 @@
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+# [경로 설정] 프로젝트 루트의 agents 모듈 로딩
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+
+from reportlab.pdfgen import canvas
+
+from agents.pdf_fonts import FONTS
+from agents.report_template import UNIVERSE_REPORT
+from agents.portfolio_pdf import write_portfolio_pdf
+from bench_portfolio_export import CountingSink
+
+CONTEXT = {"finance_saving": 12_000_000, "tax_est": 23_000_000, "tax_rate": 4.6, "dev_profit": 350_000_000,
+           "dev_roi": 12.5, "restrictions": "신탁등기, 압류"}
+
+
+def rows(n):
+    return ((f"경기도 김포시 통진읍 도사리 {i}", CONTEXT) for i in range(n))
+
+
+def in_memory_pdf(n, out):
+    """비교용: 일반 ReportLab 캔버스 - save 전까지 모든 페이지를 메모리에 들고 있음"""
+    c = canvas.Canvas(out, pagesize=UNIVERSE_REPORT.pagesize)
+    fonts = UNIVERSE_REPORT.fonts()
+    issued = datetime.now().strftime('%Y년 %m월 %d일')
+    for address, context in rows(n):
+        UNIVERSE_REPORT.draw_page(c, dict(context, address=address, issued=issued), fonts)
+    c.save()
+
+
+def measure(label, build, n):
+    sink = CountingSink()
+    start = time.perf_counter()
+    build(n, sink)
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()  # 메모리는 별도 실행으로 측정 (tracemalloc 이 시간 측정을 왜곡하지 않도록)
+    build(n, CountingSink())
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<22} {n:>6,}건: {elapsed:6.2f}s ({n / elapsed:5.0f} pages/s) | PDF {sink.size / 1024:8,.0f}KB"
+          f" | 최대 할당 {peak / 1024:8,.0f}KB")
+
+
+if __name__ == "__main__":
+    os.chdir(ROOT)
+    if not FONTS.register('NanumGothic', 'NanumGothic.ttf'):
+        print("⚠️ NanumGothic.ttf 가 없어 Helvetica 로 측정합니다.")
+    counts = [int(a) for a in sys.argv[1:]] or [500, 2000]
+    for n in counts:
+        measure("일반 캔버스 (메모리)", in_memory_pdf, n)
+        measure("스트리밍 작성기", lambda k, out: write_portfolio_pdf(rows(k), out), n)
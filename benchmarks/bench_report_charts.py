@@ -0,0 +1,55 @@
+import os
+import sys
+import time
+import shutil
+import tempfile
+import warnings
+
+# [경로 설정] 프로젝트 루트의 agents 모듈 로딩
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+
+from agents import report_charts
+from agents.artifact_store import ArtifactStore
+from agents.pdf_fonts import FONTS, FPDF
+
+FACTS = {"ltv": 82.35, "count": 3, "total": 1_400_000_000, "saved": 21_000_000}
+ROUNDS = 200
+
+warnings.filterwarnings("ignore")  # fpdf 1.7 의 cmap 경고 (벤치마크 출력 정리용)
+
+
+def timed(fn, rounds=ROUNDS):
+    start = time.perf_counter()
+    for _ in range(rounds):
+        fn()
+    return (time.perf_counter() - start) * 1000 / rounds
+
+
+def pdf_with_chart(path):
+    pdf = FPDF()
+    pdf.add_page()
+    pdf.image(path, w=90)
+    return pdf.output(dest='S')
+
+
+if __name__ == "__main__":
+    FONTS.register('NanumGothic', os.path.join(ROOT, 'NanumGothic.ttf'))
+    spec = report_charts.financing_cost_chart(FACTS)
+    report_charts.render_png(spec)  # 워밍업 (PIL 폰트 로딩)
+    png_ms = timed(lambda: report_charts.render_png(spec), 20)
+    svg_ms = timed(lambda: report_charts.render_svg(spec))
+    cached_ms = timed(lambda: report_charts.chart_png(spec))
+    print(f"🖼️ 그래프 1장 | 매번 PNG {png_ms:.2f}ms | SVG {svg_ms:.3f}ms | 캐시 {cached_ms:.3f}ms")
+
+    workdir = tempfile.mkdtemp(prefix="jisang_charts_")
+    try:
+        store = ArtifactStore(workdir)
+        path = report_charts.chart_path(spec, store=store)
+        per_request_ms = timed(lambda: (report_charts.render_png(spec), pdf_with_chart(path)), 20)
+        stored_ms = timed(lambda: pdf_with_chart(report_charts.chart_path(spec, store=store)))
+        print(f"📄 그래프 포함 PDF | 요청마다 그리기 {per_request_ms:.2f}ms/건 | 저장된 PNG {stored_ms:.2f}ms/건 "
+              f"{report_charts.chart_cache_report()}")
+    finally:
+        shutil.rmtree(workdir, ignore_errors=True)
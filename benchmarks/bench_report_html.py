@@ -0,0 +1,78 @@
+import os
+import sys
+import time
+import random
+from datetime import datetime
+
+import pandas as pd
+
+# [경로 설정] 프로젝트 루트의 agents 모듈 로딩
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+
+from agents import report_html
+
+
+def legacy_report_html(item):
+    """기존 app.py create_report_html (f-string 조립, 이스케이프 없음)"""
+    d = item['데이터']
+    b_stat = "<span class='bdg bdg-ok'>적법</span>" if not d['건축물']['위반여부'] else "<span class='bdg bdg-no'>위반건축물</span>"
+    parts = [
+        '<div class="report-wrapper">',
+        '<div class="r-header">',
+        f'<div><div class="r-title">부동산 가치 분석 보고서</div><div>Target: {item["주소"]}</div></div>',
+        f'<div style="text-align:right; font-size:11px;">DATE: {datetime.now().strftime("%Y-%m-%d")}<br>REF: JA-BIZ-{int(time.time())}</div>',
+        '</div>',
+        f'<div style="background:#f1f5f9; padding:15px; border-radius:8px; margin-bottom:20px;">',
+        f'<div style="font-size:36px; font-weight:900; color:#1e3a8a;">{item["점수"]}점 <span style="font-size:16px;">(ROI {item["ROI"]}%)</span></div>',
+        f'<div style="margin-top:5px; font-size:13px;">💡 <b>AI 제안:</b> {d["권리"]["리스크"]}</div></div>',
+        '<table class="r-table">',
+        f'<tr><th>면적/지목</th><td>{d["토지"]["면적"]} / {d["토지"]["지목"]}</td><th>공시지가</th><td>{d["토지"]["공시지가"]}</td></tr>',
+        f'<tr><th>용도지역</th><td>{d["토지"]["용도지역"]}</td><th>규제사항</th><td>{", ".join(d["토지"]["규제"])}</td></tr>',
+        f'<tr><th>건물용도</th><td>{d["건축물"]["주용도"]}</td><th>위반여부</th><td>{b_stat}</td></tr>',
+        f'<tr><th>소유자</th><td>{d["권리"]["소유자"]}</td><th>채권최고액</th><td>{d["권리"]["채권"]}</td></tr>',
+        '</table></div>'
+    ]
+    return "".join(parts)
+
+
+def make_results(n, seed=2026):
+    rng = random.Random(seed)
+    now = int(time.time())
+    rows = []
+    for i in range(n):
+        data = {"토지": {"면적": f"{rng.randint(100, 5000):,}㎡", "지목": "대", "공시지가": f"{rng.randint(10, 900) * 1000:,}원",
+                        "용도지역": "계획관리지역", "규제": ["접도구역"]},
+                "건축물": {"주용도": "창고시설", "위반여부": rng.random() < 0.2},
+                "권리": {"소유자": f"소유자{i}", "채권": f"{rng.randint(1, 30)}억", "리스크": "대환대출 유망"}}
+        rows.append({"주소": f"경기도 김포시 필지-{i}", "용도": "물류창고", "점수": rng.randint(20, 100),
+                     "ROI": 15.2, "비용": 1.2, "데이터": data, "분석시각": now})
+    return pd.DataFrame(rows)
+
+
+def timed(fn):
+    start = time.perf_counter()
+    out = fn()
+    return (time.perf_counter() - start) * 1000, len(out)
+
+
+def legacy_viewer(df):
+    full_html = ""
+    for i, row in df.iterrows():
+        full_html += legacy_report_html(row)
+    return full_html
+
+
+if __name__ == "__main__":
+    per_page = 20
+    for n in (100, 1000, 5000):
+        df = make_results(n)
+        old_ms, size = timed(lambda: legacy_viewer(df))
+        report_html._FRAGMENTS.clear()
+        cold_ms, _ = timed(lambda: report_html.reports_html(df.to_dict('records')))
+        warm_ms, _ = timed(lambda: report_html.reports_html(df.to_dict('records')))
+        page_ms, _ = timed(lambda: report_html.reports_html(df.iloc[:per_page].to_dict('records')))
+        print(f"{n:>6,}건 | 기존 += 전체 {old_ms:8.1f}ms ({size / 1024:,.0f}KB) | 조각 join 최초 {cold_ms:7.1f}ms"
+              f" / 캐시 {warm_ms:7.1f}ms | {per_page}건 페이지 {page_ms:5.1f}ms")
+    print(f"🧩 조각 캐시 {report_html.fragment_cache_report()}")
@@ -0,0 +1,58 @@
+import os
+import sys
+import time
+import warnings
+
+# [경로 설정] 프로젝트 루트의 agents 모듈 로딩
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+
+from agents.pdf_fonts import FONTS
+from agents.report_generator import ENTERPRISE_REPORT
+from agents.report_sections import section_cache_report
+
+CONTEXT = {"address": "경기도 김포시 통진읍 도사리 163-1", "date": "2026-10-19", "ltv": 82.35, "count": 3,
+           "total": 1_400_000_000, "saved": 21_000_000}
+PERSONAS = ["금융 최적화", "세무/자산", "개발/시행", "매입/매각"]
+ROUNDS = 50
+
+warnings.filterwarnings("ignore")  # fpdf 1.7 의 cmap 경고 (벤치마크 출력 정리용)
+
+
+def ai_text(persona, lines):
+    return "\n".join(f"### {persona} 관점 진단 {n}\n* **신탁등기** 및 **압류**가 확인되어 일반적인 매매나 대출이 제한될 수 있습니다. "
+                     f"전문가를 통한 **신탁 말소** 및 **통합 대환** 솔루션이 필요합니다." for n in range(lines))
+
+
+def whole(context):
+    """기존 방식: 매번 문서 전체를 처음부터 그림"""
+    pdf, font = ENTERPRISE_REPORT._document()
+    pdf.add_page()
+    for section in ENTERPRISE_REPORT.sections:
+        section.render(pdf, font, section.fields(context))
+    return pdf.output(dest='S').encode('latin-1')
+
+
+def timed(fn, contexts):
+    start = time.perf_counter()
+    for context in contexts:
+        fn(context)
+    return (time.perf_counter() - start) * 1000 / len(contexts)
+
+
+if __name__ == "__main__":
+    FONTS.register('NanumGothic', os.path.join(ROOT, 'NanumGothic.ttf'))
+    for lines in (5, 40):
+        # 페르소나 4개를 번갈아 선택 (AI 본문만 바뀜), 팩트 1개만 바뀜, 아무것도 안 바뀜(재실행)
+        personas = [dict(CONTEXT, ai_text=ai_text(PERSONAS[n % 4], lines)) for n in range(ROUNDS)]
+        facts = [dict(CONTEXT, ai_text=ai_text(PERSONAS[0], lines), ltv=round(80 + n * 0.01, 2)) for n in range(ROUNDS)]
+        same = [dict(CONTEXT, ai_text=ai_text(PERSONAS[0], lines))] * ROUNDS
+        for context in personas[:4]:
+            whole(context)  # 워밍업 (폰트 서브셋 캐시)
+            ENTERPRISE_REPORT.render(context)
+        line = [f"AI 본문 {lines:>2}문단"]
+        for name, contexts in (("페르소나 전환", personas), ("팩트 1개 변경", facts), ("변경 없음", same)):
+            line.append(f"{name} 전체 {timed(whole, contexts):6.2f}ms / 구역 {timed(ENTERPRISE_REPORT.render, contexts):6.2f}ms")
+        print(" | ".join(line))
+    print(f"🧩 구역 캐시 {section_cache_report()}")
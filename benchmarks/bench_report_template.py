@@ -0,0 +1,113 @@
+import io
+import os
+import sys
+import time
+from datetime import datetime
+
+# [경로 설정] 프로젝트 루트의 agents 모듈 로딩
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+
+from reportlab.pdfgen import canvas
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.units import mm
+
+from agents.pdf_fonts import FONTS
+from agents.report_template import UNIVERSE_REPORT
+
+CONTEXT = {"finance_saving": 12_000_000, "tax_est": 23_000_000, "tax_rate": 4.6, "dev_profit": 350_000_000,
+           "dev_roi": 12.5, "restrictions": ["신탁등기", "압류"]}
+
+
+def legacy_perfect_pdf(address, context):
+    """기존 generate_perfect_pdf: 보고서마다 골격 전체를 새 캔버스에 다시 그림"""
+    buffer = io.BytesIO()
+    c = canvas.Canvas(buffer, pagesize=A4)
+    width, height = A4
+    font_name = FONTS.reportlab_font('NanumGothic', fallback='Helvetica')
+
+    c.setFont(font_name, 10)
+    c.drawRightString(width - 20*mm, height - 20*mm, "Jisang AI Universe Report")
+    c.line(20*mm, height - 22*mm, width - 20*mm, height - 22*mm)
+    c.setFont(font_name, 22)
+    c.drawCentredString(width / 2, height - 50*mm, "부동산 5대 영역 종합 분석 보고서")
+    c.setFillColorRGB(0.95, 0.95, 0.95)
+    c.rect(20*mm, height - 90*mm, width - 40*mm, 30*mm, fill=1, stroke=0)
+    c.setFillColorRGB(0, 0, 0)
+    c.setFont(font_name, 12)
+    c.drawString(25*mm, height - 70*mm, f"분석 대상: {address}")
+    c.drawString(25*mm, height - 80*mm, f"발행 일자: {datetime.now().strftime('%Y년 %m월 %d일')}")
+    c.drawString(120*mm, height - 80*mm, "분석 기관: 지상 AI 파트너스")
+
+    y_pos = height - 110*mm
+    c.setFont(font_name, 16)
+    c.drawString(20*mm, y_pos, "1. 핵심 금융 및 세무 분석 (Fact Check)")
+    y_pos -= 10*mm
+    c.setFont(font_name, 11)
+    line_height = 8*mm
+    for fact in [f"• [금융] 연간 이자 절감 예상액: {context['finance_saving']:,} 원",
+                 f"• [세무] 예상 취득세 (공장): {context['tax_est']:,} 원 ({context['tax_rate']}%)",
+                 f"• [개발] 신축 분양 예상 수익: {context['dev_profit']:,} 원 (ROI {context['dev_roi']}%)",
+                 f"• [위험] 발견된 권리 리스크: {context['restrictions']}"]:
+        c.drawString(25*mm, y_pos, fact)
+        y_pos -= line_height
+    y_pos -= 10*mm
+    c.setFont(font_name, 16)
+    c.drawString(20*mm, y_pos, "2. AI 심층 솔루션 제언")
+    y_pos -= 8*mm
+    c.setFont(font_name, 11)
+    for line in ["현재 해당 물건은 '신탁등기' 및 '압류' 리스크로 인해 일반적인 담보대출이 불가능합니다.",
+                 "지상 AI의 알고리즘은 [대부업 상환]과 [신탁 말소]를 동시에 진행하는",
+                 "'통합 대환 솔루션'을 최적의 해결책으로 제시합니다.",
+                 "이를 통해 연간 수천만 원의 금융 비용을 절감하고 자산 가치를 회복할 수 있습니다."]:
+        c.drawString(25*mm, y_pos, line)
+        y_pos -= line_height
+    c.setFont(font_name, 9)
+    c.setFillColorRGB(0.5, 0.5, 0.5)
+    c.drawCentredString(width / 2, 20*mm, "[면책 조항] 본 보고서는 시뮬레이션 결과이며 법적 효력이 없습니다.")
+    c.showPage()
+    c.save()
+    buffer.seek(0)
+    return buffer
+
+
+def template_fields(i):
+    return dict(CONTEXT, address=f"경기도 김포시 통진읍 도사리 {i}", issued=datetime.now().strftime('%Y년 %m월 %d일'))
+
+
+def run(label, fn, pages):
+    fn(1)  # 워밍업 (폰트 등록)
+    start = time.perf_counter()
+    size = fn(pages)
+    elapsed = time.perf_counter() - start
+    print(f"{label:<34} {pages:>5}p  {pages / elapsed:8.1f} pages/s  ({elapsed * 1000 / pages:6.2f} ms/page, {size / 1024:,.0f}KB)")
+
+
+def legacy_reports(n):
+    return sum(len(legacy_perfect_pdf(f"경기도 김포시 통진읍 도사리 {i}", CONTEXT).getvalue()) for i in range(n))
+
+
+def template_reports(n):
+    return sum(len(UNIVERSE_REPORT.render(template_fields(i)).getvalue()) for i in range(n))
+
+
+def template_one_document(n):
+    """골격 Form XObject 를 한 문서 안에서 n 페이지가 공유"""
+    buffer = io.BytesIO()
+    c = canvas.Canvas(buffer, pagesize=A4)
+    fonts = UNIVERSE_REPORT.fonts()
+    for i in range(n):
+        UNIVERSE_REPORT.draw_page(c, template_fields(i), fonts)
+    c.save()
+    return len(buffer.getvalue())
+
+
+if __name__ == "__main__":
+    os.chdir(ROOT)
+    if not FONTS.register('NanumGothic', 'NanumGothic.ttf'):
+        print("⚠️ NanumGothic.ttf 가 없어 Helvetica 로 측정합니다.")
+    for pages in (10, 200):
+        run("기존: 보고서마다 전체 다시 그림", legacy_reports, pages)
+        run("템플릿: 보고서마다 골격 Form 재사용", template_reports, pages)
+        run("템플릿: 한 문서에 골격 공유", template_one_document, pages)
@@ -0,0 +1,56 @@
+import os
+import sys
+import time
+import random
+import tracemalloc
+
+import pandas as pd
+
+# [경로 설정] 프로젝트 루트의 agents 모듈 로딩
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.append(ROOT)
+
+from agents.table_export import export_rows
+from bench_portfolio_export import CountingSink
+
+
+def iter_results(n, seed=2026):
+    """FactChecker.process 결과와 같은 모양의 행 제너레이터 (메모리에 전체 목록을 만들지 않음)"""
+    rng = random.Random(seed)
+    for i in range(n):
+        total = rng.randint(1, 300) * 10_000_000
+        yield {"address": f"경기도 김포시 통진읍 필지-{i}", "ltv": round(rng.uniform(10, 95), 2), "count": rng.randint(1, 5),
+               "total": total, "saved": int(total * 0.015), "score": rng.randint(20, 100),
+               "restrictions": ["신탁등기", "압류"][:rng.randint(0, 2)], "zoning": "계획관리지역",
+               "raw_bonds": [{"amount": total, "creditor": "농협"}]}
+
+
+def legacy_csv(n, out):
+    """기존 ReportEngine.create_excel_csv: 결과 목록 -> DataFrame -> CSV 문자열 전체"""
+    out.write(pd.DataFrame(list(iter_results(n))).to_csv(index=False).encode('utf-8-sig'))
+
+
+def measure(fn):
+    """(소요 시간, 최대 메모리 MB, 출력 MB) - 시간은 tracemalloc 없이 따로 측정 (추적 비용 제외)"""
+    sink = CountingSink()
+    start = time.perf_counter()
+    fn(sink)
+    seconds = time.perf_counter() - start
+    tracemalloc.start()
+    fn(CountingSink())
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return seconds, peak / 1024 / 1024, sink.size / 1024 / 1024
+
+
+if __name__ == "__main__":
+    # 1M 행은 인자로 지정 (python bench_table_export.py 1000000) - XLSX 는 openpyxl 특성상 수 분 소요
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 50_000, 200_000]
+    for n in sizes:
+        seconds, peak, size = measure(lambda sink: legacy_csv(n, sink))
+        line = [f"{n:>9,}행", f"pandas CSV 최대 {peak:6.1f}MB ({seconds:5.1f}s)"]
+        for fmt in ("csv", "xlsx", "parquet"):
+            seconds, peak, size = measure(lambda sink: export_rows(iter_results(n), sink, fmt))
+            line.append(f"{fmt} {peak:5.1f}MB ({seconds:5.1f}s, 파일 {size:,.1f}MB)")
+        print(" | ".join(line))
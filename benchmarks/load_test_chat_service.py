@@ -0,0 +1,129 @@
+import os
+import sys
+import json
+import time
+import random
+import asyncio
+import argparse
+import subprocess
+
+# [경로 설정] 프로젝트 루트 (서비스 자동 실행용)
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CONTEXT = {
+    "address": "김포시 통진읍 도사리 163-1", "ltv": 70.59, "total": 600000000, "saved": 30000000,
+    "restrictions": ["신탁등기", "압류"],
+    "raw_bonds": [{"bank": "국민은행", "date": "2018.06.20", "amount": 400000000, "type": "1금융"},
+                  {"bank": "러시앤캐시", "date": "2024.01.10", "amount": 200000000, "type": "대부업"}],
+}
+MESSAGES = ["공동담보 목록 보여줘", "대 환 하면 얼마 아껴?", "신탁 위험해?", "금리 얼마나 낮아져?",
+            "채권 총액이 얼마야", "압류 풀 수 있어?", "이자 절약 방법", "오늘 상담 가능해요?"]
+
+
+class Client:
+    """keep-alive 연결 1개로 요청을 순서대로 보내는 최소 HTTP 클라이언트"""
+
+    def __init__(self, host, port):
+        self.host, self.port = host, port
+        self.reader = self.writer = None
+
+    async def request(self, method, path, payload=None):
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8') if payload is not None else b""
+        head = f"{method} {path} HTTP/1.1\r\nHost: {self.host}\r\nContent-Type: application/json\r\nContent-Length: {len(body)}\r\n\r\n"
+        self.writer.write(head.encode('latin-1') + body)
+        await self.writer.drain()
+
+        status_line = await self.reader.readuntil(b"\r\n")
+        status = int(status_line.split()[1])
+        length = 0
+        while True:
+            line = await self.reader.readuntil(b"\r\n")
+            if line == b"\r\n":
+                break
+            name, _, value = line.decode('latin-1').partition(":")
+            if name.lower() == "content-length":
+                length = int(value)
+        data = await self.reader.readexactly(length) if length else b""
+        return status, (json.loads(data) if data else None)
+
+    async def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            await self.writer.wait_closed()
+
+
+async def conversation(host, port, messages, latencies, errors, rng):
+    client = Client(host, port)
+    try:
+        start = time.perf_counter()
+        status, data = await client.request("POST", "/sessions", {"context": CONTEXT})
+        latencies.append(time.perf_counter() - start)
+        if status != 201:
+            errors.append(status)
+            return
+        sid = data['session_id']
+        for _ in range(messages):
+            start = time.perf_counter()
+            status, _ = await client.request("POST", f"/sessions/{sid}/messages", {"message": rng.choice(MESSAGES)})
+            latencies.append(time.perf_counter() - start)
+            if status != 200:
+                errors.append(status)
+    except (ConnectionError, asyncio.IncompleteReadError) as e:
+        errors.append(type(e).__name__)
+    finally:
+        await client.close()
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))] if values else 0.0
+
+
+async def run(args):
+    rng = random.Random(2026)
+    latencies, errors = [], []
+    start = time.perf_counter()
+    # 세션(연결) 수만큼 대화를 동시에 진행
+    await asyncio.gather(*(conversation(args.host, args.port, args.messages, latencies, errors, rng)
+                           for _ in range(args.sessions)))
+    elapsed = time.perf_counter() - start
+
+    stats_client = Client(args.host, args.port)
+    _, stats = await stats_client.request("GET", "/stats")
+    await stats_client.close()
+
+    print(f"💬 동시 대화 {args.sessions:,}개 x 메시지 {args.messages}건 -> 요청 {len(latencies):,}건 / {elapsed:.2f}s")
+    print(f"   처리량 {len(latencies) / elapsed:,.0f} req/s | 오류 {len(errors)}건")
+    print(f"   지연 p50 {percentile(latencies, 0.50) * 1000:.1f}ms | p95 {percentile(latencies, 0.95) * 1000:.1f}ms"
+          f" | p99 {percentile(latencies, 0.99) * 1000:.1f}ms")
+    print(f"   서버: {json.dumps(stats['service'], ensure_ascii=False)}")
+    print(f"   세션: {json.dumps(stats['sessions'], ensure_ascii=False)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="jisang_chat_service 부하 테스트")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--sessions", type=int, default=2000, help="동시 대화(연결) 수")
+    parser.add_argument("--messages", type=int, default=10, help="대화당 메시지 수")
+    parser.add_argument("--spawn", action="store_true", help="서비스를 하위 프로세스로 직접 실행")
+    args = parser.parse_args()
+
+    server = None
+    if args.spawn:
+        env = dict(os.environ, GOOGLE_API_KEY="")  # 부하 테스트는 규칙 경로만 측정 (AI 호출 비용 방지)
+        server = subprocess.Popen([sys.executable, os.path.join(ROOT, "jisang_chat_service.py"), "--port", str(args.port),
+                                   "--max-sessions", str(max(10000, args.sessions))], cwd=ROOT, env=env)
+        time.sleep(2.0)
+    try:
+        asyncio.run(run(args))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+
+
+if __name__ == "__main__":
+    main()
@@ -71,7 +71,7 @@ class JisangBrain:
                 google_api_key=api_key
             )
 
-    def analyze(self, address, doc_data, market_data):
+    async def analyze(self, address, doc_data, market_data):
         if self.mode == "sim":
             return """
             [시뮬레이션 결과]
@@ -99,7 +99,9 @@ class JisangBrain:
             """
         )
         chain = prompt | self.llm
-        return chain.invoke({"address": address, "doc_data": doc_data, "market_data": market_data}).content
+        # 비동기 호출 (ainvoke) - 이벤트 루프를 막지 않음
+        result = await chain.ainvoke({"address": address, "doc_data": doc_data, "market_data": market_data})
+        return result.content
 
 # ----------------------------------------------------------------
 # [Step 4] 오케스트레이터 실행
@@ -111,7 +113,7 @@ async def run_system():
 
     print("\n[Step 1] Opal Agent 가동 (Data Mining)")
     print("   >>> 🌐 정부24/인터넷등기소 접속 중... (Target: 김포시 양촌읍)")
-    time.sleep(1)
+    await asyncio.sleep(1)
     print("   >>> 📄 등기부등본(PDF), 토지대장, 지적도 추출 완료.")
     print("   >>> ⚠️ [Risk Alert] '신탁등기' 식별됨.")
 
@@ -120,7 +122,7 @@ async def run_system():
     
     brain = JisangBrain()
     start = time.time()
-    result = brain.analyze("김포시 양촌읍 석모리 123-4", MOCK_REGISTRY, MOCK_MARKET)
+    result = await brain.analyze("김포시 양촌읍 석모리 123-4", MOCK_REGISTRY, MOCK_MARKET)
     end = time.time()
 
     print(f"   >>> ✅ 분석 완료 (Latency: {end - start:.2f}s)")
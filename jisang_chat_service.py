@@ -0,0 +1,262 @@
+"""
+지상 AI 하이브리드 챗봇 - 헤드리스 HTTP 채팅 서비스
+Streamlit 화면 없이 여러 대화를 동시에 처리합니다. (asyncio 단일 프로세스, 외부 웹 프레임워크 불필요)
+
+실행: python jisang_chat_service.py --port 8765
+  POST   /sessions                 {"context": {...물건 팩트...}, "portfolio": [{...}, ...]}  -> {"session_id": ...}
+  POST   /sessions/<id>/messages   {"message": "공동담보 목록 보여줘"}                        -> {"reply": ..., "route": "rule" | "ai"}
+  GET    /sessions/<id>            최근 대화 기록
+  DELETE /sessions/<id>
+  GET    /stats                    세션 저장소 / 의도 판별 / LLM 오류 통계
+"""
+import os
+import json
+import asyncio
+import argparse
+import resource
+
+from dotenv import load_dotenv
+
+from agents.session_store import SessionStore
+from agents.portfolio_index import PortfolioIndex
+from agents.intent_registry import REGISTRY
+from agents.hybrid_responder import rule_response, aai_response, missing_context_fields, FALLBACK_MESSAGE
+from agents.llm_call import get_error_counters
+
+STATUS_TEXT = {200: "OK", 201: "Created", 204: "No Content", 400: "Bad Request", 404: "Not Found",
+               405: "Method Not Allowed", 413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+class HTTPError(Exception):
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class ChatService:
+    """
+    세션 저장소 + 하이브리드 응답기를 HTTP 로 노출.
+    규칙 답변은 이벤트 루프에서 즉시 처리하고, AI 호출만 ai_concurrency 개로 제한하여 비동기로 대기합니다.
+    """
+
+    def __init__(self, store, ai_enabled=True, ai_concurrency=32, max_message_chars=2000,
+                 max_body_bytes=64 * 1024, idle_timeout=30.0, sweep_interval=30.0):
+        self.store = store
+        self.ai_enabled = ai_enabled
+        self.ai_slots = asyncio.Semaphore(ai_concurrency)
+        self.max_message_chars = max_message_chars
+        self.max_body_bytes = max_body_bytes
+        self.idle_timeout = idle_timeout
+        self.sweep_interval = sweep_interval
+        self.stats = {"requests": 0, "rule_replies": 0, "ai_replies": 0, "errors": 0, "connections": 0}
+
+    # ---------------------------------------------------------------- HTTP 처리
+    async def handle_connection(self, reader, writer):
+        self.stats["connections"] += 1
+        try:
+            while True:
+                try:
+                    head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"), self.idle_timeout)
+                except (asyncio.TimeoutError, asyncio.IncompleteReadError, asyncio.LimitOverrunError, ConnectionError):
+                    break
+                keep_alive = await self._serve_one(head, reader, writer)
+                if not keep_alive:
+                    break
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _serve_one(self, head, reader, writer):
+        self.stats["requests"] += 1
+        lines = head.decode('latin-1').split("\r\n")
+        try:
+            method, target, version = lines[0].split(" ", 2)
+        except ValueError:
+            await self._write(writer, 400, {"error": "잘못된 요청"}, keep_alive=False)
+            return False
+        headers = {}
+        for line in lines[1:]:
+            if ":" in line:
+                name, value = line.split(":", 1)
+                headers[name.strip().lower()] = value.strip()
+        keep_alive = version == "HTTP/1.1" and headers.get("connection", "").lower() != "close"
+
+        length = None
+        try:
+            length = self._content_length(headers)
+            if length > self.max_body_bytes:
+                raise HTTPError(413, f"요청 본문은 {self.max_body_bytes} bytes 이하여야 합니다.")
+            body = await reader.readexactly(length) if length else b""
+            status, payload = await self.dispatch(method, target.split("?", 1)[0], body)
+        except HTTPError as e:
+            self.stats["errors"] += 1
+            status, payload = e.status, {"error": e.message}
+            # 본문을 읽지 못한 경우(길이 오류 / 초과)는 다음 요청 경계를 알 수 없으므로 연결 종료
+            keep_alive = keep_alive and e.status != 413 and length is not None
+        except (asyncio.IncompleteReadError, ConnectionError):
+            return False
+        except Exception as e:
+            self.stats["errors"] += 1
+            status, payload = 500, {"error": f"서버 오류: {e}"}
+        await self._write(writer, status, payload, keep_alive)
+        return keep_alive
+
+    async def _write(self, writer, status, payload, keep_alive):
+        body = json.dumps(payload, ensure_ascii=False).encode('utf-8') if payload is not None else b""
+        head = (f"HTTP/1.1 {status} {STATUS_TEXT.get(status, 'OK')}\r\n"
+                f"Content-Type: application/json; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n")
+        writer.write(head.encode('latin-1') + body)
+        await writer.drain()
+
+    @staticmethod
+    def _content_length(headers):
+        value = headers.get("content-length", "0")
+        if not value.isdigit():  # 숫자가 아니거나 음수
+            raise HTTPError(400, "Content-Length 가 올바르지 않습니다.")
+        return int(value)
+
+    @staticmethod
+    def _json(body):
+        try:
+            data = json.loads(body or b"{}")
+        except ValueError:
+            raise HTTPError(400, "JSON 형식이 아닙니다.")
+        if not isinstance(data, dict):
+            raise HTTPError(400, "JSON 객체가 필요합니다.")
+        return data
+
+    # ---------------------------------------------------------------- 라우팅
+    async def dispatch(self, method, path, body):
+        parts = [p for p in path.split("/") if p]
+        if parts == ["health"]:
+            return 200, {"status": "ok"}
+        if parts == ["stats"] and method == "GET":
+            return 200, self.report()
+        if parts == ["sessions"] and method == "POST":
+            return self.create_session(self._json(body))
+        if len(parts) >= 2 and parts[0] == "sessions":
+            session = self.store.get(parts[1])
+            if session is None:
+                raise HTTPError(404, "세션이 없거나 만료되었습니다.")
+            if len(parts) == 2 and method == "GET":
+                return 200, {"session_id": session.session_id, "turns": session.turns,
+                             "summary": session.memory.summary, "history": session.history()}
+            if len(parts) == 2 and method == "DELETE":
+                self.store.delete(session.session_id)
+                return 204, None
+            if len(parts) == 3 and parts[2] == "messages" and method == "POST":
+                return await self.post_message(session, self._json(body))
+            raise HTTPError(405, "지원하지 않는 메서드입니다.")
+        raise HTTPError(404, "경로를 찾을 수 없습니다.")
+
+    def create_session(self, data):
+        context = data.get("context")
+        if not isinstance(context, dict):
+            raise HTTPError(400, "context (물건 팩트 객체)가 필요합니다.")
+        missing = missing_context_fields(context)
+        if missing:
+            raise HTTPError(400, f"context 에 필요한 항목이 없습니다: {', '.join(missing)}")
+        bonds = context.get("raw_bonds", [])
+        if not isinstance(bonds, list) or not all(isinstance(b, dict) and {"bank", "amount", "date"} <= b.keys() for b in bonds):
+            raise HTTPError(400, "context.raw_bonds 는 bank / amount / date 가 있는 객체의 배열이어야 합니다.")
+        portfolio = data.get("portfolio")
+        index = None
+        if portfolio:
+            if not isinstance(portfolio, list) or not all(isinstance(f, dict) and f.get("address") for f in portfolio):
+                raise HTTPError(400, "portfolio 는 address 가 있는 물건 팩트 객체의 배열이어야 합니다.")
+            try:
+                index = PortfolioIndex.from_facts(portfolio)
+            except (KeyError, TypeError, AttributeError) as e:
+                raise HTTPError(400, f"portfolio 물건 팩트 형식이 올바르지 않습니다: {e!r}")
+        # 검증을 모두 통과한 뒤에 세션 생성 (400 응답 시 빈 세션이 남지 않도록)
+        session = self.store.create(context)
+        session.portfolio = index
+        return 201, {"session_id": session.session_id}
+
+    async def post_message(self, session, data):
+        message = data.get("message")
+        if not isinstance(message, str) or not message.strip():
+            raise HTTPError(400, "message 가 비어 있습니다.")
+        if len(message) > self.max_message_chars:
+            raise HTTPError(413, f"메시지는 {self.max_message_chars}자 이하여야 합니다.")
+
+        async with session.lock:
+            session.memory.add("user", message)
+            reply = rule_response(message, session.context, session.portfolio)
+            route = "rule"
+            if reply is None:
+                route = "ai"
+                if self.ai_enabled:
+                    async with self.ai_slots:
+                        reply = await aai_response(message, session.context, session.memory.render())
+                else:
+                    reply = FALLBACK_MESSAGE
+            session.memory.add("assistant", reply)
+            session.turns += 1
+        self.stats["rule_replies" if route == "rule" else "ai_replies"] += 1
+        return 200, {"reply": reply, "route": route, "turn": session.turns}
+
+    def report(self):
+        peak_rss_mb = round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)  # Linux: KB 단위
+        return {"service": dict(self.stats, peak_rss_mb=peak_rss_mb), "sessions": self.store.report(),
+                "intents": REGISTRY.report().get("hybrid"), "llm_errors": get_error_counters()}
+
+    # ---------------------------------------------------------------- 실행
+    async def sweep_forever(self):
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            removed = self.store.sweep()
+            if removed:
+                print(f"🧹 [Session] 만료 세션 {removed}건 정리 (활성 {len(self.store)}건)")
+
+    async def serve(self, host="127.0.0.1", port=8765, ready=None):
+        server = await asyncio.start_server(self.handle_connection, host, port, backlog=4096)
+        sweeper = asyncio.create_task(self.sweep_forever())
+        print(f"🚀 [Chat Service] http://{host}:{port} (세션 상한 {self.store.max_sessions:,}, TTL {self.store.ttl_seconds}s)")
+        if ready is not None:
+            ready.set()
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            sweeper.cancel()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="지상 AI 하이브리드 챗봇 HTTP 서비스")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--max-sessions", type=int, default=10000)
+    parser.add_argument("--ttl", type=float, default=1800, help="세션 만료 시간(초)")
+    parser.add_argument("--max-turns", type=int, default=6, help="세션별 원문으로 보관할 최근 대화 수")
+    parser.add_argument("--ai-concurrency", type=int, default=32)
+    args = parser.parse_args()
+
+    load_dotenv()
+    api_key = os.getenv("GOOGLE_API_KEY")
+    if api_key:
+        import google.generativeai as genai
+        genai.configure(api_key=api_key)
+    else:
+        print("⚠️ GOOGLE_API_KEY 가 없어 규칙 답변만 제공합니다. (AI 질문은 상담 연결 안내로 응답)")
+
+    store = SessionStore(max_sessions=args.max_sessions, ttl_seconds=args.ttl, max_turns=args.max_turns)
+
+    async def run():
+        service = ChatService(store, ai_enabled=bool(api_key), ai_concurrency=args.ai_concurrency)
+        await service.serve(args.host, args.port)
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        print("👋 서비스 종료")
+
+
+if __name__ == "__main__":
+    main()
@@ -37,6 +37,8 @@ import plotly.express as px
 import google.generativeai as genai
 from fpdf import FPDF
 from dotenv import load_dotenv
+from agents.model_router import ROUTER
+from agents.llm_call import call_with_retry, get_error_counters, LLMCallError
 
 load_dotenv()
 api_key = os.getenv("GOOGLE_API_KEY")
@@ -79,14 +81,14 @@ class ReportEngine:
 # --------------------------------------------------------------------------------
 # [Engine 2] AI 엔진 (분석 + 챗봇)
 # --------------------------------------------------------------------------------
-def get_ai_response(prompt, model_type="flash"):
-    """통합 AI 호출 함수"""
-    model_name = 'gemini-1.5-flash' if model_type == "flash" else 'gemini-pro'
+def get_ai_response(prompt, model_name=ROUTER.fast_model):
+    """통합 AI 호출 함수 (model_name: 라우터가 고른 모델, 기본 Flash)"""
+    model = genai.GenerativeModel(model_name)
     try:
-        model = genai.GenerativeModel(model_name)
-        response = model.generate_content(prompt)
-        return response.text
-    except:
+        return ROUTER.track(model_name, prompt, lambda: call_with_retry(
+            lambda: model.generate_content(prompt).text, deadline=20.0
+        ))
+    except LLMCallError:
         return "죄송합니다. 현재 AI 서버 연결이 원활하지 않습니다. 잠시 후 다시 시도해주세요."
 
 class FactChecker:
@@ -130,7 +132,9 @@ def run_simulation(addr, mode):
     기회: 대환 시 연 {facts['saved']/10000:.0f}만원 절감.
     작성법: 1.진단 2.솔루션 3.효과 (Markdown, 한국어)
     """
-    ai_text = get_ai_response(prompt)
+    # 권리하자 / 대부업 / LTV 구간으로 난이도를 매겨 Flash / Pro 선택
+    model_name = ROUTER.route(ROUTER.score_facts(raw['restrictions'], raw['bonds'], facts['ltv']))
+    ai_text = get_ai_response(prompt, model_name)
     return raw, facts, ai_text
 
 # --------------------------------------------------------------------------------
@@ -259,6 +263,12 @@ if 'run_analysis' in st.session_state and st.session_state['run_analysis']:
     csv = ReportEngine.create_excel_csv(all_results)
     st.download_button("📥 전체 분석 결과 (CSV)", csv, "Portfolio.csv", "text/csv")
 
+    # 모델 라우팅 통계 (경로별 호출 수 / 평균 지연 / 추정 비용)
+    with st.expander("🔀 AI 모델 라우팅 현황"):
+        st.json(ROUTER.report())
+        st.caption("오류 유형별 호출 통계 (quota / timeout / 4xx / 5xx)")
+        st.json(get_error_counters())
+
 else:
     st.title("Jisang AI Chatbot Platform")
     st.info("👈 왼쪽 사이드바에서 **[분석 & 챗봇 실행]**을 클릭하세요.")
\ No newline at end of file
@@ -35,88 +35,40 @@ if "streamlit" not in sys.modules:
 # ================================================================================
 import streamlit as st
 import plotly.express as px
-import pandas as pd
 import google.generativeai as genai
-from fpdf import FPDF
 from dotenv import load_dotenv
+from agents.llm_call import call_models, LLMCallError
+from agents.lazy_download import lazy_download_button
+from agents.report_generator import ReportGenerator  # [Engine 1] 리포트 생성 엔진
+from agents.report_charts import chart_frame, cash_flow_chart
+from agents.markdown_bundle import export_markdown_bundle
+from agents.pdf_fonts import FONTS
 
 load_dotenv()
 api_key = os.getenv("GOOGLE_API_KEY")
 if api_key: genai.configure(api_key=api_key)
 
-# --------------------------------------------------------------------------------
-# [Engine 1] 리포트 생성 엔진 (Crash 방지)
-# --------------------------------------------------------------------------------
-class ReportGenerator:
-    @staticmethod
-    def create_markdown(address, facts, ai_text):
-        """한글이 완벽하게 지원되는 마크다운 리포트"""
-        content = f"""
-# 부동산 종합 분석 리포트
-**대상**: {address}
-**작성일**: {datetime.now().strftime('%Y-%m-%d')}
-**분석툴**: Jisang AI Enterprise
-
----
-## 1. 핵심 데이터 (Fact Check)
-* **LTV (담보비율)**: {facts['ltv']}%
-* **총 채권액**: {facts['total']:,} 원
-* **대환 타겟**: {facts['count']} 건
-* **연간 예상 절감액**: {facts['saved']:,} 원
-
----
-## 2. AI 심층 컨설팅
-{ai_text}
-
----
-## 3. 면책 조항
-본 리포트는 시뮬레이션 결과이며 법적 효력이 없습니다.
-"""
-        return content.encode('utf-8')
-
-    @staticmethod
-    def create_english_pdf(address, facts):
-        """에러 없이 작동하는 영문 요약 PDF (Global Standard)"""
-        pdf = FPDF()
-        pdf.add_page()
-        pdf.set_font("Arial", "B", 16)
-        pdf.cell(0, 10, "Jisang AI | Real Estate Summary", 0, 1, 'C')
-        pdf.ln(10)
-        
-        pdf.set_font("Arial", "", 12)
-        pdf.cell(0, 10, f"Target: {address} (ID: {random.randint(1000,9999)})", 0, 1)
-        pdf.cell(0, 10, f"Date: {datetime.now().strftime('%Y-%m-%d')}", 0, 1)
-        pdf.ln(5)
-        
-        pdf.set_font("Arial", "B", 14)
-        pdf.cell(0, 10, "1. Financial Facts", 0, 1)
-        pdf.set_font("Arial", "", 12)
-        pdf.cell(0, 10, f"- LTV Ratio: {facts['ltv']}%", 0, 1)
-        pdf.cell(0, 10, f"- Total Bond: {facts['total']:,} KRW", 0, 1)
-        pdf.cell(0, 10, f"- Est. Saving: {facts['saved']:,} KRW/year", 0, 1)
-        
-        pdf.ln(5)
-        pdf.set_font("Arial", "B", 14)
-        pdf.cell(0, 10, "2. AI Diagnosis (Summary)", 0, 1)
-        pdf.set_font("Arial", "", 12)
-        pdf.multi_cell(0, 7, "This property is classified as 'High Risk' due to high LTV. Refinancing is strongly recommended to improve cash flow.")
-        
-        return pdf.output(dest='S').encode('latin-1')
+# 한글 정밀 리포트 PDF 용 폰트 (프로세스당 1회 등록) - 실행 위치와 무관하도록 스크립트 폴더 기준 경로
+# 폰트가 없으면 한글 PDF 버튼 대신 안내만 표시 (Arial 로는 한글 출력 불가)
+FONTS.register('NanumGothic', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'NanumGothic.ttf'))
 
 # --------------------------------------------------------------------------------
 # [Engine 2] AI 모델 연결 (무한 재시도)
 # --------------------------------------------------------------------------------
 def get_robust_response(prompt):
     models = ['gemini-1.5-flash', 'gemini-1.5-pro', 'gemini-2.0-flash']
-    
-    for m in models:
-        try:
-            model = genai.GenerativeModel(m)
-            response = model.generate_content(prompt)
-            if response.text:
-                return response.text, m
-        except:
-            continue
+
+    def generate(m):
+        text = genai.GenerativeModel(m).generate_content(prompt).text
+        if not text:
+            raise ValueError("빈 응답")
+        return text
+
+    # 오류 유형별 백오프 재시도 + 모델 Fail-over (전체 20초 제한)
+    try:
+        return call_models(models, generate, deadline=20.0)
+    except LLMCallError:
+        pass
             
     # 모든 모델 실패 시 표준 텍스트 반환
     return """
@@ -215,81 +167,122 @@ with st.sidebar:
     st.info("System Online\nv4.0.0 Stable")
 
 # Main
-if start_btn:
-    if not api_key:
-        st.error("❌ API Key가 설정되지 않았습니다.")
-    else:
-        addresses = [a.strip() for a in addr_input.split('\n') if a.strip()]
-        st.title(f"🏢 부동산 {analysis_mode} 종합 리포트")
-        
-        # 탭 생성
-        tabs = st.tabs([f"📍 {a[:10]}.." for a in addresses])
-        
-        for i, tab in enumerate(tabs):
-            with tab:
-                curr_addr = addresses[i]
+if start_btn and not api_key:
+    st.error("❌ API Key가 설정되지 않았습니다.")
+elif start_btn or 'enterprise_run' in st.session_state:
+    # 분석 결과는 세션에 보관 (다운로드 준비/매칭 버튼으로 재실행돼도 화면 유지)
+    if start_btn:
+        st.session_state['enterprise_run'] = {
+            "mode": analysis_mode,
+            "addresses": [a.strip() for a in addr_input.split('\n') if a.strip()],
+            "results": {},
+        }
+    run = st.session_state['enterprise_run']
+    addresses = run['addresses']
+    st.title(f"🏢 부동산 {run['mode']} 종합 리포트")
+    
+    # 탭 생성
+    tabs = st.tabs([f"📍 {a[:10]}.." for a in addresses])
+    
+    for i, tab in enumerate(tabs):
+        with tab:
+            curr_addr = addresses[i]
+            
+            # 분석 실행 (스피너로 로딩 연출) - 주소별 결과는 세션에 보관해 재실행 시 AI 를 다시 호출하지 않음
+            if curr_addr not in run['results']:
+                with st.spinner(f"AI가 '{curr_addr}'을(를) {run['mode']} 관점에서 분석 중..."):
+                    run['results'][curr_addr] = run_simulation(curr_addr, run['mode'])
+            raw, facts, ai_text, model_name = run['results'][curr_addr]
+            
+            # 상단 메트릭
+            m1, m2, m3 = st.columns(3)
+            m1.metric("LTV (담보비율)", f"{facts['ltv']}%", "High Risk", delta_color="inverse")
+            m2.metric("권리 리스크", f"{len(raw['restrictions'])}건", "신탁/압류", delta_color="inverse")
+            m3.metric("잠재 가치 (절감액)", f"{facts['saved']/10000:,.0f}만 원/년", "기회", delta_color="normal")
+            
+            # 본문
+            c1, c2 = st.columns([2, 1])
+            with c1:
+                st.markdown(f"### 💡 AI 심층 컨설팅 ({model_name})")
+                st.markdown(ai_text)
                 
-                # 분석 실행 (스피너로 로딩 연출)
-                with st.spinner(f"AI가 '{curr_addr}'을(를) {analysis_mode} 관점에서 분석 중..."):
-                    raw, facts, ai_text, model_name = run_simulation(curr_addr, analysis_mode)
+                st.markdown("---")
+                st.subheader("📑 리포트 다운로드")
+                d1, d2, d3 = st.columns(3)
+                # 리포트 파일은 요청 시 생성, (양식 버전, 주소, 팩트, AI 문구, 작성일) 해시로 저장소에서 제공
+                report_inputs = {"address": curr_addr, "facts": facts, "date": datetime.now().strftime('%Y-%m-%d')}
+                with d1:
+                    # 한글 마크다운 다운로드
+                    lazy_download_button(
+                        "📄 정밀 리포트 (한글 .md)", "enterprise_md", ReportGenerator.VERSION, dict(report_inputs, ai_text=ai_text),
+                        lambda: ReportGenerator.create_markdown(curr_addr, facts, ai_text),
+                        file_name=f"Report_{i}.md", use_container_width=True)
+                with d2:
+                    # 한글 PDF: 구역(머리글/팩트/AI 본문/면책)별 캐시 -> 페르소나를 바꾸면 AI 본문 구역만 다시 그림
+                    if ReportGenerator.korean_pdf_available():
+                        lazy_download_button(
+                            "📕 정밀 리포트 (한글 .pdf)", "enterprise_korean_pdf", ReportGenerator.VERSION,
+                            dict(report_inputs, ai_text=ai_text),
+                            lambda: ReportGenerator.create_korean_pdf(curr_addr, facts, ai_text),
+                            file_name=f"Report_{i}.pdf", use_container_width=True)
+                    else:
+                        st.caption("⚠️ 한글 폰트(NanumGothic.ttf)가 없어 한글 PDF 를 제공할 수 없습니다. (.md 리포트를 이용하세요)")
+                with d3:
+                    # 영문 PDF 다운로드 (에러 방지용)
+                    lazy_download_button(
+                        "🇺🇸 Summary Report (.pdf)", "enterprise_pdf", ReportGenerator.VERSION, report_inputs,
+                        lambda: ReportGenerator.create_english_pdf(curr_addr, facts),
+                        file_name=f"Summary_{i}.pdf", use_container_width=True)
+
+            with c2:
+                st.markdown("### 🤝 플랫폼 파트너스")
                 
-                # 상단 메트릭
-                m1, m2, m3 = st.columns(3)
-                m1.metric("LTV (담보비율)", f"{facts['ltv']}%", "High Risk", delta_color="inverse")
-                m2.metric("권리 리스크", f"{len(raw['restrictions'])}건", "신탁/압류", delta_color="inverse")
-                m3.metric("잠재 가치 (절감액)", f"{facts['saved']/10000:,.0f}만 원/년", "기회", delta_color="normal")
+                # 1. 금융 매칭 (상태 유지 기능)
+                if f"match_{i}" not in st.session_state: st.session_state[f"match_{i}"] = False
                 
-                # 본문
-                c1, c2 = st.columns([2, 1])
-                with c1:
-                    st.markdown(f"### 💡 AI 심층 컨설팅 ({model_name})")
-                    st.markdown(ai_text)
-                    
-                    st.markdown("---")
-                    st.subheader("📑 리포트 다운로드")
-                    d1, d2 = st.columns(2)
-                    with d1:
-                        # 한글 마크다운 다운로드
-                        md_file = ReportGenerator.create_markdown(curr_addr, facts, ai_text)
-                        st.download_button("📄 정밀 리포트 (한글 .md)", md_file, file_name=f"Report_{i}.md", use_container_width=True)
-                    with d2:
-                        # 영문 PDF 다운로드 (에러 방지용)
-                        pdf_file = ReportGenerator.create_english_pdf(curr_addr, facts)
-                        st.download_button("🇺🇸 Summary Report (.pdf)", pdf_file, file_name=f"Summary_{i}.pdf", use_container_width=True)
+                if not st.session_state[f"match_{i}"]:
+                    if st.button(f"📞 금융 솔루션 매칭", key=f"btn_match_{i}", use_container_width=True):
+                        st.session_state[f"match_{i}"] = True
+                        st.rerun()
+                else:
+                    st.success("✅ 매칭 요청 완료!")
+                    st.caption("제안 도착: 신한은행, 우리은행, OK캐피탈")
+                    st.button("상담 취소", key=f"cancel_{i}")
 
-                with c2:
-                    st.markdown("### 🤝 플랫폼 파트너스")
-                    
-                    # 1. 금융 매칭 (상태 유지 기능)
-                    if f"match_{i}" not in st.session_state: st.session_state[f"match_{i}"] = False
-                    
-                    if not st.session_state[f"match_{i}"]:
-                        if st.button(f"📞 금융 솔루션 매칭", key=f"btn_match_{i}", use_container_width=True):
-                            st.session_state[f"match_{i}"] = True
-                            st.rerun()
-                    else:
-                        st.success("✅ 매칭 요청 완료!")
-                        st.caption("제안 도착: 신한은행, 우리은행, OK캐피탈")
-                        st.button("상담 취소", key=f"cancel_{i}")
+                # 2. 탁상감정 의뢰
+                st.markdown("---")
+                if f"appr_{i}" not in st.session_state: st.session_state[f"appr_{i}"] = False
+                
+                if not st.session_state[f"appr_{i}"]:
+                    if st.button(f"🏠 탁상감정 의뢰 (무료)", key=f"btn_appr_{i}", use_container_width=True):
+                        st.session_state[f"appr_{i}"] = True
+                        st.toast(f"문자 발송: [한국감정평가법인]에 '{curr_addr}' 의뢰 접수됨.")
+                        st.rerun()
+                else:
+                    st.info("🕒 감정 진행 중...")
+                    st.caption(f"접수번호: 2026-{random.randint(10000,99999)}")
+                
+                # 차트
+                st.markdown("---")
+                spec = cash_flow_chart(facts)  # PDF 보고서의 그래프와 같은 수치
+                fig = px.bar(chart_frame(spec), x="State", y="Cost", color="State", height=200, title=spec["title"])
+                st.plotly_chart(fig, use_container_width=True)
 
-                    # 2. 탁상감정 의뢰
-                    st.markdown("---")
-                    if f"appr_{i}" not in st.session_state: st.session_state[f"appr_{i}"] = False
-                    
-                    if not st.session_state[f"appr_{i}"]:
-                        if st.button(f"🏠 탁상감정 의뢰 (무료)", key=f"btn_appr_{i}", use_container_width=True):
-                            st.session_state[f"appr_{i}"] = True
-                            st.toast(f"문자 발송: [한국감정평가법인]에 '{curr_addr}' 의뢰 접수됨.")
-                            st.rerun()
-                    else:
-                        st.info("🕒 감정 진행 중...")
-                        st.caption(f"접수번호: 2026-{random.randint(10000,99999)}")
-                    
-                    # 차트
-                    st.markdown("---")
-                    df = pd.DataFrame({"State": ["Current", "Solution"], "Cost": [4800, 4800-(facts['saved']/10000)]})
-                    fig = px.bar(df, x="State", y="Cost", color="State", height=200, title="현금 흐름 개선")
-                    st.plotly_chart(fig, use_container_width=True)
+    # 전체 정밀 리포트 일괄 다운로드 (데이터룸 제출용) - 요청 시 한 번에 ZIP 으로 생성
+    bundle = [{"address": a, "facts": run['results'][a][1], "ai_text": run['results'][a][2]}
+              for a in addresses if a in run['results']]
+    if len(bundle) > 1:
+        st.markdown("---")
+
+        def build_bundle():
+            buffer = io.BytesIO()
+            export_markdown_bundle(bundle, buffer, "zip", workers=1)  # 건당 수십 µs 라 화면에서는 현재 프로세스로 충분
+            return buffer.getvalue()
+
+        lazy_download_button(
+            f"📦 전체 정밀 리포트 ({len(bundle)}건, .md ZIP)", "enterprise_md_bundle", ReportGenerator.VERSION,
+            {"reports": bundle, "date": datetime.now().strftime('%Y-%m-%d')}, build_bundle,
+            file_name="Reports.zip", mime="application/zip")
 
 else:
     st.info("👈 사이드바에서 분석 모드를 선택하고 '통합 분석 실행'을 누르세요.")
@@ -22,7 +22,8 @@ check_and_install("langchain-core")
 
 from dotenv import load_dotenv
 from langchain_google_genai import ChatGoogleGenerativeAI
-from langchain_core.prompts import PromptTemplate
+from agents.prompt_cache import get_prefix_cache
+from agents.model_router import ROUTER
 
 # [Step 1] 환경 설정
 # --------------------------------------------------------------------------------
@@ -59,67 +60,91 @@ MOCK_MARKET_INFO = """
 
 # [Step 3] 지상 AI 프로 엔진 (Gemini 1.5 Flash)
 # --------------------------------------------------------------------------------
+# 모든 요청에 공통인 고정 지침 (Context Cache 대상 프리픽스)
+ANALYSIS_INSTRUCTIONS = """
+당신은 상위 0.1% 부동산/금융 전문가 AI '지상'입니다.
+입력된 등기 데이터를 [8대 핵심 항목 + 3대 심화 전략]에 맞춰 정밀 분석하고,
+금융/중개/투자 전문가를 위한 'Actionable Report'를 작성하세요.
+
+---
+[분석 지침]
+1. **근저당 분석**: 
+   - 설정일 기준 24개월 경과 여부 확인 -> 대환대출(갈아타기) 추천 대상인지 판별.
+   - 권리자 분석 (1금융 vs 대부업) -> 고금리 대출 상환 전략 제시.
+   - 공동담보 중복 계산 방지 로직 적용 명시.
+2. **소유권 분석**: 상속/증여 여부, 단독/공유 지분 분석.
+3. **리스크 신호등(Traffic Light)**:
+   - 🔴위험: 경매/공매 개시, 임차권등기, 신탁등기(미확인 시), 가등기
+   - 🟡주의: 2금융권 과다 대출, 세금 체납 압류
+   - 🟢양호: 깨끗한 등기
+
+---
+[출력 양식 (Markdown)]
+## 🏢 [지상 AI] 초격차 권리/금융 분석 리포트
+
+### 1. 🚦 권리 리스크 신호등: [🔴/🟡/🟢] (핵심 사유)
+
+### 2. 💰 금융/대출 세일즈 포인트 (Leads)
+- **대환대출 기회**: [유/무] (이유: 예 - 국민은행 근저당 4년 경과, 금리 인하 활용 가능)
+- **신용회복 솔루션**: [필요/불필요] (이유: 예 - 대부업체 고금리 이용 중)
+- **LTV 추정**: (공동담보 고려한 실채권액 추산)
+
+### 3. ⚖️ 상세 권리 분석 (Deep Dive)
+- **소유 형태**: [개인/법인] (상속/증여 여부)
+- **갑구 리스크**: (가압류/신탁 등기 상세 해설 및 대응법)
+- **을구 리스크**: (임차권등기 말소 조건부 계약 필수 등)
+
+### 4. 📝 전문가(중개/금융)를 위한 한 줄 제언
+> [여기에 전문가가 고객에게 브리핑할 멘트 작성]
+"""
+
+# 요청마다 바뀌는 부분 (주소 / 등기 / 시장 데이터)
+ANALYSIS_TARGET_TEMPLATE = """
+---
+[분석 대상]: {address}
+[등기/공적장부]: {doc_data}
+[시장 상황]: {market_data}
+"""
+
+# 분석은 창의성 0, 정확도 100 (LangChain 호출 / 서버 캐시 호출 공통)
+ANALYSIS_TEMPERATURE = 0.0
+
 class JisangProEngine:
     def __init__(self):
         if not api_key:
             print("❌ [오류] API Key가 없습니다.")
             sys.exit(1)
         
-        # 가성비와 속도가 뛰어난 Flash 모델 사용
-        self.llm = ChatGoogleGenerativeAI(
-            model="gemini-1.5-flash", 
-            temperature=0.0, # 분석은 창의성 0, 정확도 100
-            google_api_key=api_key
-        )
+        # 단순 건은 가성비와 속도가 뛰어난 Flash, 복잡한 건만 Pro 로 라우팅
+        self.router = ROUTER
+        self.llms = {}
+        # 고정 지침은 프로세스당 1회만 등록 (서버 캐시 불가 시 로컬 프리픽스)
+        self.prefix_cache = get_prefix_cache(api_key)
+
+    def get_llm(self, model):
+        if model not in self.llms:
+            self.llms[model] = ChatGoogleGenerativeAI(
+                model=model,
+                temperature=ANALYSIS_TEMPERATURE,
+                google_api_key=api_key
+            )
+        return self.llms[model]
 
     def analyze_advanced(self, address, doc_data, market_data):
-        prompt = PromptTemplate.from_template("""
-            당신은 상위 0.1% 부동산/금융 전문가 AI '지상'입니다.
-            입력된 등기 데이터를 [8대 핵심 항목 + 3대 심화 전략]에 맞춰 정밀 분석하고,
-            금융/중개/투자 전문가를 위한 'Actionable Report'를 작성하세요.
-
-            [분석 대상]: {address}
-            [등기/공적장부]: {doc_data}
-            [시장 상황]: {market_data}
-
-            ---
-            [분석 지침]
-            1. **근저당 분석**: 
-               - 설정일 기준 24개월 경과 여부 확인 -> 대환대출(갈아타기) 추천 대상인지 판별.
-               - 권리자 분석 (1금융 vs 대부업) -> 고금리 대출 상환 전략 제시.
-               - 공동담보 중복 계산 방지 로직 적용 명시.
-            2. **소유권 분석**: 상속/증여 여부, 단독/공유 지분 분석.
-            3. **리스크 신호등(Traffic Light)**:
-               - 🔴위험: 경매/공매 개시, 임차권등기, 신탁등기(미확인 시), 가등기
-               - 🟡주의: 2금융권 과다 대출, 세금 체납 압류
-               - 🟢양호: 깨끗한 등기
-            
-            ---
-            [출력 양식 (Markdown)]
-            ## 🏢 [지상 AI] 초격차 권리/금융 분석 리포트
-
-            ### 1. 🚦 권리 리스크 신호등: [🔴/🟡/🟢] (핵심 사유)
-            
-            ### 2. 💰 금융/대출 세일즈 포인트 (Leads)
-            - **대환대출 기회**: [유/무] (이유: 예 - 국민은행 근저당 4년 경과, 금리 인하 활용 가능)
-            - **신용회복 솔루션**: [필요/불필요] (이유: 예 - 대부업체 고금리 이용 중)
-            - **LTV 추정**: (공동담보 고려한 실채권액 추산)
-
-            ### 3. ⚖️ 상세 권리 분석 (Deep Dive)
-            - **소유 형태**: [개인/법인] (상속/증여 여부)
-            - **갑구 리스크**: (가압류/신탁 등기 상세 해설 및 대응법)
-            - **을구 리스크**: (임차권등기 말소 조건부 계약 필수 등)
-
-            ### 4. 📝 전문가(중개/금융)를 위한 한 줄 제언
-            > [여기에 전문가가 고객에게 브리핑할 멘트 작성]
-        """)
-        
-        chain = prompt | self.llm
-        return chain.invoke({
-            "address": address,
-            "doc_data": doc_data,
-            "market_data": market_data
-        }).content
+        model = self.router.route(self.router.score_text(doc_data))
+        # 캐시는 모델 단위로 생성되므로 라우팅된 모델별로 프리픽스 등록
+        prefix = self.prefix_cache.register(f"pro-analysis:{model}", model, ANALYSIS_INSTRUCTIONS)
+
+        # 고정 지침은 캐시 핸들로 재사용하고, 물건별 데이터만 새로 전송
+        dynamic = ANALYSIS_TARGET_TEMPLATE.format(
+            address=address, doc_data=doc_data, market_data=market_data
+        )
+        llm = self.get_llm(model)
+        # 비용 추정은 고정 지침(프리픽스) 포함 전체 입력 기준 (서버 캐시 할인 미반영 상한값)
+        return self.router.track(model, prefix.prefix + dynamic, lambda: self.prefix_cache.generate(
+            prefix, dynamic, lambda prompt: llm.invoke(prompt).content,
+            generation_config={"temperature": llm.temperature},
+        ))
 
 # [Step 4] 실행 (Orchestration)
 # --------------------------------------------------------------------------------
@@ -139,7 +164,7 @@ async def main():
     print("   >>> ⏳ [Time Check] 국민은행 근저당(2020년) -> 24개월 경과 확인 (대환 타겟)")
     print("   >>> 🚨 [Risk Check] '러시앤캐시(대부)' 및 '임차권등기' 감지 -> Red Flag")
 
-    print("\n[Phase 2] Gemini 1.5 Flash 초고속 정밀 추론")
+    print("\n[Phase 2] Gemini 난이도 기반 라우팅 추론 (Flash / Pro)")
     engine = JisangProEngine()
     
     start = time.time()
@@ -150,6 +175,8 @@ async def main():
     print("-" * 80)
     print(result)
     print("-" * 80)
+    print(f"   >>> 🧊 프롬프트 캐시 현황: {engine.prefix_cache.report()}")
+    print(f"   >>> 🔀 모델 라우팅 현황: {engine.router.report()}")
     print("\n[System] 결과가 금융 영업 리스트 및 중개사 CRM에 자동 저장되었습니다.")
 
 if __name__ == "__main__":
@@ -1,4 +1,4 @@
-    import os
+import os
 import sys
 import time
 import subprocess
@@ -38,38 +38,34 @@ if "streamlit" not in sys.modules:
 
 # ================================================================================
 import streamlit as st
-from fpdf import FPDF
+from agents.pdf_fonts import FONTS, FPDF  # fpdf 1.7 은 글자 서브셋 캐시 사용
 
 # --------------------------------------------------------------------------------
 # [Engine] 한글 PDF 생성 엔진 (Korean PDF Generator)
 # --------------------------------------------------------------------------------
+# 한글 폰트는 프로세스당 1회만 등록하고, 문서마다 참조로 연결 (header 는 set_font 만)
+FONTS.register('NanumGothic', 'NanumGothic.ttf')
+
 class PDF(FPDF):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # 폰트가 있을 때만 한글 적용 (없으면 Arial)
+        self.font_name = FONTS.attach(self, 'NanumGothic', fallback='Arial')
+
     def header(self):
-        # 폰트가 있을 때만 한글 적용
-        if os.path.exists("NanumGothic.ttf"):
-            self.add_font('NanumGothic', '', 'NanumGothic.ttf', uni=True)
-            self.set_font('NanumGothic', '', 10)
-        else:
-            self.set_font('Arial', '', 10)
+        self.set_font(self.font_name, '', 10)
         self.cell(0, 10, 'Jisang AI Real Estate Solution', 0, 1, 'R')
         self.ln(5)
 
     def footer(self):
         self.set_y(-15)
-        if os.path.exists("NanumGothic.ttf"):
-            self.set_font('NanumGothic', '', 8)
-        else:
-            self.set_font('Arial', 'I', 8)
+        self.set_font(self.font_name, '' if self.font_name == 'NanumGothic' else 'I', 8)
         self.cell(0, 10, f'Page {self.page_no()}', 0, 0, 'C')
 
 def generate_korean_pdf(address, data, ai_summary):
     pdf = PDF()
     pdf.add_page()
-    
-    # 폰트 로드 (파일이 없으면 에러 방지 위해 Arial 사용)
-    font_name = 'NanumGothic' if os.path.exists("NanumGothic.ttf") else 'Arial'
-    if font_name == 'NanumGothic':
-        pdf.add_font(font_name, '', 'NanumGothic.ttf', uni=True)
+    font_name = pdf.font_name
     
     # 1. 타이틀
     pdf.set_font(font_name, '', 24)
@@ -0,0 +1,61 @@
+"""
+지상 AI 엔터프라이즈 - 포트폴리오 마크다운 리포트 일괄 생성 (데이터룸 제출용)
+Streamlit 화면 없이 수백 건의 정밀 리포트(.md)를 만들어 ZIP/TAR 하나로 기록합니다.
+
+실행: python jisang_report_bundle.py portfolio.jsonl -o reports.zip
+  입력 (.json / .jsonl): {"address": ..., "facts": {"ltv", "total", "count", "saved"}, "ai_text": ...}
+       (.csv): 분석 결과 CSV (agents/table_export) - address, ltv, total, count, saved 열 (AI 문구는 기본 문구)
+  출력: .zip / .tar / .tar.gz (-o - 이면 표준출력으로 스트리밍, 형식은 --format)
+"""
+import os
+import sys
+import csv
+import json
+import argparse
+
+from agents.markdown_bundle import BUNDLE_FORMATS, bundle_format, export_markdown_bundle
+
+
+def read_reports(path):
+    """입력 파일을 한 건씩 읽음 (전체를 메모리에 올리지 않음, .json 배열만 예외)"""
+    if path.lower().endswith(".csv"):
+        with open(path, encoding="utf-8-sig", newline="") as f:
+            for row in csv.DictReader(f):
+                facts = {"ltv": float(row["ltv"]), "total": int(row["total"]), "count": int(row["count"]),
+                         "saved": int(row["saved"])}
+                yield {"address": row["address"], "facts": facts, "ai_text": row.get("ai_text")}
+    elif path.lower().endswith(".jsonl"):
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+    else:
+        with open(path, encoding="utf-8") as f:
+            yield from json.load(f)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="포트폴리오 마크다운 리포트 일괄 생성 (ZIP/TAR)")
+    parser.add_argument("input", help="포트폴리오 (.json / .jsonl / .csv)")
+    parser.add_argument("-o", "--output", default="reports.zip", help="출력 파일 (- 이면 표준출력)")
+    parser.add_argument("--format", choices=BUNDLE_FORMATS, help="묶음 형식 (기본: 출력 파일 확장자)")
+    parser.add_argument("--workers", type=int, default=None, help="작업 프로세스 수 (기본: CPU 수)")
+    parser.add_argument("--batch-size", type=int, default=256)
+    parser.add_argument("--date", help="작성일 (기본: 오늘, YYYY-MM-DD)")
+    args = parser.parse_args()
+
+    fmt = args.format or (bundle_format(args.output) if args.output != "-" else "zip")
+    out = sys.stdout.buffer if args.output == "-" else args.output
+
+    def progress(done):
+        print(f"\r📝 {done:,}건 생성", end="", file=sys.stderr, flush=True)
+
+    result = export_markdown_bundle(read_reports(args.input), out, fmt, date=args.date, workers=args.workers,
+                                    batch_size=args.batch_size, progress=progress)
+    target = "stdout" if args.output == "-" else os.path.abspath(args.output)
+    print(f"\n✅ {result['files']:,}건 -> {target} ({fmt}, {result['seconds']}초, "
+          f"{result['reports_per_sec']:,.0f}건/초, 작업 프로세스 {result['workers']}개)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -37,6 +37,8 @@ import plotly.express as px
 import google.generativeai as genai
 from fpdf import FPDF
 from dotenv import load_dotenv
+from agents.chat_memory import ChatMemory, gemini_summarizer
+from agents.llm_call import call_models, LLMCallError
 
 load_dotenv()
 api_key = os.getenv("GOOGLE_API_KEY")
@@ -45,9 +47,10 @@ if api_key: genai.configure(api_key=api_key)
 # --------------------------------------------------------------------------------
 # [Engine 1] 챗봇 전용 무중단 연결 엔진 (Robust Chat Engine)
 # --------------------------------------------------------------------------------
-def get_chat_response(messages, context_data):
+def get_chat_response(memory, context_data):
     """
     대화 기록과 부동산 데이터를 결합하여 끊김 없는 답변 생성
+    (memory: 최근 K턴 + 롤링 요약만 전달하는 ChatMemory -> 프롬프트 크기 고정)
     """
     # 1. 시스템 프롬프트 (페르소나 정의)
     system_prompt = f"""
@@ -69,18 +72,22 @@ def get_chat_response(messages, context_data):
     # 2. 모델 순환 호출 (Fail-over)
     models = ['gemini-1.5-flash', 'gemini-1.5-pro', 'gemini-2.0-flash']
     
-    # 대화 히스토리 포맷팅
-    history_text = "\n".join([f"{m['role']}: {m['content']}" for m in messages])
+    # 대화 히스토리 포맷팅 (요약 + 최근 대화)
+    history_text = memory.render()
     full_prompt = f"{system_prompt}\n\n[이전 대화]\n{history_text}\n\nAI 답변:"
 
-    for m in models:
-        try:
-            model = genai.GenerativeModel(m)
-            response = model.generate_content(full_prompt)
-            if response.text:
-                return response.text
-        except:
-            continue
+    def generate(m):
+        text = genai.GenerativeModel(m).generate_content(full_prompt).text
+        if not text:
+            raise ValueError("빈 응답")
+        return text
+
+    # 쿼터/타임아웃은 백오프 후 재시도, 4xx 는 즉시 다음 모델 (전체 15초 제한)
+    try:
+        reply, _ = call_models(models, generate, deadline=15.0)
+        return reply
+    except LLMCallError:
+        pass
     
     return "죄송합니다. 현재 접속량이 많아 연결이 지연되고 있습니다. 우측 '전문가 매칭' 버튼을 눌러주시면 담당자가 직접 전화드리겠습니다."
 
@@ -238,10 +245,16 @@ if 'run_analysis' in st.session_state and st.session_state['run_analysis']:
                 
                 # 채팅 기록 초기화
                 chat_key = f"chat_history_{i}"
+                memory_key = f"chat_memory_{i}"
                 if chat_key not in st.session_state:
                     st.session_state[chat_key] = [
                         {"role": "bot", "content": f"안녕하세요! '{curr_addr}' 분석을 완료했습니다. \n\n보유하신 대출 중 **대부업 대출**을 1금융권으로 대환하면 **연 {facts['saved']/10000:,.0f}만 원**을 아낄 수 있습니다. \n\n진행 절차나 공동담보 해지에 대해 궁금한 점이 있으신가요?"}
                     ]
+                # 프롬프트용 대화 메모리 (화면 표시용 기록과 별도로 크기 제한)
+                if memory_key not in st.session_state:
+                    memory = ChatMemory(max_turns=6, summarizer=gemini_summarizer() if api_key else None)
+                    memory.extend(st.session_state[chat_key])
+                    st.session_state[memory_key] = memory
                 
                 # 채팅 UI 컨테이너
                 chat_container = st.container(height=520)
@@ -261,6 +274,7 @@ if 'run_analysis' in st.session_state and st.session_state['run_analysis']:
                 if submit_button and user_input:
                     # 1. 사용자 메시지 추가
                     st.session_state[chat_key].append({"role": "user", "content": user_input})
+                    st.session_state[memory_key].add("user", user_input)
                     
                     # 2. AI 응답 생성 (강화된 연결성)
                     context_data = {
@@ -271,9 +285,10 @@ if 'run_analysis' in st.session_state and st.session_state['run_analysis']:
                     # 즉시 렌더링을 위해 Rerun 전에 spinner 사용
                     with chat_container:
                         with st.spinner("분석 중..."):
-                            bot_reply = get_chat_response(st.session_state[chat_key], context_data)
+                            bot_reply = get_chat_response(st.session_state[memory_key], context_data)
                     
                     st.session_state[chat_key].append({"role": "bot", "content": bot_reply})
+                    st.session_state[memory_key].add("bot", bot_reply)
                     st.rerun()
 
     # B2B Export
@@ -2,8 +2,6 @@ import os
 import sys
 import time
 import subprocess
-import random
-import pandas as pd
 from datetime import datetime
 from dateutil.relativedelta import relativedelta
 
@@ -35,102 +33,21 @@ if "streamlit" not in sys.modules:
 import streamlit as st
 import plotly.express as px
 import google.generativeai as genai
-from fpdf import FPDF
 from dotenv import load_dotenv
+from agents.intent_registry import REGISTRY
+from agents.hybrid_responder import get_hybrid_response  # [Engine 1] 하이브리드 챗봇 (규칙 우선 -> AI Fallback)
+from agents.portfolio_index import PortfolioIndex
+from agents.report_engine import ReportEngine  # [Engine 2] 리포트 엔진
+from agents.portfolio_export import export_pdf_zip
+from agents.table_export import FORMATS as TABLE_FORMATS
+from agents.report_charts import chart_frame, financing_cost_chart
+from agents.lazy_download import lazy_download_button  # 다운로드 파일은 요청 시 생성
+from agents.artifact_store import ARTIFACTS
 
 load_dotenv()
 api_key = os.getenv("GOOGLE_API_KEY")
 if api_key: genai.configure(api_key=api_key)
 
-# --------------------------------------------------------------------------------
-# [Engine 1] 하이브리드 챗봇 엔진 (Hybrid Chat Engine)
-# Strategy: Rule-based First -> AI Fallback
-# --------------------------------------------------------------------------------
-def get_hybrid_response(user_input, context_data):
-    """
-    1단계: 핵심 키워드가 있으면 Python 데이터로 즉시 답변 (정확도 100%, 속도 최상)
-    2단계: 키워드가 없으면 Gemini AI에게 질의 (자유도 높음)
-    """
-    user_input = user_input.lower()
-    
-    # [Rule 1] 공동담보 / 채권 관련 질문
-    if any(k in user_input for k in ["공동", "담보", "채권", "얼마", "목록"]):
-        bonds_list = "\n".join([f"- **{b['bank']}**: {b['amount']:,}원 ({b['date']} 설정)" for b in context_data['raw_bonds']])
-        return f"""
-        📋 **등기부 채권(공동담보) 현황**입니다.
-        
-        {bonds_list}
-        
-        총 채권액은 **{context_data['total']:,}원**이며, 이는 시세 대비 **{context_data['ltv']}%** 수준입니다.
-        이 중 고금리 대출을 선별하여 정리하는 것이 핵심입니다.
-        """
-
-    # [Rule 2] 대환 / 금리 / 이자 / 절약 관련 질문
-    if any(k in user_input for k in ["대환", "금리", "이자", "절약", "아낄"]):
-        return f"""
-        💰 **금융 최적화 분석 결과**입니다.
-        
-        현재 보유하신 대출 중 일부(대부업 등)를 1금융권으로 전환할 경우,
-        **연간 약 {context_data['saved']:,}원**의 이자를 즉시 줄일 수 있습니다.
-        
-        월 250만 원의 현금 흐름이 개선되는 효과가 있습니다. 바로 진행 절차를 안내해 드릴까요?
-        """
-
-    # [Rule 3] 신탁 / 압류 / 리스크 관련 질문
-    if any(k in user_input for k in ["신탁", "압류", "위험", "리스크", "안전"]):
-        return f"""
-        🚨 **권리 리스크 긴급 진단**
-        
-        현재 이 물건에는 **{context_data['restrictions']}** 등기가 설정되어 있습니다.
-        특히 '신탁등기' 상태에서는 임의로 계약하거나 대출을 받을 수 없습니다.
-        
-        반드시 **신탁 말소 동의**와 **채무 변제**가 동시에 이루어져야 안전합니다. 전문가의 조력이 필수적인 단계입니다.
-        """
-
-    # [Fallback] AI 모델 호출 (일반 대화)
-    try:
-        model = genai.GenerativeModel('gemini-1.5-flash')
-        prompt = f"""
-        부동산 비서로서 답변. 데이터: {context_data}. 질문: {user_input}.
-        친절하고 전문적인 어조로 답변하고, 끝에 전문가 상담을 권유할 것.
-        """
-        response = model.generate_content(prompt)
-        return response.text
-    except:
-        return "죄송합니다. 상세 상담을 위해 우측 '전문가 호출' 버튼을 눌러주시면 담당자가 바로 연락드리겠습니다."
-
-# --------------------------------------------------------------------------------
-# [Engine 2] 리포트 엔진
-# --------------------------------------------------------------------------------
-class ReportEngine:
-    @staticmethod
-    def create_safe_pdf(facts):
-        pdf = FPDF()
-        pdf.add_page()
-        pdf.set_font("Arial", "B", 16)
-        pdf.cell(0, 10, "Jisang AI | Analysis Report", 0, 1, 'C')
-        pdf.ln(10)
-        
-        asset_id = f"ASSET-{random.randint(10000, 99999)}"
-        pdf.set_font("Arial", "", 12)
-        pdf.cell(0, 10, f"Ref ID: {asset_id}", 0, 1)
-        pdf.cell(0, 10, f"Date: {datetime.now().strftime('%Y-%m-%d')}", 0, 1)
-        pdf.ln(5)
-        
-        pdf.set_font("Arial", "B", 14)
-        pdf.cell(0, 10, "Summary", 0, 1)
-        pdf.set_font("Arial", "", 12)
-        pdf.cell(0, 10, f"- LTV Ratio: {facts['ltv']}%", 0, 1)
-        pdf.cell(0, 10, f"- Total Debt: {facts['total']:,} KRW", 0, 1)
-        pdf.cell(0, 10, f"- Annual Saving: {facts['saved']:,} KRW", 0, 1)
-        pdf.ln(10)
-        pdf.multi_cell(0, 7, "High risk detected. Immediate refinancing recommended.")
-        return pdf.output(dest='S').encode('latin-1', errors='replace')
-
-    @staticmethod
-    def create_excel_csv(data_list):
-        df = pd.DataFrame(data_list)
-        return df.to_csv(index=False).encode('utf-8-sig')
 
 class FactChecker:
     @staticmethod
@@ -155,7 +72,7 @@ class FactChecker:
             "address": raw_data['address'],
             "ltv": ltv, "count": len(target_bonds), "total": total, 
             "saved": int(saved_interest), "score": score,
-            "restrictions": raw_data['restrictions'],
+            "restrictions": raw_data['restrictions'], "zoning": raw_data.get('zoning'),
             "raw_bonds": raw_data['bonds'] # 챗봇용 원본 데이터 전달
         }
 
@@ -164,7 +81,7 @@ def run_simulation(addr):
         "address": addr, "market_price": 850000000,
         "bonds": [{"bank": "국민은행", "date": "2018.06.20", "amount": 400000000, "type": "1금융"},
                   {"bank": "러시앤캐시", "date": "2024.01.10", "amount": 200000000, "type": "대부업"}],
-        "restrictions": ["신탁등기", "압류"]
+        "restrictions": ["신탁등기", "압류"], "zoning": "계획관리지역"
     }
     facts = FactChecker.process(raw)
     
@@ -202,9 +119,20 @@ with st.sidebar:
         st.session_state['run_analysis'] = True
         st.session_state['messages'] = {}
 
+    with st.expander("🧭 의도 판별 현황 (AI fallback 비율)"):
+        st.json(REGISTRY.report())
+
 if 'run_analysis' in st.session_state and st.session_state['run_analysis']:
     address_list = [a.strip() for a in addr_input.split('\n') if a.strip()]
-    all_results = []
+    simulations = [run_simulation(a) for a in address_list]
+    all_results = [facts for _, facts, _ in simulations]
+    # 챗봇의 포트폴리오 전체 질의용 역색인 (권리제한 / 채권자 / 채권유형 / 용도지역 / LTV)
+    # 채팅 메시지마다 화면이 다시 실행되므로 주소 목록이 바뀔 때만 새로 만듦
+    index_key = ("portfolio_index", tuple(address_list))
+    if st.session_state.get("portfolio_index_key") != index_key:
+        st.session_state["portfolio_index"] = PortfolioIndex.from_facts(all_results)
+        st.session_state["portfolio_index_key"] = index_key
+    portfolio = st.session_state["portfolio_index"]
     
     st.title("🤖 지상 AI: 부동산 자산 관리 솔루션")
     
@@ -213,8 +141,7 @@ if 'run_analysis' in st.session_state and st.session_state['run_analysis']:
     for i, tab in enumerate(tabs):
         with tab:
             curr_addr = address_list[i]
-            raw, facts, ai_text = run_simulation(curr_addr)
-            all_results.append(facts)
+            raw, facts, ai_text = simulations[i]
             
             # Layout
             c_left, c_right = st.columns([1, 1])
@@ -229,15 +156,18 @@ if 'run_analysis' in st.session_state and st.session_state['run_analysis']:
                     m1.metric("LTV", f"{facts['ltv']}%", "High Risk", delta_color="inverse")
                     m2.metric("예상 절감액", f"{facts['saved']/10000:,.0f}만 원", "Profit")
                     
-                    df_chart = pd.DataFrame({"State": ["Current", "Optimized"], "Cost": [facts['total']*0.06, facts['total']*0.06 - facts['saved']]})
-                    fig = px.bar(df_chart, x="State", y="Cost", color="State", title="금융비용 최적화", height=200)
+                    spec = financing_cost_chart(facts)  # PDF 보고서의 그래프와 같은 수치
+                    fig = px.bar(chart_frame(spec), x="State", y="Cost", color="State", title=spec["title"], height=200)
                     st.plotly_chart(fig, use_container_width=True, key=f"chart_{i}")
                     
                     st.markdown("---")
                     b1, b2 = st.columns(2)
                     with b1:
-                        pdf = ReportEngine.create_safe_pdf(facts)
-                        st.download_button("📄 PDF 다운로드", pdf, f"Report_{i}.pdf", "application/pdf", key=f"pdf_{i}", use_container_width=True)
+                        lazy_download_button(
+                            "📄 PDF 다운로드", "safe_pdf", ReportEngine.VERSION,
+                            {"facts": facts, "date": datetime.now().strftime('%Y-%m-%d')},
+                            lambda: ReportEngine.create_safe_pdf(facts), f"Report_{i}.pdf", "application/pdf",
+                            key=f"pdf_{i}", use_container_width=True)
                     with b2:
                         if st.button("📞 담당자 호출", key=f"call_{i}", use_container_width=True, type="primary"):
                             st.toast("✅ 담당자 배정 완료. 5분 내 연락드립니다.")
@@ -276,12 +206,37 @@ if 'run_analysis' in st.session_state and st.session_state['run_analysis']:
                     }
                     
                     # 즉시 답변 (No Spinner for Rule-based)
-                    bot_reply = get_hybrid_response(user_input, context_data)
+                    bot_reply = get_hybrid_response(user_input, context_data, portfolio)
                     
                     st.session_state[chat_key].append({"role": "bot", "content": bot_reply})
                     st.rerun()
 
     st.markdown("---")
-    csv = ReportEngine.create_excel_csv(all_results)
-    st.download_button("📥 전체 분석 결과 (CSV)", csv, "Portfolio.csv", "text/csv")
-    
\ No newline at end of file
+    c_csv, c_xlsx, c_parquet = st.columns(3)
+    with c_csv:
+        lazy_download_button("📥 전체 분석 결과 (CSV)", "sales_portfolio_csv", ReportEngine.VERSION, all_results,
+                             lambda: ReportEngine.create_excel_csv(all_results), "Portfolio.csv", "text/csv")
+    with c_xlsx:
+        lazy_download_button("📥 전체 분석 결과 (Excel)", "sales_portfolio_xlsx", ReportEngine.VERSION, all_results,
+                             lambda: ReportEngine.create_table(all_results, "xlsx"), "Portfolio.xlsx", TABLE_FORMATS["xlsx"])
+    with c_parquet:
+        lazy_download_button("📥 전체 분석 결과 (Parquet)", "sales_portfolio_parquet", ReportEngine.VERSION, all_results,
+                             lambda: ReportEngine.create_table(all_results, "parquet"), "Portfolio.parquet",
+                             TABLE_FORMATS["parquet"])
+
+    # 전체 PDF 일괄 생성: 프로세스 풀에서 만들어 끝나는 대로 ZIP 에 기록
+    # 보고서 저장소에 입력 해시로 보관 (화면 갱신 시 재생성하지 않고, 오래된 ZIP 은 용량 한도로 정리)
+    zip_args = ("sales_portfolio_pdf_zip", ReportEngine.VERSION,
+                {"facts": all_results, "date": datetime.now().strftime('%Y-%m-%d')})
+    zip_path = ARTIFACTS.find(*zip_args, ext="zip")
+    if zip_path is None and st.button(f"📦 전체 PDF 일괄 생성 ({len(address_list)}건, ZIP)"):
+        bar = st.progress(0.0, text="PDF 생성 준비 중...")
+        result = {}
+        zip_path = ARTIFACTS.fetch_path(*zip_args, lambda path: result.update(export_pdf_zip(
+            all_results, path,
+            progress=lambda done, total: bar.progress(done / total, text=f"PDF 생성 중... {done}/{total}"),
+        )), ext="zip")
+        bar.progress(1.0, text=f"✅ {result['files']}건 완료 ({result['seconds']}초, 작업 프로세스 {result['workers']}개)")
+    if zip_path is not None:
+        with open(zip_path, "rb") as f:
+            st.download_button("📥 전체 PDF 다운로드 (ZIP)", f, "Portfolio_Reports.zip", "application/zip")
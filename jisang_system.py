@@ -66,7 +66,7 @@ class JisangBrain:
             print(f"⚠️ 모델 로드 실패: {e}")
             self.status = "OFFLINE"
 
-    def analyze_property(self, data):
+    async def analyze_property(self, data):
         if self.status == "OFFLINE" or not api_key:
             return "❌ [오류] API Key가 없거나 모델 연결에 실패했습니다."
 
@@ -90,7 +90,8 @@ class JisangBrain:
         """)
         
         chain = prompt | self.llm
-        return chain.invoke(data).content
+        # 비동기 호출 (ainvoke) - 대기 중에도 이벤트 루프가 다른 분석을 진행
+        return (await chain.ainvoke(data)).content
 
 # [Step 4] 오케스트레이터 (통합 제어)
 # --------------------------------------------------------------------------------
@@ -101,7 +102,7 @@ async def main():
 
     # 1. 데이터 수집
     print(f"\n[1단계] 데이터 수집 중... (Target: {MOCK_DATA['address']})")
-    time.sleep(1)
+    await asyncio.sleep(1)
     print("   >>> 등기부등본 파싱 완료.")
     print("   >>> 토지이용계획원 분석 완료.")
     print("   >>> ⚠️ [경고] '신탁' 및 '압류' 키워드 감지!")
@@ -111,7 +112,7 @@ async def main():
     brain = JisangBrain()
     
     start = time.time()
-    result = brain.analyze_property(MOCK_DATA)
+    result = await brain.analyze_property(MOCK_DATA)
     end = time.time()
 
     # 3. 결과 출력
@@ -37,6 +37,7 @@ import plotly.express as px
 import google.generativeai as genai
 from fpdf import FPDF
 from dotenv import load_dotenv
+from agents.intent_registry import REGISTRY
 
 load_dotenv()
 api_key = os.getenv("GOOGLE_API_KEY")
@@ -72,54 +73,9 @@ class DomainExpert:
 # [Engine 2] 스마트 챗봇 (Intent Navigation)
 # --------------------------------------------------------------------------------
 def get_universe_response(user_input, context):
-    user_input = user_input.lower()
-    
-    # 1. 네비게이션 (Intent: Guide/Help)
-    if any(k in user_input for k in ["안내", "도와줘", "시작", "뭐", "기능", "메뉴"]):
-        return """
-        🤖 **지상 AI 유니버스에 오신 것을 환영합니다.**
-        원하시는 분석 분야를 말씀해 주세요:
-        
-        1. **💰 금융**: "이자 얼마나 줄일 수 있어?"
-        2. **⚖️ 세무**: "취득세 계산해줘."
-        3. **🏗️ 개발**: "이 땅 개발하면 얼마나 벌어?"
-        4. **📋 권리**: "신탁등기가 뭐야?"
-        """
-
-    # 2. 금융 (Finance)
-    if any(k in user_input for k in ["금융", "이자", "대출", "대환", "금리"]):
-        return f"""
-        💰 **금융 최적화 분석**
-        현재 대출 구조를 분석한 결과, **연간 {context['finance_saving']:,}원**의 이자 절감이 가능합니다.
-        대부업 대출을 1금융권으로 대환하는 '통합 금융 솔루션'을 제안합니다.
-        """
-
-    # 3. 세무 (Tax)
-    if any(k in user_input for k in ["세금", "세무", "취득", "양도", "비용"]):
-        return f"""
-        ⚖️ **예상 세금 분석**
-        이 물건(공장용지) 매입 시 예상 취득세는 약 **{context['tax_est']:,}원** ({context['tax_rate']}%)입니다.
-        법인 명의 취득 시 중과세 여부를 검토하려면 전문가 상담을 요청하세요.
-        """
-
-    # 4. 개발 (Development)
-    if any(k in user_input for k in ["개발", "건축", "수익", "시행", "분양"]):
-        return f"""
-        🏗️ **개발 타당성 분석 (가상 시뮬레이션)**
-        이 부지에 공장을 신축하여 분양할 경우, 예상 수익은 **{context['dev_profit']:,}원** (ROI {context['dev_roi']}%)입니다.
-        *건폐율/용적률 및 상세 설계에 따라 달라질 수 있습니다.*
-        """
-
-    # 5. 권리/리스크 (Risk)
-    if any(k in user_input for k in ["권리", "신탁", "압류", "위험"]):
-        return f"""
-        🚨 **권리 리스크 경고**
-        현재 **{context['restrictions']}**가 설정되어 있어 소유권 행사가 제한됩니다.
-        일반 매매 계약은 위험하며, 반드시 신탁 말소 동의서를 선행해야 합니다.
-        """
-
-    # Fallback: AI 연결
-    return "죄송합니다. 더 구체적으로 질문해 주시거나, 우측 '전문가 호출' 버튼을 눌러주세요."
+    # 의도/키워드/답변은 data/intents.json 의 universe_basic 에서 관리 (이 화면 전용 상세 답변)
+    intent, answer = REGISTRY.bot("universe_basic").respond(user_input.lower(), context)
+    return answer
 
 # --------------------------------------------------------------------------------
 # [UI/UX] Universe Dashboard
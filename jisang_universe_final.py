@@ -26,6 +26,7 @@ if "streamlit" not in sys.modules:
 import streamlit as st
 import google.generativeai as genai
 from dotenv import load_dotenv
+from agents.intent_registry import REGISTRY
 
 load_dotenv()
 api_key = os.getenv("GOOGLE_API_KEY")
@@ -56,29 +57,9 @@ class DomainExpert:
 # [Chatbot] 응답 로직
 # --------------------------------------------------------------------------------
 def get_universe_response(user_input, context):
-    user_input = user_input.lower()
-    
-    if any(k in user_input for k in ["안내", "도와줘", "시작", "기능", "메뉴"]):
-        return """
-        👋 **지상 AI 유니버스에 오신 것을 환영합니다.**
-        
-        원하시는 분석 분야를 선택하거나 질문해 주세요:
-        
-        1. **금융 분석**: "이자 얼마나 줄일 수 있어?"
-        2. **세무 계산**: "취득세 계산해줘."
-        3. **개발 타당성**: "이 땅 개발하면 얼마나 벌어?"
-        4. **권리 분석**: "신탁등기가 뭐야?"
-        """
-    if any(k in user_input for k in ["금융", "이자", "대출", "대환"]):
-        return f"💰 **금융 분석**: 연간 **{context['finance_saving']:,}원**의 이자 절감이 가능합니다. 대환 상담을 잡아드릴까요?"
-    if any(k in user_input for k in ["세금", "세무", "취득", "양도"]):
-        return f"⚖️ **세무 분석**: 예상 취득세는 **{context['tax_est']:,}원** ({context['tax_rate']}%)입니다."
-    if any(k in user_input for k in ["개발", "건축", "수익"]):
-        return f"🏗️ **개발 분석**: 신축 분양 시 예상 수익은 **{context['dev_profit']:,}원** (ROI {context['dev_roi']}%)입니다."
-    if any(k in user_input for k in ["권리", "신탁", "압류", "위험"]):
-        return f"🚨 **권리 경고**: 현재 **{context['restrictions']}**가 설정되어 있어 주의가 필요합니다."
-
-    return "죄송합니다. '안내해줘'라고 입력하시면 메뉴를 보여드립니다."
+    # 의도/키워드/답변은 data/intents.json 에서 관리 (수정 시 서버 재시작 없이 반영)
+    intent, answer = REGISTRY.bot("universe").respond(user_input.lower(), context)
+    return answer
 
 # --------------------------------------------------------------------------------
 # [UI] Dashboard
@@ -100,6 +81,9 @@ with st.sidebar:
         # 채팅 기록 리셋 (새 주소 분석 시)
         st.session_state.uni_chat = [{"role": "assistant", "content": f"안녕하세요! **'{addr_input}'** 전담 AI입니다. 무엇을 도와드릴까요?"}]
 
+    with st.expander("🧭 의도 판별 현황 (fallback 비율)"):
+        st.json(REGISTRY.report())
+
 # 초기값 설정
 if 'current_addr' not in st.session_state:
     st.session_state['current_addr'] = "김포시 통진읍 도사리 163-1"
@@ -47,8 +47,9 @@ if "streamlit" not in sys.modules:
 
 import streamlit as st
 import google.generativeai as genai
-from fpdf import FPDF
 from dotenv import load_dotenv
+from agents.intent_registry import REGISTRY
+from agents.pdf_fonts import FONTS, FPDF  # fpdf 1.7 은 글자 서브셋 캐시 사용
 
 load_dotenv()
 api_key = os.getenv("GOOGLE_API_KEY")
@@ -57,26 +58,23 @@ if api_key: genai.configure(api_key=api_key)
 # --------------------------------------------------------------------------------
 # [Engine 1] 한글 PDF 생성기 (Upgrade: fpdf2)
 # --------------------------------------------------------------------------------
+# 한글 폰트는 프로세스당 1회만 등록하고, 문서마다 참조로 연결 (header 는 set_font 만)
+FONTS.register('NanumGothic', 'NanumGothic.ttf')
+
 class PDF(FPDF):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.font_name = FONTS.attach(self, 'NanumGothic', fallback='Helvetica')
+
     def header(self):
-        font_path = 'NanumGothic.ttf'
-        if os.path.exists(font_path):
-            # fpdf2 방식: uni=True 불필요
-            self.add_font('NanumGothic', '', font_path)
-            self.set_font('NanumGothic', '', 10)
-        else:
-            self.set_font('Helvetica', '', 10)
+        self.set_font(self.font_name, '', 10)
         self.cell(0, 10, 'Jisang AI Universe Report', new_x="LMARGIN", new_y="NEXT", align='R')
         self.ln(5)
 
 def generate_korean_pdf(address, context):
     pdf = PDF()
     pdf.add_page()
-    
-    font_path = 'NanumGothic.ttf'
-    font_name = 'NanumGothic' if os.path.exists(font_path) else 'Helvetica'
-    if font_name == 'NanumGothic':
-        pdf.add_font(font_name, '', font_path)
+    font_name = pdf.font_name
     
     # 1. 타이틀
     pdf.set_font(font_name, '', 20)
@@ -139,16 +137,9 @@ class DomainExpert:
 # [Chatbot] 응답 로직
 # --------------------------------------------------------------------------------
 def get_universe_response(user_input, context):
-    user_input = user_input.lower()
-    if any(k in user_input for k in ["안내", "도와줘", "메뉴"]):
-        return "👋 **환영합니다.**\n\n1. **금융**: 이자 절감\n2. **세무**: 취득세 계산\n3. **개발**: 수익률 분석\n4. **권리**: 리스크 진단"
-    if any(k in user_input for k in ["금융", "이자", "대출"]):
-        return f"💰 **금융 분석**: 연간 **{context['finance_saving']:,}원** 절감이 가능합니다."
-    if any(k in user_input for k in ["세금", "취득", "양도"]):
-        return f"⚖️ **세무 분석**: 예상 취득세는 **{context['tax_est']:,}원**입니다."
-    if any(k in user_input for k in ["개발", "수익"]):
-        return f"🏗️ **개발 분석**: 예상 수익은 **{context['dev_profit']:,}원** (ROI {context['dev_roi']}%)입니다."
-    return "죄송합니다. '안내해줘'라고 입력해 보세요."
+    # 의도/키워드/답변은 data/intents.json 에서 관리 (수정 시 서버 재시작 없이 반영)
+    intent, answer = REGISTRY.bot("universe").respond(user_input.lower(), context)
+    return answer
 
 # --------------------------------------------------------------------------------
 # [UI] Dashboard
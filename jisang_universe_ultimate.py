@@ -44,108 +44,31 @@ if "streamlit" not in sys.modules:
 import streamlit as st
 import google.generativeai as genai
 from dotenv import load_dotenv
+from agents.intent_registry import REGISTRY
+from agents.pdf_fonts import FONTS
 
-# ★ ReportLab 라이브러리 (안정성 최강)
-from reportlab.pdfgen import canvas
-from reportlab.pdfbase import pdfmetrics
-from reportlab.pdfbase.ttfonts import TTFont
-from reportlab.lib.pagesizes import A4
-from reportlab.lib.units import mm
-import io
+# ★ ReportLab 보고서 템플릿 (골격은 미리 그려 재사용, 물건별 값만 덧그림)
+from agents.report_template import UNIVERSE_REPORT
+from agents.portfolio_pdf import write_portfolio_pdf
+from agents.lazy_download import lazy_download_button
+from agents.artifact_store import ARTIFACTS
 
 load_dotenv()
 api_key = os.getenv("GOOGLE_API_KEY")
 if api_key: genai.configure(api_key=api_key)
 
+FONTS.register('NanumGothic', 'NanumGothic.ttf')
+
 # --------------------------------------------------------------------------------
 # [Engine 1] 리포트랩 PDF 생성기 (Perfect Korean PDF)
 # --------------------------------------------------------------------------------
-def generate_perfect_pdf(address, context):
-    # 메모리 버퍼 생성
-    buffer = io.BytesIO()
-    
-    # 캔버스 생성 (A4 사이즈)
-    c = canvas.Canvas(buffer, pagesize=A4)
-    width, height = A4
-    
-    # 폰트 등록 (한글 깨짐 원천 봉쇄)
-    font_path = "NanumGothic.ttf"
-    if os.path.exists(font_path):
-        pdfmetrics.registerFont(TTFont('NanumGothic', font_path))
-        font_name = 'NanumGothic'
-    else:
-        font_name = 'Helvetica' # 폰트 없을 시 영문이라도 출력
-        
-    # --- [페이지 디자인 시작] ---
-    
-    # 1. 헤더 (우측 상단)
-    c.setFont(font_name, 10)
-    c.drawRightString(width - 20*mm, height - 20*mm, "Jisang AI Universe Report")
-    c.line(20*mm, height - 22*mm, width - 20*mm, height - 22*mm)
-    
-    # 2. 타이틀 (중앙)
-    c.setFont(font_name, 22)
-    c.drawCentredString(width / 2, height - 50*mm, "부동산 5대 영역 종합 분석 보고서")
-    
-    # 3. 기본 정보 박스
-    c.setFillColorRGB(0.95, 0.95, 0.95) # 연회색 배경
-    c.rect(20*mm, height - 90*mm, width - 40*mm, 30*mm, fill=1, stroke=0)
-    c.setFillColorRGB(0, 0, 0) # 글자색 검정 복구
-    
-    c.setFont(font_name, 12)
-    c.drawString(25*mm, height - 70*mm, f"분석 대상: {address}")
-    c.drawString(25*mm, height - 80*mm, f"발행 일자: {datetime.now().strftime('%Y년 %m월 %d일')}")
-    c.drawString(120*mm, height - 80*mm, "분석 기관: 지상 AI 파트너스")
-    
-    # 4. 핵심 분석 결과 (Body)
-    y_pos = height - 110*mm
-    c.setFont(font_name, 16)
-    c.drawString(20*mm, y_pos, "1. 핵심 금융 및 세무 분석 (Fact Check)")
-    y_pos -= 10*mm
-    
-    c.setFont(font_name, 11)
-    line_height = 8*mm
-    
-    facts = [
-        f"• [금융] 연간 이자 절감 예상액: {context['finance_saving']:,} 원",
-        f"• [세무] 예상 취득세 (공장): {context['tax_est']:,} 원 ({context['tax_rate']}%)",
-        f"• [개발] 신축 분양 예상 수익: {context['dev_profit']:,} 원 (ROI {context['dev_roi']}%)",
-        f"• [위험] 발견된 권리 리스크: {context['restrictions']}"
-    ]
-    
-    for fact in facts:
-        c.drawString(25*mm, y_pos, fact)
-        y_pos -= line_height
-        
-    y_pos -= 10*mm
-    
-    # 5. AI 솔루션 (Box)
-    c.setFont(font_name, 16)
-    c.drawString(20*mm, y_pos, "2. AI 심층 솔루션 제언")
-    y_pos -= 8*mm
-    
-    advice_text = [
-        "현재 해당 물건은 '신탁등기' 및 '압류' 리스크로 인해 일반적인 담보대출이 불가능합니다.",
-        "지상 AI의 알고리즘은 [대부업 상환]과 [신탁 말소]를 동시에 진행하는",
-        "'통합 대환 솔루션'을 최적의 해결책으로 제시합니다.",
-        "이를 통해 연간 수천만 원의 금융 비용을 절감하고 자산 가치를 회복할 수 있습니다."
-    ]
-    
-    c.setFont(font_name, 11)
-    for line in advice_text:
-        c.drawString(25*mm, y_pos, line)
-        y_pos -= line_height
+REPORT_VERSION = 1  # 보고서 양식을 바꾸면 올려서 저장소의 기존 PDF 를 무효화
 
-    # 6. 푸터 (Disclaimer)
-    c.setFont(font_name, 9)
-    c.setFillColorRGB(0.5, 0.5, 0.5)
-    c.drawCentredString(width / 2, 20*mm, "[면책 조항] 본 보고서는 시뮬레이션 결과이며 법적 효력이 없습니다.")
-    
-    # 저장 및 반환
-    c.showPage()
-    c.save()
-    buffer.seek(0)
-    return buffer
+def generate_perfect_pdf(address, context):
+    # 헤더/타이틀/제언/면책 문구 등 고정 골격은 템플릿(Form XObject)으로 1번만 그리고,
+    # 분석 대상/발행 일자/핵심 수치만 덧그림 (한글 폰트 없으면 Helvetica 로 출력)
+    fields = dict(context, address=address, issued=datetime.now().strftime('%Y년 %m월 %d일'))
+    return UNIVERSE_REPORT.render(fields)
 
 # --------------------------------------------------------------------------------
 # [Engine 2] 도메인 계산기
@@ -172,16 +95,9 @@ class DomainExpert:
 # [Chatbot] 응답 로직
 # --------------------------------------------------------------------------------
 def get_universe_response(user_input, context):
-    user_input = user_input.lower()
-    if any(k in user_input for k in ["안내", "도와줘", "메뉴"]):
-        return "👋 **환영합니다.**\n\n1. **금융**: 이자 절감\n2. **세무**: 취득세 계산\n3. **개발**: 수익률 분석\n4. **권리**: 리스크 진단"
-    if any(k in user_input for k in ["금융", "이자", "대출"]):
-        return f"💰 **금융 분석**: 연간 **{context['finance_saving']:,}원** 절감이 가능합니다."
-    if any(k in user_input for k in ["세금", "취득", "양도"]):
-        return f"⚖️ **세무 분석**: 예상 취득세는 **{context['tax_est']:,}원**입니다."
-    if any(k in user_input for k in ["개발", "수익"]):
-        return f"🏗️ **개발 분석**: 예상 수익은 **{context['dev_profit']:,}원** (ROI {context['dev_roi']}%)입니다."
-    return "죄송합니다. '안내해줘'라고 입력해 보세요."
+    # 의도/키워드/답변은 data/intents.json 에서 관리 (수정 시 서버 재시작 없이 반영)
+    intent, answer = REGISTRY.bot("universe").respond(user_input.lower(), context)
+    return answer
 
 # --------------------------------------------------------------------------------
 # [UI] Dashboard
@@ -202,12 +118,23 @@ with st.sidebar:
 if 'current_addr' not in st.session_state:
     st.session_state['current_addr'] = "김포시 통진읍 도사리 163-1"
 
-# Data Setup
-price, debt = 850000000, 600000000
-saving = DomainExpert.calc_finance(debt)
-tax, tax_rate = DomainExpert.calc_tax(price)
-profit, roi = DomainExpert.calc_development(price, 363)
-context = {"finance_saving": saving, "tax_est": tax, "tax_rate": tax_rate, "dev_profit": profit, "dev_roi": roi, "restrictions": "신탁등기, 압류"}
+def analyze_property(price, debt, size, restrictions):
+    """물건 1건의 도메인 분석 결과 (대시보드 / 챗봇 / 보고서 공용 context)"""
+    tax, tax_rate = DomainExpert.calc_tax(price)
+    profit, roi = DomainExpert.calc_development(price, size)
+    return {"finance_saving": DomainExpert.calc_finance(debt), "tax_est": tax, "tax_rate": tax_rate,
+            "dev_profit": profit, "dev_roi": roi, "restrictions": restrictions}
+
+# Data Setup - B2B 포트폴리오 (첫 행은 현재 분석 대상)
+PORTFOLIO = [
+    {"주소": st.session_state['current_addr'], "price": 850000000, "debt": 600000000, "size": 363,
+     "restrictions": "신탁등기, 압류", "추천전략": "대환/말소"},
+    {"주소": "서울시 강남구", "price": 2500000000, "debt": 900000000, "size": 800,
+     "restrictions": "근저당", "추천전략": "추가대출"},
+]
+portfolio_facts = {p["주소"]: analyze_property(p["price"], p["debt"], p["size"], p["restrictions"]) for p in PORTFOLIO}
+context = portfolio_facts[st.session_state['current_addr']]
+saving, tax, profit = context["finance_saving"], context["tax_est"], context["dev_profit"]
 
 # Main Layout
 st.title(f"🏢 {st.session_state['current_addr']} 종합 분석")
@@ -231,15 +158,16 @@ with tab1:
     st.markdown("---")
     st.subheader("📑 보고서 다운로드")
     
-    # PDF 생성 (ReportLab)
+    # PDF 생성 (ReportLab) - 화면을 그릴 때는 만들지 않고, 요청 시 생성 (같은 입력이면 저장소에서 바로 제공)
     try:
-        pdf_file = generate_perfect_pdf(st.session_state['current_addr'], context)
+        report_inputs = {"address": st.session_state['current_addr'], "context": context,
+                         "date": datetime.now().strftime('%Y-%m-%d')}
         
         col_d1, col_d2 = st.columns([1, 3])
         with col_d1:
-            st.download_button(
-                label="📄 한글 정밀 보고서 (.pdf)",
-                data=pdf_file,
+            lazy_download_button(
+                "📄 한글 정밀 보고서 (.pdf)", "universe_report_pdf", REPORT_VERSION, report_inputs,
+                lambda: generate_perfect_pdf(st.session_state['current_addr'], context).getvalue(),
                 file_name="Jisang_Universe_Report.pdf",
                 mime="application/pdf",
                 type="primary"
@@ -270,7 +198,26 @@ with tab2:
 
 with tab3:
     st.subheader("💼 포트폴리오 관리 (B2B)")
-    data = {"주소": [st.session_state['current_addr'], "서울시 강남구"], "평가액": ["8.5억", "25억"], "추천전략": ["대환/말소", "추가대출"]}
+    data = {"주소": [p["주소"] for p in PORTFOLIO], "평가액": [f"{p['price'] / 100000000:g}억" for p in PORTFOLIO],
+            "추천전략": [p["추천전략"] for p in PORTFOLIO]}
     df = pd.DataFrame(data)
     st.dataframe(df, use_container_width=True)
-    st.download_button("📥 엑셀 다운로드 (.csv)", df.to_csv().encode('utf-8'), "portfolio.csv")
\ No newline at end of file
+    lazy_download_button("📥 엑셀 다운로드 (.csv)", "portfolio_csv", 1, df.to_dict('list'),
+                         lambda: df.to_csv().encode('utf-8'), "portfolio.csv")
+
+    # 포트폴리오 통합 PDF: 물건마다 1페이지씩 한 문서에 이어 붙이며 페이지 단위로 파일에 바로 기록 (메모리 일정)
+    # 물건마다 자기 팩트로 1페이지 (다른 물건의 수치를 찍지 않음)
+    rows = [(address, portfolio_facts[address]) for address in df["주소"]]
+    # 보고서 저장소에 입력 해시로 보관 (화면 갱신 시 재생성하지 않고, 오래된 파일은 용량 한도로 정리)
+    pdf_args = ("universe_portfolio_pdf", REPORT_VERSION, {"rows": rows, "date": datetime.now().strftime('%Y-%m-%d')})
+    pdf_path = ARTIFACTS.find(*pdf_args, ext="pdf")
+    if pdf_path is None and rows and st.button(f"📚 포트폴리오 통합 PDF 생성 ({len(rows)}건)"):
+        bar = st.progress(0.0, text="PDF 생성 준비 중...")
+        result = {}
+        pdf_path = ARTIFACTS.fetch_path(*pdf_args, lambda path: result.update(write_portfolio_pdf(
+            rows, path, progress=lambda done: bar.progress(done / len(rows), text=f"PDF 생성 중... {done}/{len(rows)}"),
+        )), ext="pdf")
+        bar.progress(1.0, text=f"✅ {result['pages']}페이지 완료 ({result['seconds']}초)")
+    if pdf_path is not None:
+        with open(pdf_path, "rb") as f:
+            st.download_button("📥 포트폴리오 통합 PDF 다운로드", f, "Jisang_Portfolio_Report.pdf", "application/pdf")
@@ -2,18 +2,12 @@ import os
 import sys
 import subprocess
 import urllib.request
-import glob
 import pandas as pd
 from datetime import datetime
 
 # [Step 0] 스마트 런처 & 강력한 자가 치유(Self-Healing)
 def setup_environment():
-    # 1. 윈도우 한글 깨짐의 주범 (.pkl 캐시) 무조건 삭제
-    for pkl_file in glob.glob("*.pkl"):
-        try:
-            os.remove(pkl_file)
-        except:
-            pass
+    # 1. 폰트 메트릭 캐시는 agents/pdf_fonts 가 TTF 해시 + 라이브러리 버전별로 관리 (.pkl 삭제 불필요)
 
     # 2. 필수 라이브러리 설치 (버전 충돌 무시하고 실행 가능한 환경 조성)
     required = {"streamlit": "streamlit", "plotly": "plotly", "google-generativeai": "google.generativeai", "python-dotenv": "dotenv", "fpdf": "fpdf"}
@@ -44,8 +38,11 @@ if "streamlit" not in sys.modules:
 
 import streamlit as st
 import google.generativeai as genai
-from fpdf import FPDF
 from dotenv import load_dotenv
+from agents.intent_registry import REGISTRY
+from agents.pdf_fonts import FONTS
+from agents.korean_pdf import generate_korean_pdf
+from agents.lazy_download import lazy_download_button
 
 load_dotenv()
 api_key = os.getenv("GOOGLE_API_KEY")
@@ -54,89 +51,10 @@ if api_key: genai.configure(api_key=api_key)
 # --------------------------------------------------------------------------------
 # [Engine 1] 유니버설 PDF 생성기 (Universal Compatibility Mode)
 # --------------------------------------------------------------------------------
-class PDF(FPDF):
-    def header(self):
-        font_path = os.path.abspath('NanumGothic.ttf')
-        # 폰트 로딩 시도 (실패 시 기본 폰트로 안전하게 회귀)
-        if os.path.exists(font_path):
-            try:
-                self.add_font('NanumGothic', '', font_path, uni=True)
-                self.set_font('NanumGothic', '', 10)
-            except:
-                try:
-                    self.add_font('NanumGothic', '', font_path) # uni 옵션 없이 재시도
-                    self.set_font('NanumGothic', '', 10)
-                except:
-                    self.set_font('Arial', '', 10)
-        else:
-            self.set_font('Arial', '', 10)
-        
-        # [Fix] new_x, new_y 대신 ln=0 (줄바꿈 없음), align='R' 사용
-        self.cell(0, 10, 'Jisang AI Universe Report', ln=1, align='R')
-        self.ln(5)
-
-def generate_korean_pdf(address, context):
-    # 생성 직전 캐시 삭제 (안전장치)
-    for pkl_file in glob.glob("*.pkl"):
-        try: os.remove(pkl_file)
-        except: pass
-
-    pdf = PDF()
-    pdf.add_page()
-    
-    font_path = os.path.abspath('NanumGothic.ttf')
-    font_name = 'NanumGothic' if os.path.exists(font_path) else 'Arial'
-    
-    # 폰트 추가 시도
-    try:
-        pdf.add_font(font_name, '', font_path, uni=True)
-    except:
-        try: pdf.add_font(font_name, '', font_path) # 구버전 호환
-        except: font_name = 'Arial'
+# 한글 폰트는 프로세스당 1회만 등록하고, 문서마다 참조로 연결 (생성기는 agents/korean_pdf)
+FONTS.register('NanumGothic', 'NanumGothic.ttf')
 
-    # 1. 타이틀
-    pdf.set_font(font_name, '', 20)
-    # [Fix] ln=1 (다음 줄로 이동), align='C' (가운데 정렬)
-    pdf.cell(0, 15, "부동산 5대 영역 종합 분석 보고서", ln=1, align='C')
-    pdf.ln(10)
-    
-    # 2. 개요
-    pdf.set_font(font_name, '', 12)
-    pdf.cell(0, 10, f"분석 대상: {address}", ln=1)
-    pdf.cell(0, 10, f"발행 일자: {datetime.now().strftime('%Y-%m-%d')}", ln=1)
-    pdf.ln(5)
-    
-    # 3. 상세 분석
-    pdf.set_fill_color(240, 240, 240)
-    pdf.set_font(font_name, '', 14)
-    # [Fix] fill=True는 구버전에서도 지원
-    pdf.cell(0, 10, "1. 핵심 분석 요약", ln=1, align='L', fill=True)
-    pdf.ln(5)
-    
-    pdf.set_font(font_name, '', 11)
-    lines = [
-        f"💰 [금융] 연간 이자 절감액: {context['finance_saving']:,} 원",
-        f"⚖️ [세무] 예상 취득세: {context['tax_est']:,} 원 ({context['tax_rate']}%)",
-        f"🏗️ [개발] 예상 분양 수익: {context['dev_profit']:,} 원 (ROI {context['dev_roi']}%)",
-        f"🚨 [리스크] 발견된 권리하자: {context['restrictions']}"
-    ]
-    for line in lines:
-        try:
-            pdf.cell(0, 8, line, ln=1)
-        except:
-            # 인코딩 에러 발생 시 대체 텍스트 출력
-            pdf.cell(0, 8, "Text Encoding Error", ln=1)
-        
-    pdf.ln(10)
-    pdf.set_font(font_name, '', 14)
-    pdf.cell(0, 10, "2. AI 솔루션 제언", ln=1, align='L', fill=True)
-    pdf.ln(5)
-    pdf.set_font(font_name, '', 11)
-    
-    advice = f"현재 해당 물건은 {context['restrictions']} 등의 권리 리스크가 존재하여 일반적인 매매나 대출 실행이 어렵습니다. 지상 AI 파트너스를 통해 '신탁 말소'와 '대환'을 동시에 진행하는 통합 솔루션을 권장합니다."
-    pdf.multi_cell(0, 7, advice)
-    
-    return pdf.output(dest='S').encode('latin-1')
+REPORT_VERSION = 1  # 보고서 양식을 바꾸면 올려서 저장소의 기존 PDF 를 무효화
 
 # --------------------------------------------------------------------------------
 # [Engine 2] 도메인 계산기
@@ -163,16 +81,9 @@ class DomainExpert:
 # [Chatbot] 응답 로직
 # --------------------------------------------------------------------------------
 def get_universe_response(user_input, context):
-    user_input = user_input.lower()
-    if any(k in user_input for k in ["안내", "도와줘", "메뉴"]):
-        return "👋 **환영합니다.**\n\n1. **금융**: 이자 절감\n2. **세무**: 취득세 계산\n3. **개발**: 수익률 분석\n4. **권리**: 리스크 진단"
-    if any(k in user_input for k in ["금융", "이자", "대출"]):
-        return f"💰 **금융 분석**: 연간 **{context['finance_saving']:,}원** 절감이 가능합니다."
-    if any(k in user_input for k in ["세금", "취득", "양도"]):
-        return f"⚖️ **세무 분석**: 예상 취득세는 **{context['tax_est']:,}원**입니다."
-    if any(k in user_input for k in ["개발", "수익"]):
-        return f"🏗️ **개발 분석**: 예상 수익은 **{context['dev_profit']:,}원** (ROI {context['dev_roi']}%)입니다."
-    return "죄송합니다. '안내해줘'라고 입력해 보세요."
+    # 의도/키워드/답변은 data/intents.json 에서 관리 (수정 시 서버 재시작 없이 반영)
+    intent, answer = REGISTRY.bot("universe").respond(user_input.lower(), context)
+    return answer
 
 # --------------------------------------------------------------------------------
 # [UI] Dashboard
@@ -224,13 +135,15 @@ with tab1:
     
     # PDF 생성 호출
     try:
-        pdf_bytes = generate_korean_pdf(st.session_state['current_addr'], context)
+        # 화면을 그릴 때는 만들지 않고 요청 시 생성, 주소/팩트/발행일이 같으면 저장소에서 바로 제공
+        report_inputs = {"address": st.session_state['current_addr'], "context": context,
+                         "date": datetime.now().strftime('%Y-%m-%d')}
         
         col_d1, col_d2 = st.columns([1, 3])
         with col_d1:
-            st.download_button(
-                label="📄 한글 정밀 보고서 (.pdf)",
-                data=pdf_bytes,
+            lazy_download_button(
+                "📄 한글 정밀 보고서 (.pdf)", "universe_pdf", REPORT_VERSION, report_inputs,
+                lambda: generate_korean_pdf(st.session_state['current_addr'], context),
                 file_name="Jisang_Report.pdf",
                 mime="application/pdf",
                 type="primary"
@@ -265,4 +178,5 @@ with tab3:
     data = {"주소": [st.session_state['current_addr'], "서울시 강남구"], "평가액": ["8.5억", "25억"], "추천전략": ["대환/말소", "추가대출"]}
     df = pd.DataFrame(data)
     st.dataframe(df, use_container_width=True)
-    st.download_button("📥 엑셀 다운로드 (.csv)", df.to_csv().encode('utf-8'), "portfolio.csv")
\ No newline at end of file
+    lazy_download_button("📥 엑셀 다운로드 (.csv)", "portfolio_csv", 1, df.to_dict('list'),
+                         lambda: df.to_csv().encode('utf-8'), "portfolio.csv")
\ No newline at end of file
@@ -2,21 +2,12 @@ import os
 import sys
 import subprocess
 import urllib.request
-import glob
 import pandas as pd
 from datetime import datetime
 
 # [Step 0] 스마트 런처 & 강력한 자가 치유(Self-Healing)
 def setup_environment():
-    # 1. 문제의 근원인 .pkl (폰트 캐시) 파일 무조건 삭제
-    # 윈도우가 이 파일을 cp949로 읽으려다 에러가 납니다.
-    print("🧹 [시스템] 폰트 캐시 초기화 중...")
-    for pkl_file in glob.glob("*.pkl"):
-        try:
-            os.remove(pkl_file)
-            print(f"   - 삭제 완료: {pkl_file}")
-        except:
-            pass
+    # 1. 폰트 메트릭 캐시는 agents/pdf_fonts 가 TTF 해시 + 라이브러리 버전별로 관리 (.pkl 삭제 불필요)
 
     # 2. 필수 라이브러리 설치
     required = {"streamlit": "streamlit", "plotly": "plotly", "google-generativeai": "google.generativeai", "python-dotenv": "dotenv", "fpdf": "fpdf"}
@@ -58,8 +49,9 @@ if "streamlit" not in sys.modules:
 
 import streamlit as st
 import google.generativeai as genai
-from fpdf import FPDF
 from dotenv import load_dotenv
+from agents.intent_registry import REGISTRY
+from agents.pdf_fonts import FONTS, FPDF  # fpdf 1.7 은 글자 서브셋 캐시 사용
 
 load_dotenv()
 api_key = os.getenv("GOOGLE_API_KEY")
@@ -68,37 +60,24 @@ if api_key: genai.configure(api_key=api_key)
 # --------------------------------------------------------------------------------
 # [Engine 1] 한글 PDF 생성기 (Safe Mode)
 # --------------------------------------------------------------------------------
+# 한글 폰트는 프로세스당 1회만 등록하고, 문서마다 참조로 연결 (header 는 set_font 만)
+FONTS.register('NanumGothic', 'NanumGothic.ttf')
+
 class PDF(FPDF):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.font_name = FONTS.attach(self, 'NanumGothic', fallback='Helvetica')
+
     def header(self):
-        # 폰트 절대 경로 사용 (Windows 에러 방지)
-        font_path = os.path.abspath('NanumGothic.ttf')
-        if os.path.exists(font_path):
-            try:
-                self.add_font('NanumGothic', '', font_path)
-                self.set_font('NanumGothic', '', 10)
-            except:
-                self.set_font('Helvetica', '', 10)
-        else:
-            self.set_font('Helvetica', '', 10)
+        self.set_font(self.font_name, '', 10)
         
         self.cell(0, 10, 'Jisang AI Universe Report', new_x="LMARGIN", new_y="NEXT", align='R')
         self.ln(5)
 
 def generate_korean_pdf(address, context):
-    # 생성 직전 캐시 삭제 (이중 안전장치)
-    for pkl_file in glob.glob("*.pkl"):
-        try: os.remove(pkl_file)
-        except: pass
-
     pdf = PDF()
     pdf.add_page()
-    
-    font_path = os.path.abspath('NanumGothic.ttf')
-    if os.path.exists(font_path):
-        pdf.add_font('NanumGothic', '', font_path)
-        font_name = 'NanumGothic'
-    else:
-        font_name = 'Helvetica'
+    font_name = pdf.font_name
     
     # 타이틀
     pdf.set_font(font_name, '', 20)
@@ -167,16 +146,9 @@ class DomainExpert:
 # [Chatbot] 응답 로직
 # --------------------------------------------------------------------------------
 def get_universe_response(user_input, context):
-    user_input = user_input.lower()
-    if any(k in user_input for k in ["안내", "도와줘", "메뉴"]):
-        return "👋 **환영합니다.**\n\n1. **금융**: 이자 절감\n2. **세무**: 취득세 계산\n3. **개발**: 수익률 분석\n4. **권리**: 리스크 진단"
-    if any(k in user_input for k in ["금융", "이자", "대출"]):
-        return f"💰 **금융 분석**: 연간 **{context['finance_saving']:,}원** 절감이 가능합니다."
-    if any(k in user_input for k in ["세금", "취득", "양도"]):
-        return f"⚖️ **세무 분석**: 예상 취득세는 **{context['tax_est']:,}원**입니다."
-    if any(k in user_input for k in ["개발", "수익"]):
-        return f"🏗️ **개발 분석**: 예상 수익은 **{context['dev_profit']:,}원** (ROI {context['dev_roi']}%)입니다."
-    return "죄송합니다. '안내해줘'라고 입력해 보세요."
+    # 의도/키워드/답변은 data/intents.json 에서 관리 (수정 시 서버 재시작 없이 반영)
+    intent, answer = REGISTRY.bot("universe").respond(user_input.lower(), context)
+    return answer
 
 # --------------------------------------------------------------------------------
 # [UI] Dashboard
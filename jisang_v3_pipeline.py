@@ -1,6 +1,5 @@
 import os
 import sys
-import time
 import asyncio
 import subprocess
 from datetime import datetime
@@ -60,7 +59,7 @@ class OpalAgent:
         self.mode = mode
         print("💎 [Opal] 데이터 마이닝 에이전트 가동")
 
-    def fetch_real_data(self, address):
+    async def fetch_real_data(self, address):
         print(f"\n🌐 [Opal] 타겟 접속: '{address}'")
         
         # 시뮬레이션: 실제 크롤링인 것처럼 딜레이 연출
@@ -72,7 +71,7 @@ class OpalAgent:
         ]
         
         for step in steps:
-            time.sleep(random.uniform(0.3, 0.7))
+            await asyncio.sleep(random.uniform(0.3, 0.7))
             print(f"   >> {step}")
 
         print("   ✅ [Opal] 데이터 추출 완료.")
@@ -126,7 +125,7 @@ class InsightEngine:
         model_name = get_best_model()
         self.model = genai.GenerativeModel(model_name)
 
-    def analyze(self, opal_data, fact_data):
+    async def analyze(self, opal_data, fact_data):
         prompt = f"""
         역할: 대한민국 부동산 권리분석 전문가 AI.
         
@@ -146,7 +145,8 @@ class InsightEngine:
         
         print("\n🧠 [Brain] 최종 추론 중... ", end="")
         try:
-            response = self.model.generate_content(prompt)
+            # 비동기 API 사용 - 응답 대기 중에도 다른 물건 분석 진행 가능
+            response = await self.model.generate_content_async(prompt)
             print("완료!")
             return response.text
         except Exception as e:
@@ -164,15 +164,15 @@ async def main():
     
     # 1. 수집
     opal = OpalAgent()
-    raw_data = opal.fetch_real_data(target_address)
+    raw_data = await opal.fetch_real_data(target_address)
 
     # 2. 검증
     fact = FactChecker()
     verified_data = fact.process(raw_data)
 
     # 3. 추론
-    brain = InsightEngine()
-    final_report = brain.analyze(raw_data, verified_data)
+    brain = await asyncio.to_thread(InsightEngine)  # 모델 목록 조회(동기 API)는 별도 스레드에서
+    final_report = await brain.analyze(raw_data, verified_data)
 
     # 4. 결과 출력
     print("\n" + "="*70)
@@ -35,13 +35,14 @@ async def run():
     
     brain = JisangBrain()
     start = time.time()
-    result = brain.analyze("김포시 석모리 123-4", MOCK_REGISTRY, MOCK_MARKET)
+    result = await brain.aanalyze("김포시 석모리 123-4", MOCK_REGISTRY, MOCK_MARKET)
     end = time.time()
     
     print(f"\n✅ 분석 완료 ({end-start:.2f}초)")
     print("-" * 60)
     print(result)
     print("-" * 60)
+    print(f"🔀 [Router] 경로별 지연/비용: {brain.router.report()}")
 
 if __name__ == "__main__":
     asyncio.run(run())